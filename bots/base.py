@@ -3,9 +3,12 @@
 import asyncio
 import io
 import logging
+import os
 import subprocess
 import tempfile
 
+from src.core.artifacts import Artifact
+
 from telegram import Update
 from telegram.ext import ContextTypes
 
@@ -33,36 +36,42 @@ def _compress_video(video_bytes: bytes, target_mb: int = 48) -> bytes:
         src_path = src.name
     dst_path = src_path.replace(".mp4", "_compressed.mp4")
 
-    src_mb = len(video_bytes) / (1024 * 1024)
-    # Pick CRF proportional to how far over the limit we are
-    crf = min(40, max(28, int(23 + (src_mb / target_mb) * 5)))
-    logger.info(
-        "Compressing video: %.1f MB -> target %d MB (crf=%d)", src_mb, target_mb, crf
-    )
-
     try:
-        subprocess.run(
-            [
-                "ffmpeg", "-y", "-i", src_path,
-                "-c:v", "libx264", "-crf", str(crf), "-preset", "fast",
-                "-c:a", "aac", "-b:a", "128k",
-                "-movflags", "+faststart",
-                dst_path,
-            ],
-            capture_output=True,
-            check=True,
-        )
+        _compress_video_file(src_path, dst_path, target_mb)
         with open(dst_path, "rb") as f:
-            compressed = f.read()
-        logger.info("Compressed: %.1f MB -> %.1f MB", src_mb, len(compressed) / (1024 * 1024))
-        return compressed
+            return f.read()
     finally:
-        import os
         os.unlink(src_path)
         if os.path.exists(dst_path):
             os.unlink(dst_path)
 
 
+def _compress_video_file(src_path: str, dst_path: str, target_mb: int = 48) -> None:
+    """Re-encode *src_path* into *dst_path* with ffmpeg to fit under *target_mb*."""
+    src_mb = os.path.getsize(src_path) / (1024 * 1024)
+    # Pick CRF proportional to how far over the limit we are
+    crf = min(40, max(28, int(23 + (src_mb / target_mb) * 5)))
+    logger.info(
+        "Compressing video: %.1f MB -> target %d MB (crf=%d)", src_mb, target_mb, crf
+    )
+    subprocess.run(
+        [
+            "ffmpeg", "-y", "-i", src_path,
+            "-c:v", "libx264", "-crf", str(crf), "-preset", "fast",
+            "-c:a", "aac", "-b:a", "128k",
+            "-movflags", "+faststart",
+            dst_path,
+        ],
+        capture_output=True,
+        check=True,
+    )
+    logger.info(
+        "Compressed: %.1f MB -> %.1f MB",
+        src_mb,
+        os.path.getsize(dst_path) / (1024 * 1024),
+    )
+
+
 async def send_video_bytes(
     message,
     video_bytes: bytes,
@@ -81,6 +90,48 @@ async def send_video_bytes(
     )
 
 
+async def send_video_artifact(
+    message,
+    video: Artifact,
+    caption: str,
+) -> None:
+    """Stream a rendered video from disk as a reply, compressing it if too large."""
+    path = video.path
+    compressed_path = None
+    if video.size > TELEGRAM_VIDEO_LIMIT:
+        compressed_path = path.replace(".mp4", "_compressed.mp4")
+        await asyncio.to_thread(_compress_video_file, path, compressed_path)
+        path = compressed_path
+
+    try:
+        with open(path, "rb") as f:
+            await message.reply_video(
+                video=f,
+                caption=caption,
+                filename="video.mp4",
+                read_timeout=300,
+                write_timeout=300,
+            )
+    finally:
+        if compressed_path and os.path.exists(compressed_path):
+            os.unlink(compressed_path)
+
+
+async def send_audio_artifact(
+    message,
+    audio: Artifact,
+    caption: str,
+) -> None:
+    """Stream narration from disk as a voice message."""
+    with audio.open() as f:
+        await message.reply_voice(
+            voice=f,
+            caption=caption,
+            read_timeout=120,
+            write_timeout=120,
+        )
+
+
 async def send_audio_bytes(
     message,
     audio_bytes: bytes,
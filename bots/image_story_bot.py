@@ -11,11 +11,11 @@ from telegram.ext import (
     filters,
 )
 
-from src.core.container import container
+from src.core.container import close_http_client, container
 from src.core.secrets import secrets
 from src.entities.config import MainConfig
 
-from bots.base import is_user_allowed, reject_unauthorized, send_video_bytes
+from bots.base import is_user_allowed, reject_unauthorized, send_video_artifact
 
 logging.basicConfig(
     format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
@@ -59,11 +59,12 @@ async def handle_url(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
             low_quality=bot_config.low_quality,
         )
 
-        await update.message.reply_text("Uploading Part 1...")
-        await send_video_bytes(update.message, result.part1_video, "Part 1")
+        with result:
+            await update.message.reply_text("Uploading Part 1...")
+            await send_video_artifact(update.message, result.part1_video, "Part 1")
 
-        await update.message.reply_text("Uploading Part 2...")
-        await send_video_bytes(update.message, result.part2_video, "Part 2")
+            await update.message.reply_text("Uploading Part 2...")
+            await send_video_artifact(update.message, result.part2_video, "Part 2")
 
         await update.message.reply_text("Done!")
 
@@ -72,12 +73,16 @@ async def handle_url(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None
         await update.message.reply_text(f"Error: {e}")
 
 
+async def _post_shutdown(application: Application) -> None:
+    await close_http_client()
+
+
 def main() -> None:
     token = secrets.telegram_image_story_bot_token
     if not token:
         raise RuntimeError("TELEGRAM_IMAGE_STORY_BOT_TOKEN env var is not set")
 
-    app = Application.builder().token(token).build()
+    app = Application.builder().token(token).post_shutdown(_post_shutdown).build()
     app.add_handler(CommandHandler("start", start))
     app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_url))
 
@@ -4,6 +4,7 @@ Fluxo: /generate <url> -> scrape -> roteiro (auto) -> áudio -> revisão de imag
 O roteiro é aprovado automaticamente. A partir do áudio o usuário pode aprovar ou pedir mudanças.
 """
 
+import functools
 import logging
 import os
 from pathlib import Path
@@ -16,6 +17,7 @@ from telegram.ext import (
     ContextTypes,
     ConversationHandler,
     MessageHandler,
+    TypeHandler,
     filters,
 )
 
@@ -24,9 +26,10 @@ from bots.base import (
     reject_unauthorized,
     send_audio_bytes,
     send_image_bytes,
-    send_video_bytes,
+    send_video_artifact,
 )
-from src.core.container import container
+from src.core.artifacts import Artifact
+from src.core.container import close_http_client, container
 from src.core.secrets import secrets
 from src.entities.config import MainConfig
 from src.services.reddit_video_service import RedditVideoService
@@ -62,14 +65,56 @@ def _truncate(text: str, limit: int = 4000) -> str:
     return text[: limit - 3] + "..."
 
 
-def _save_video(video_bytes: bytes, name: str) -> Path:
+def _save_video(video: Artifact, name: str) -> Path:
     OUTPUT_DIR.mkdir(exist_ok=True)
     path = OUTPUT_DIR / name
-    path.write_bytes(video_bytes)
-    logger.info("Saved %s (%.1f MB)", path, len(video_bytes) / (1024 * 1024))
+    video.copy_to(str(path))
+    logger.info("Saved %s (%.1f MB)", path, video.size / (1024 * 1024))
     return path
 
 
+def _replace_videos(context, videos) -> None:
+    """Keep only the latest rendered pair on disk for this conversation."""
+    previous = context.user_data.get("videos")
+    if previous is not None:
+        previous.release()
+    context.user_data["videos"] = videos
+
+
+def _end_conversation(context) -> None:
+    """Drop the conversation state and delete its rendered and scratch files."""
+    _replace_videos(context, None)
+    scratch = context.user_data.get("scratch")
+    if scratch is not None:
+        scratch.cleanup()
+    context.user_data.clear()
+
+
+def _with_scratch(fresh: bool = False):
+    """Run a handler with the conversation's scratch space active.
+
+    Clips created in one step are reused by the next ones, so the scratch
+    directory lives until the conversation is approved or cancelled. With
+    *fresh* any leftovers of a previous conversation are removed first.
+    """
+
+    def decorator(handler):
+        @functools.wraps(handler)
+        async def wrapper(update: Update, context: ContextTypes.DEFAULT_TYPE):
+            if fresh:
+                _end_conversation(context)
+            scratch = context.user_data.get("scratch")
+            if scratch is None:
+                scratch = _get_service().new_scratch()
+                context.user_data["scratch"] = scratch
+            with scratch.activate():
+                return await handler(update, context)
+
+        return wrapper
+
+    return decorator
+
+
 # ---------------------------------------------------------------------------
 # /start
 # ---------------------------------------------------------------------------
@@ -90,6 +135,7 @@ async def cmd_start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
 # ---------------------------------------------------------------------------
 
 
+@_with_scratch(fresh=True)
 async def cmd_generate(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     if not is_user_allowed(update.effective_user.id, bot_config.allowed_user_ids):
         await reject_unauthorized(update)
@@ -146,6 +192,7 @@ async def cmd_generate(update: Update, context: ContextTypes.DEFAULT_TYPE) -> in
 # ---------------------------------------------------------------------------
 
 
+@_with_scratch()
 async def on_audio_approve(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     query = update.callback_query
     await query.answer()
@@ -182,6 +229,7 @@ async def on_audio_approve(update: Update, context: ContextTypes.DEFAULT_TYPE) -
         return ConversationHandler.END
 
 
+@_with_scratch()
 async def on_audio_change(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     feedback = update.message.text.lower()
     await update.message.reply_text("Gerando áudio novamente com as mudanças...")
@@ -236,6 +284,7 @@ async def _send_images_preview(message, image_stories) -> None:
             )
 
 
+@_with_scratch()
 async def on_images_approve(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     query = update.callback_query
     await query.answer()
@@ -263,13 +312,13 @@ async def on_images_approve(update: Update, context: ContextTypes.DEFAULT_TYPE)
             cover2,
             low_quality=bot_config.low_quality,
         )
-        context.user_data["videos"] = videos
+        _replace_videos(context, videos)
 
         _save_video(videos.part1_video, "part1.mp4")
         _save_video(videos.part2_video, "part2.mp4")
 
-        await send_video_bytes(query.message, videos.part1_video, "Parte 1")
-        await send_video_bytes(query.message, videos.part2_video, "Parte 2")
+        await send_video_artifact(query.message, videos.part1_video, "Parte 1")
+        await send_video_artifact(query.message, videos.part2_video, "Parte 2")
         await query.message.reply_text(
             "Vídeos gerados. Aprova pra finalizar ou manda uma mensagem pra pedir mudanças.",
             reply_markup=APPROVE_KEYBOARD,
@@ -282,6 +331,7 @@ async def on_images_approve(update: Update, context: ContextTypes.DEFAULT_TYPE)
         return ConversationHandler.END
 
 
+@_with_scratch()
 async def on_images_change(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     await update.message.reply_text(
         "Regenerando imagens... pode demorar alguns minutos."
@@ -317,10 +367,11 @@ async def on_video_approve(update: Update, context: ContextTypes.DEFAULT_TYPE) -
     query = update.callback_query
     await query.answer()
     await query.message.reply_text("Pronto! Manda /generate pra criar outro.")
-    context.user_data.clear()
+    _end_conversation(context)
     return ConversationHandler.END
 
 
+@_with_scratch()
 async def on_video_change(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     await update.message.reply_text(
         "Remontando o vídeo... pode demorar alguns minutos."
@@ -342,13 +393,17 @@ async def on_video_change(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
             cover2,
             low_quality=bot_config.low_quality,
         )
-        context.user_data["videos"] = videos
+        _replace_videos(context, videos)
 
         _save_video(videos.part1_video, "part1.mp4")
         _save_video(videos.part2_video, "part2.mp4")
 
-        await send_video_bytes(update.message, videos.part1_video, "Parte 1 (revisado)")
-        await send_video_bytes(update.message, videos.part2_video, "Parte 2 (revisado)")
+        await send_video_artifact(
+            update.message, videos.part1_video, "Parte 1 (revisado)"
+        )
+        await send_video_artifact(
+            update.message, videos.part2_video, "Parte 2 (revisado)"
+        )
         await update.message.reply_text(
             "Vídeos revisados. Aprova ou pede mais mudanças.",
             reply_markup=APPROVE_KEYBOARD,
@@ -368,21 +423,35 @@ async def on_video_change(update: Update, context: ContextTypes.DEFAULT_TYPE) ->
 
 async def cmd_cancel(update: Update, context: ContextTypes.DEFAULT_TYPE) -> int:
     await update.message.reply_text("Cancelado. Manda /generate pra começar de novo.")
-    context.user_data.clear()
+    _end_conversation(context)
     return ConversationHandler.END
 
 
+async def on_timeout(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
+    """Drop an abandoned conversation's files once it has been idle too long."""
+    _end_conversation(context)
+    if update.effective_chat is not None:
+        await context.bot.send_message(
+            update.effective_chat.id,
+            "Conversa encerrada por inatividade. Manda /generate pra começar de novo.",
+        )
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
 
 
+async def _post_shutdown(application: Application) -> None:
+    await close_http_client()
+
+
 def main() -> None:
     token = secrets.telegram_image_story_bot_token
     if not token:
         raise RuntimeError("TELEGRAM_IMAGE_STORY_BOT_TOKEN env var is not set")
 
-    app = Application.builder().token(token).build()
+    app = Application.builder().token(token).post_shutdown(_post_shutdown).build()
 
     conv_handler = ConversationHandler(
         entry_points=[CommandHandler("generate", cmd_generate)],
@@ -399,8 +468,10 @@ def main() -> None:
                 CallbackQueryHandler(on_video_approve, pattern="^approve$"),
                 MessageHandler(filters.TEXT & ~filters.COMMAND, on_video_change),
             ],
+            ConversationHandler.TIMEOUT: [TypeHandler(Update, on_timeout)],
         },
         fallbacks=[CommandHandler("cancel", cmd_cancel)],
+        conversation_timeout=bot_config.conversation_timeout_minutes * 60,
         per_user=True,
         per_chat=True,
     )
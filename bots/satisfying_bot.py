@@ -8,6 +8,7 @@ import datetime
 import logging
 import os
 import tempfile
+import time
 from dataclasses import dataclass
 from typing import Optional
 
@@ -24,7 +25,7 @@ from telegram.ext import (
 
 import litellm
 
-from src.core.container import container
+from src.core.container import close_http_client, container
 from src.core.secrets import secrets
 from src.entities.config import MainConfig
 from src.entities.story_candidate import EvaluatedStory
@@ -35,8 +36,8 @@ from src.services.tiktok_caption import normalize_hashtags
 from bots.base import (
     is_user_allowed,
     reject_unauthorized,
-    send_audio_bytes,
-    send_video_bytes,
+    send_audio_artifact,
+    send_video_artifact,
 )
 
 logging.basicConfig(
@@ -122,17 +123,20 @@ class GenerationQueue:
                 low_quality=bot_config.low_quality,
             )
 
-            await job.status_message.edit_text("📤 Enviando áudio...")
-            await send_audio_bytes(job.reply_message, result.audio, "Narração")
-
-            video_mb = len(result.video) / (1024 * 1024)
-            if video_mb > 49:
-                await job.status_message.edit_text(
-                    f"📤 Comprimindo vídeo ({video_mb:.0f} MB)... pode demorar."
+            with result:
+                await job.status_message.edit_text("📤 Enviando áudio...")
+                await send_audio_artifact(job.reply_message, result.audio, "Narração")
+
+                video_mb = result.video.size / (1024 * 1024)
+                if video_mb > 49:
+                    await job.status_message.edit_text(
+                        f"📤 Comprimindo vídeo ({video_mb:.0f} MB)... pode demorar."
+                    )
+                else:
+                    await job.status_message.edit_text("📤 Enviando vídeo...")
+                await send_video_artifact(
+                    job.reply_message, result.video, "Vídeo pronto"
                 )
-            else:
-                await job.status_message.edit_text("📤 Enviando vídeo...")
-            await send_video_bytes(job.reply_message, result.video, "Vídeo pronto")
 
             await job.status_message.edit_text("✅ Vídeo pronto!")
 
@@ -274,6 +278,7 @@ def _format_find_message(
 
 async def _discover_stories(
     subreddits: list[str] | None = None,
+    on_progress=None,
 ) -> list[EvaluatedStory]:
     """Run the story-finder pipeline and return ranked results."""
     container.wire(modules=[__name__])
@@ -284,17 +289,51 @@ async def _discover_stories(
         top_per_sub=5,
         language=config.language,
         subreddits=subreddits,
+        on_progress=on_progress,
     )
 
 
+_PROGRESS_EDIT_INTERVAL = 3.0
+
+
+def _evaluation_progress(status_message: Message):
+    """Progress callback that edits *status_message* with completed/total.
+
+    Edits are throttled to stay under Telegram's per-chat edit limits; the
+    final count is always shown.
+    """
+    last_edit = 0.0
+
+    async def on_progress(completed: int, total: int) -> None:
+        nonlocal last_edit
+        now = time.monotonic()
+        if completed < total and now - last_edit < _PROGRESS_EDIT_INTERVAL:
+            return
+        last_edit = now
+        try:
+            await status_message.edit_text(
+                f"🔎 Avaliando histórias: {completed}/{total}"
+            )
+        except Exception:
+            logger.debug("Could not update find progress", exc_info=True)
+
+    return on_progress
+
+
 async def _run_find(
     bot,
     chat_id: int,
+    status_message,
     subreddits: list[str] | None = None,
 ) -> None:
-    """Core /find logic: discover and rank stories, send results with generate buttons."""
+    """Core /find logic: discover and rank stories, send results with generate buttons.
+
+    Evaluation progress is shown by editing *status_message*.
+    """
     try:
-        results = await _discover_stories(subreddits)
+        results = await _discover_stories(
+            subreddits, on_progress=_evaluation_progress(status_message)
+        )
     except Exception as e:
         logger.exception("Failed to find stories")
         await bot.send_message(chat_id, f"Erro ao buscar histórias: {e}")
@@ -332,14 +371,16 @@ async def cmd_find(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     subreddits = _parse_subreddits(context.args)
     if subreddits:
         subs_text = ", ".join(f"r/{sub}" for sub in subreddits)
-        await update.message.reply_text(
+        status_msg = await update.message.reply_text(
             f"Buscando as melhores histórias em {subs_text}... pode demorar um pouco."
         )
     else:
-        await update.message.reply_text(
+        status_msg = await update.message.reply_text(
             "Buscando as melhores histórias do dia... pode demorar um pouco."
         )
-    await _run_find(context.bot, update.effective_chat.id, subreddits=subreddits)
+    await _run_find(
+        context.bot, update.effective_chat.id, status_msg, subreddits=subreddits
+    )
 
 
 async def handle_find_generate(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
@@ -707,8 +748,8 @@ async def _generate_video_for_story(
         )
 
         video_path = os.path.join(output_dir, f"story_{candidate_number:02d}.mp4")
-        with open(video_path, "wb") as f:
-            f.write(result.video)
+        with result:
+            result.video.copy_to(video_path)
 
         video = GeneratedVideo(
             video_path=video_path,
@@ -1117,12 +1158,22 @@ async def _post_init(application: Application) -> None:
     logger.info("Generation queue worker started")
 
 
+async def _post_shutdown(application: Application) -> None:
+    await close_http_client()
+
+
 def main() -> None:
     token = secrets.telegram_satisfying_bot_token
     if not token:
         raise RuntimeError("TELEGRAM_SATISFYING_BOT_TOKEN env var is not set")
 
-    app = Application.builder().token(token).post_init(_post_init).build()
+    app = (
+        Application.builder()
+        .token(token)
+        .post_init(_post_init)
+        .post_shutdown(_post_shutdown)
+        .build()
+    )
 
     conv_handler = ConversationHandler(
         entry_points=[
@@ -0,0 +1,137 @@
+"""Compare faster-whisper (int8) against the reference local Whisper on audio files.
+
+For each file both backends transcribe the same decoded audio. The script
+reports model load time, warm transcription wall time (best of ``--runs``)
+and how far faster-whisper's word timings drift from the reference for
+the words both backends heard.
+
+    python -m scripts.benchmark_transcription narration.mp3 part2.mp3 \\
+        --model base --language pt
+"""
+
+import argparse
+import statistics
+import time
+from difflib import SequenceMatcher
+
+from src.entities.configs.proxies.transcription import (
+    FasterWhisperTranscriptionConfig,
+    LocalTranscriptionConfig,
+)
+from src.entities.language import Language
+from src.proxies.faster_whisper_proxy import FasterWhisperProxy
+from src.proxies.local_whisper_proxy import LocalWhisperProxy
+from src.services.script_aligner import word_key
+
+
+def _timed(fn, *args):
+    started = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - started
+
+
+def _best_of(runs, fn, *args):
+    best = None
+    result = None
+    for _ in range(runs):
+        result, elapsed = _timed(fn, *args)
+        best = elapsed if best is None else min(best, elapsed)
+    return result, best
+
+
+def word_drift(reference, candidate):
+    """Start/end differences (seconds) of the words both transcriptions share."""
+    matcher = SequenceMatcher(
+        None,
+        [word_key(w.word) for w in reference],
+        [word_key(w.word) for w in candidate],
+        autojunk=False,
+    )
+    drifts = []
+    for block in matcher.get_matching_blocks():
+        for offset in range(block.size):
+            ref = reference[block.a + offset]
+            cand = candidate[block.b + offset]
+            drifts.append(max(abs(ref.start - cand.start), abs(ref.end - cand.end)))
+    return drifts
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Benchmark faster-whisper against the local Whisper proxy"
+    )
+    parser.add_argument("audio", nargs="+", help="Audio files to transcribe")
+    parser.add_argument("--model", default="base", help="Whisper model size")
+    parser.add_argument(
+        "--language",
+        choices=[lang.value for lang in Language],
+        default=Language.PORTUGUESE.value,
+    )
+    parser.add_argument("--compute-type", default="int8")
+    parser.add_argument(
+        "--threads", type=int, default=0, help="faster-whisper CPU threads"
+    )
+    parser.add_argument("--runs", type=int, default=3, help="Timed runs per file")
+    args = parser.parse_args()
+
+    language = Language(args.language)
+
+    reference, reference_load = _timed(
+        LocalWhisperProxy, LocalTranscriptionConfig(model=args.model, workers=0)
+    )
+    candidate, candidate_load = _timed(
+        FasterWhisperProxy,
+        FasterWhisperTranscriptionConfig(
+            model=args.model,
+            compute_type=args.compute_type,
+            workers=1,
+            cpu_threads=args.threads,
+        ),
+    )
+    print(f"Model load: local {reference_load:.1f}s, "
+          f"faster-whisper {candidate_load:.1f}s\n")
+
+    totals = {"local": 0.0, "faster": 0.0}
+    all_drifts = []
+    for path in args.audio:
+        with open(path, "rb") as f:
+            audio_bytes = f.read()
+        # Warm up both models (and the PCM decode cache) before timing.
+        reference.transcribe(audio_bytes, language)
+        candidate.transcribe(audio_bytes, language)
+
+        ref_result, ref_time = _best_of(
+            args.runs, reference.transcribe, audio_bytes, language
+        )
+        cand_result, cand_time = _best_of(
+            args.runs, candidate.transcribe, audio_bytes, language
+        )
+        drifts = word_drift(ref_result.words, cand_result.words)
+        totals["local"] += ref_time
+        totals["faster"] += cand_time
+        all_drifts.extend(drifts)
+
+        shared = len(drifts) / max(len(ref_result.words), 1)
+        print(path)
+        print(f"  local Whisper   {ref_time:7.2f}s  {len(ref_result.words)} words")
+        print(f"  faster-whisper  {cand_time:7.2f}s  {len(cand_result.words)} words"
+              f"  ({ref_time / cand_time:.1f}x)")
+        if drifts:
+            print(f"  drift on the {shared:.0%} of words both heard: "
+                  f"mean {statistics.mean(drifts) * 1000:.0f} ms, "
+                  f"max {max(drifts) * 1000:.0f} ms")
+        print()
+
+    print(f"Total: local {totals['local']:.2f}s, "
+          f"faster-whisper {totals['faster']:.2f}s "
+          f"({totals['local'] / totals['faster']:.1f}x)")
+    if len(all_drifts) > 1:
+        p95 = statistics.quantiles(all_drifts, n=20)[-1]
+        print(f"Word drift: mean {statistics.mean(all_drifts) * 1000:.0f} ms, "
+              f"p95 {p95 * 1000:.0f} ms")
+
+    reference.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -30,6 +30,7 @@ from bots.satisfying_bot import (
     run_daily_generate,
     run_daily_publish,
 )
+from src.core.container import closing_http_client
 
 
 async def _send_to_stdout(text: str) -> None:
@@ -91,11 +92,13 @@ def main() -> int:
 
     try:
         if args.publish_only:
-            asyncio.run(_run_publish(args.publish_only))
+            asyncio.run(closing_http_client(_run_publish(args.publish_only)))
         elif args.generate_only:
-            asyncio.run(_run_generate(args.count, args.output_dir))
+            asyncio.run(
+                closing_http_client(_run_generate(args.count, args.output_dir))
+            )
         else:
-            asyncio.run(_run_full(args.count, args.output_dir))
+            asyncio.run(closing_http_client(_run_full(args.count, args.output_dir)))
     except KeyboardInterrupt:
         print("\nInterrupted.")
         return 130
@@ -2,7 +2,7 @@ import argparse
 import asyncio
 
 from src.entities.language import Language
-from src.core.container import container
+from src.core.container import closing_http_client, container
 
 
 CRITERIA_LABELS = {
@@ -82,4 +82,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(closing_http_client(main()))
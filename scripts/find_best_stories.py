@@ -1,7 +1,7 @@
 import argparse
 import asyncio
 
-from src.core.container import container
+from src.core.container import closing_http_client, container
 
 
 LLM_LABELS = {
@@ -108,4 +108,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(closing_http_client(main()))
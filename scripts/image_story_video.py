@@ -9,7 +9,7 @@ import asyncio
 import os
 
 from src.entities.language import Language
-from src.core.container import container
+from src.core.container import closing_http_client, container
 
 
 async def main():
@@ -66,36 +66,31 @@ async def main():
 
     out = args.output_dir
 
-    with open(os.path.join(out, "part1.mp4"), "wb") as f:
-        f.write(result.part1_video)
-    with open(os.path.join(out, "part2.mp4"), "wb") as f:
-        f.write(result.part2_video)
-    with open(os.path.join(out, "story.md"), "w", encoding="utf-8") as f:
-        f.write(result.story_md)
-    with open(os.path.join(out, "original_post.md"), "w", encoding="utf-8") as f:
-        f.write(result.original_post_md)
-    with open(os.path.join(out, "audio_part1.mp3"), "wb") as f:
-        f.write(result.audio_part1)
-    with open(os.path.join(out, "audio_part2.mp3"), "wb") as f:
-        f.write(result.audio_part2)
-    with open(os.path.join(out, "captions_part1.json"), "w", encoding="utf-8") as f:
-        f.write(result.captions_part1_json)
-    with open(os.path.join(out, "captions_part2.json"), "w", encoding="utf-8") as f:
-        f.write(result.captions_part2_json)
-    with open(os.path.join(out, "image_story_part1.json"), "w", encoding="utf-8") as f:
-        f.write(result.image_story_part1_json)
-    with open(os.path.join(out, "image_story_part2.json"), "w", encoding="utf-8") as f:
-        f.write(result.image_story_part2_json)
-    if result.cover_part1_png:
-        with open(os.path.join(out, "cover_part1.png"), "wb") as f:
-            f.write(result.cover_part1_png)
-    if result.cover_part2_png:
-        with open(os.path.join(out, "cover_part2.png"), "wb") as f:
-            f.write(result.cover_part2_png)
+    with result:
+        result.part1_video.copy_to(os.path.join(out, "part1.mp4"))
+        result.part2_video.copy_to(os.path.join(out, "part2.mp4"))
+        with open(os.path.join(out, "story.md"), "w", encoding="utf-8") as f:
+            f.write(result.story_md)
+        with open(os.path.join(out, "original_post.md"), "w", encoding="utf-8") as f:
+            f.write(result.original_post_md)
+        result.audio_part1.copy_to(os.path.join(out, "audio_part1.mp3"))
+        result.audio_part2.copy_to(os.path.join(out, "audio_part2.mp3"))
+        with open(os.path.join(out, "captions_part1.json"), "w", encoding="utf-8") as f:
+            f.write(result.captions_part1_json)
+        with open(os.path.join(out, "captions_part2.json"), "w", encoding="utf-8") as f:
+            f.write(result.captions_part2_json)
+        with open(os.path.join(out, "image_story_part1.json"), "w", encoding="utf-8") as f:
+            f.write(result.image_story_part1_json)
+        with open(os.path.join(out, "image_story_part2.json"), "w", encoding="utf-8") as f:
+            f.write(result.image_story_part2_json)
+        if result.cover_part1_png:
+            result.cover_part1_png.copy_to(os.path.join(out, "cover_part1.png"))
+        if result.cover_part2_png:
+            result.cover_part2_png.copy_to(os.path.join(out, "cover_part2.png"))
 
     print("\nGeneration Complete!")
     print(f"All artifacts saved to: {out}")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    asyncio.run(closing_http_client(main()))
@@ -19,7 +19,7 @@ import sys
 
 os.environ["CONFIG_PATH"] = "config.prod.yaml"
 
-from src.core.container import container  # noqa: E402
+from src.core.container import closing_http_client, container  # noqa: E402
 from src.entities.language import Language  # noqa: E402
 from src.services.reddit_video_service import RedditVideoService  # noqa: E402
 
@@ -173,7 +173,7 @@ async def main() -> None:
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        asyncio.run(closing_http_client(main()))
     except Exception:
         import traceback
 
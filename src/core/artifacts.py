@@ -0,0 +1,124 @@
+"""File-backed handles for generated media.
+
+Rendered videos, narration and covers are kept on disk and passed around
+as :class:`Artifact` handles instead of ``bytes``. A handle reads lazily:
+``open()`` streams the file, ``mmap()`` maps it without copying and
+``read_bytes()`` is there for the few callers that really need a buffer.
+
+Lifetimes are explicit. Whoever holds a handle calls ``release()`` (or uses
+it as a context manager) once the file is no longer needed; anything still
+in a temporary store when the process exits is removed with it.
+"""
+
+import atexit
+import mmap
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Optional
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+class Artifact:
+    """Handle to one file owned by an :class:`ArtifactStore`."""
+
+    def __init__(self, store: "ArtifactStore", path: str):
+        self._store = store
+        self.path = path
+
+    @property
+    def size(self) -> int:
+        return os.path.getsize(self.path)
+
+    @property
+    def released(self) -> bool:
+        return not os.path.exists(self.path)
+
+    def open(self) -> BinaryIO:
+        return open(self.path, "rb")
+
+    @contextmanager
+    def mmap(self) -> Iterator[memoryview]:
+        """Map the file read-only for the duration of the ``with`` block."""
+        with open(self.path, "rb") as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                yield memoryview(b"")
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                view = memoryview(mapped)
+                try:
+                    yield view
+                finally:
+                    view.release()
+
+    def read_bytes(self) -> bytes:
+        with self.open() as f:
+            return f.read()
+
+    def copy_to(self, destination: str) -> str:
+        """Copy the file to *destination* and return that path."""
+        shutil.copyfile(self.path, destination)
+        return destination
+
+    def release(self) -> None:
+        self._store.release(self)
+
+    def __enter__(self) -> "Artifact":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+    def __repr__(self) -> str:
+        return f"Artifact({self.path!r})"
+
+
+class ArtifactStore:
+    """Directory of generated files handed out as :class:`Artifact` handles.
+
+    Without *root* a private temporary directory is created on first use
+    and removed when the process exits.
+    """
+
+    def __init__(self, root: Optional[str] = None):
+        self._root = root
+        self._lock = threading.Lock()
+
+    @property
+    def root(self) -> str:
+        with self._lock:
+            if self._root is None:
+                self._root = tempfile.mkdtemp(prefix="artifacts-")
+                atexit.register(self.cleanup)
+            else:
+                os.makedirs(self._root, exist_ok=True)
+            return self._root
+
+    def create(self, suffix: str = "") -> Artifact:
+        """Reserve an empty file for a writer and return its handle."""
+        path = os.path.join(self.root, f"{uuid.uuid4().hex}{suffix}")
+        open(path, "wb").close()
+        return Artifact(self, path)
+
+    def put_bytes(self, data: bytes, suffix: str = "") -> Artifact:
+        artifact = self.create(suffix)
+        with open(artifact.path, "wb") as f:
+            f.write(data)
+        return artifact
+
+    def release(self, artifact: Artifact) -> None:
+        try:
+            os.unlink(artifact.path)
+        except FileNotFoundError:
+            pass
+
+    def cleanup(self) -> None:
+        """Remove every file still in the store."""
+        if self._root is not None:
+            shutil.rmtree(self._root, ignore_errors=True)
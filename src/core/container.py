@@ -1,20 +1,27 @@
 import os
+from typing import Awaitable, TypeVar
 
 from dependency_injector import containers, providers
+from .artifacts import ArtifactStore
 from .secrets import secrets
 
 from ..entities.config import MainConfig
 from ..services.reddit_video_service import RedditVideoService
 from ..services.text_censor import TextCensor
+from ..services.background_library import BackgroundLibrary
+from ..services.youtube_metadata_index import YouTubeMetadataIndex
 from ..services.video_service import VideoService
 from ..services.captions_service import CaptionsService
 from ..services.cover_service import CoverService
 from ..services.speech_service import SpeechService
 from ..services.story_finder_service import StoryFinderService
 from ..proxies import factories as proxies_factories
+from ..proxies.http_client import AsyncHTTPClient
 
 _CONFIG_PATH = os.environ.get("CONFIG_PATH", "config.yaml")
 
+T = TypeVar("T")
+
 
 class ApplicationContainer(containers.DeclarativeContainer):
     """Dependency injection container for the application"""
@@ -24,11 +31,17 @@ class ApplicationContainer(containers.DeclarativeContainer):
 
     main_config = providers.Singleton(MainConfig.from_yaml, file_path=_CONFIG_PATH)
 
+    http_client = providers.Singleton(
+        AsyncHTTPClient,
+        config=main_config.provided.proxies.http_config,
+    )
+
     # Proxies configs
     transcription_proxy = providers.Singleton(
         proxies_factories.TranscriptionProxyFactory.create,
         config=main_config.provided.proxies.transcription_config,
         openai_api_key=secrets.openai_api_key,
+        http_client=http_client,
     )
     image_generation_proxy = providers.Singleton(
         proxies_factories.ImageGeneratorFactory.create,
@@ -48,6 +61,7 @@ class ApplicationContainer(containers.DeclarativeContainer):
         proxies_factories.SpeechProxyFactory.create,
         config=main_config.provided.proxies.speech_config,
         elevenlabs_api_key=secrets.elevenlabs_api_key,
+        http_client=http_client,
     )
     reddit_proxy = providers.Singleton(
         proxies_factories.RedditProxyFactory.create,
@@ -89,6 +103,7 @@ class ApplicationContainer(containers.DeclarativeContainer):
     speech_service = providers.Singleton(
         SpeechService,
         speech_proxy=speech_proxy,
+        config=main_config.provided.services.speech_config,
     )
 
     captions_service = providers.Singleton(
@@ -103,12 +118,26 @@ class ApplicationContainer(containers.DeclarativeContainer):
         cover_proxy=cover_proxy,
     )
 
+    background_library = providers.Singleton(
+        BackgroundLibrary.create_optional,
+        config=main_config.provided.services.video_config.background_library,
+    )
+
+    youtube_metadata_index = providers.Singleton(
+        YouTubeMetadataIndex.create_optional,
+        config=main_config.provided.services.video_config.youtube_index,
+    )
+
     video_service = providers.Singleton(
         VideoService,
         youtube_proxy=youtube_proxy,
         video_config=main_config.provided.services.video_config,
+        background_library=background_library,
+        metadata_index=youtube_metadata_index,
     )
 
+    artifact_store = providers.Singleton(ArtifactStore)
+
     reddit_video_service = providers.Singleton(
         RedditVideoService,
         reddit_proxy=reddit_proxy,
@@ -121,6 +150,7 @@ class ApplicationContainer(containers.DeclarativeContainer):
         cover_service=cover_service,
         video_service=video_service,
         text_censor=text_censor,
+        artifact_store=artifact_store,
     )
 
     story_finder_service = providers.Singleton(
@@ -133,3 +163,16 @@ class ApplicationContainer(containers.DeclarativeContainer):
 
 # Create and configure container instance
 container = ApplicationContainer()
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP session; await it before the event loop ends."""
+    await container.http_client().close()
+
+
+async def closing_http_client(main: Awaitable[T]) -> T:
+    """Await *main*, then close the shared HTTP session on the same loop."""
+    try:
+        return await main
+    finally:
+        await close_http_client()
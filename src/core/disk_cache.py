@@ -0,0 +1,135 @@
+"""Content-addressed blob cache on disk.
+
+Values are stored as files named by the SHA-256 of their key, so identical
+requests share one entry across runs and processes. Writes are atomic
+(``mkstemp`` + ``os.replace``), reads refresh the file's mtime, and once the
+cache grows past its budget the least recently used files are removed.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+from dataclasses import dataclass
+from typing import Any, Optional
+
+from .logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class DiskCache:
+    """Directory of cached blobs, sharded by the first two hex digits of the key."""
+
+    def __init__(
+        self, root: str, suffix: str = "", max_size_bytes: Optional[int] = None
+    ):
+        self.root = root
+        self.suffix = suffix
+        self.max_size_bytes = max_size_bytes
+        self.stats = CacheStats()
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    @staticmethod
+    def make_key(*parts: Any) -> str:
+        """Hash JSON-serializable *parts* into a cache key."""
+        payload = json.dumps(parts, ensure_ascii=False, sort_keys=True, default=str)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def path(self, key: str) -> str:
+        return os.path.join(self.root, key[:2], f"{key}{self.suffix}")
+
+    def get_path(self, key: str) -> Optional[str]:
+        """Return the entry's path and count a hit, or count a miss."""
+        path = self.path(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            with self._lock:
+                self.stats.misses += 1
+            return None
+        with self._lock:
+            self.stats.hits += 1
+        return path
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self.get_path(key)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def put(self, key: str, data: bytes) -> str:
+        """Store *data* under *key* and return the entry's path."""
+        path = self.path(key)
+        directory = os.path.dirname(path)
+        os.makedirs(directory, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        try:
+            previous = os.path.getsize(path)
+        except FileNotFoundError:
+            previous = 0
+        os.replace(tmp_path, path)
+        with self._lock:
+            if self._size is not None:
+                self._size += len(data) - previous
+        if self.max_size_bytes is not None:
+            self._evict(keep=path)
+        return path
+
+    def total_size(self) -> int:
+        with self._lock:
+            if self._size is None:
+                self._size = sum(os.path.getsize(path) for path in self._entries())
+            return self._size
+
+    def _entries(self):
+        for directory, _, files in os.walk(self.root):
+            for name in files:
+                if name.endswith(".tmp") or not name.endswith(self.suffix):
+                    continue
+                yield os.path.join(directory, name)
+
+    def _evict(self, keep: str) -> None:
+        if self.total_size() <= self.max_size_bytes:
+            return
+        entries = []
+        for path in self._entries():
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        entries.sort()
+
+        with self._lock:
+            for _, size, path in entries:
+                if self._size <= self.max_size_bytes:
+                    break
+                if path == keep:
+                    continue
+                try:
+                    os.unlink(path)
+                except FileNotFoundError:
+                    continue
+                self._size -= size
+                logger.debug("Evicted cache entry %s (%d bytes)", path, size)
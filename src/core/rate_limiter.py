@@ -0,0 +1,41 @@
+"""Request pacing for rate-limited APIs.
+
+Each ``acquire`` reserves the next free slot, spaced ``60 / per_minute``
+seconds after the previous one, and sleeps until it. Reservation happens
+before the first ``await``, so concurrent tasks on one event loop queue up
+in call order without a lock.
+"""
+
+import asyncio
+import time
+from typing import Dict
+
+
+class AsyncRateLimiter:
+    def __init__(self, per_minute: float):
+        self.interval = 60.0 / per_minute
+        self._next_slot = 0.0
+
+    async def acquire(self) -> None:
+        now = time.monotonic()
+        slot = max(now, self._next_slot)
+        self._next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
+_shared: Dict[str, AsyncRateLimiter] = {}
+
+
+def shared_rate_limiter(name: str, per_minute: float) -> AsyncRateLimiter:
+    """Process-wide limiter for *name*, shared by every client of that API.
+
+    Clients configured with different rates still share one quota; the
+    strictest rate wins.
+    """
+    limiter = _shared.get(name)
+    if limiter is None:
+        limiter = _shared[name] = AsyncRateLimiter(per_minute)
+    else:
+        limiter.interval = max(limiter.interval, 60.0 / per_minute)
+    return limiter
@@ -20,9 +20,11 @@ from src.entities.configs.proxies.llm import LLMConfigType, DSPyLLMConfig, Promp
 from src.entities.configs.proxies.youtube import YouTubeConfigType, PyTubeYouTubeConfig
 from src.entities.configs.proxies.cover import CoverConfigType, PlaywrightCoverConfig
 from src.entities.configs.proxies.tiktok_publisher import TikTokPublisherConfig
+from src.entities.configs.proxies.http import HTTPClientConfig
 
 from src.entities.configs.services.captions import CaptionsConfig
 from src.entities.configs.services.censorship import CensorshipConfig
+from src.entities.configs.services.speech import SpeechServiceConfig
 from src.entities.configs.services.video import VideoConfig
 from src.entities.configs.bots import BotsConfig
 from src.entities.language import Language
@@ -55,6 +57,10 @@ class ProxiesConfig(BaseYAMLModel):
     cover_config: CoverConfigType = Field(
         PlaywrightCoverConfig(), title="Cover configuration"
     )
+    http_config: HTTPClientConfig = Field(
+        default_factory=HTTPClientConfig,
+        title="Pooled HTTP client used by the ElevenLabs and OpenAI Whisper proxies",
+    )
     tiktok_publisher_config: TikTokPublisherConfig = Field(
         default_factory=TikTokPublisherConfig,
         title="TikTok auto-publisher agent configuration (non-secret)",
@@ -65,6 +71,9 @@ class ServicesConfig(BaseYAMLModel):
     video_config: VideoConfig = Field(VideoConfig(), title="Video configuration")
     captions_config: CaptionsConfig = Field(CaptionsConfig())
     censorship_config: CensorshipConfig = Field(default_factory=CensorshipConfig)
+    speech_config: SpeechServiceConfig = Field(
+        default_factory=SpeechServiceConfig, title="Speech synthesis configuration"
+    )
 
 
 DEFAULT_EVALUATION_SUBREDDITS = [
@@ -89,6 +98,9 @@ class EvaluationConfig(BaseYAMLModel):
     )
     min_chars: int = Field(500, title="Minimum post content length in characters")
     max_chars: int = Field(15000, title="Maximum post content length in characters")
+    max_concurrent_evaluations: int = Field(
+        4, title="Finalists evaluated by the LLM at the same time"
+    )
 
 
 class MainConfig(BaseYAMLModel):
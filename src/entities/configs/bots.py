@@ -8,6 +8,13 @@ class TelegramBotConfig(BaseYAMLModel):
     low_quality: bool = False
     daily_hour_utc: int = Field(17, title="Hour (UTC) to run daily /find")
     daily_minute_utc: int = Field(0, title="Minute (UTC) to run daily /find")
+    conversation_timeout_minutes: int = Field(
+        60,
+        title=(
+            "Idle minutes after which an interactive conversation ends and its "
+            "rendered and scratch files are removed"
+        ),
+    )
 
     daily_auto_publish_count: int = Field(
         4, title="Number of top stories to auto-generate and schedule daily",
@@ -0,0 +1,23 @@
+from pydantic import Field
+from src.entities.base_yaml_model import BaseYAMLModel
+
+
+class HTTPClientConfig(BaseYAMLModel):
+    max_connections: int = Field(32, title="Open connections across all hosts")
+    max_connections_per_host: int = Field(8, title="Open connections per host")
+    keepalive_seconds: float = Field(
+        30, title="Idle time before a pooled connection is closed"
+    )
+    connect_timeout_seconds: float = Field(
+        10, title="Timeout to establish a connection"
+    )
+    timeout_seconds: float = Field(
+        180, title="Timeout for a whole request, including reading the response"
+    )
+    max_retries: int = Field(
+        3, title="Retries on connection errors, timeouts, 429 and 5xx responses"
+    )
+    backoff_seconds: float = Field(
+        1.0, title="Delay before the first retry; doubles each time"
+    )
+    max_backoff_seconds: float = Field(30.0, title="Upper bound of the retry delay")
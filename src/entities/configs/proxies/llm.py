@@ -1,4 +1,4 @@
-from typing import Literal, Union, Optional
+from typing import Dict, Literal, Union, Optional
 from pydantic import Field
 from src.entities.base_yaml_model import BaseYAMLModel
 
@@ -8,6 +8,10 @@ class LLMProviderConfig(BaseYAMLModel):
     model: str = "gemma3:12b"
     temperature: Optional[float] = None
     max_tokens: Optional[int] = None
+    requests_per_minute: Optional[float] = Field(
+        None,
+        title="Pace requests to this provider across the process. None = unlimited",
+    )
     base_url: Optional[str] = Field(None, exclude=True)
     api_key: Optional[str] = Field(None, exclude=True)
 
@@ -17,9 +21,41 @@ class DSPyLLMConfig(BaseYAMLModel):
     provider_config: LLMProviderConfig = Field(default_factory=LLMProviderConfig)
 
 
+class LLMCacheConfig(BaseYAMLModel):
+    enabled: bool = Field(True, title="Cache parsed LLM responses on disk")
+    bypass: bool = Field(
+        False, title="Always call the LLM, but still store the fresh responses"
+    )
+    path: str = Field(".storage/llm", title="Directory of the response cache")
+    max_size_mb: int = Field(
+        256, title="Disk budget of the cache; least recently used entries are evicted"
+    )
+    default_ttl_hours: float = Field(
+        0,
+        title=(
+            "How long responses of methods not in ttl_hours are reused. "
+            "0 = never cache (story, character and image generation)"
+        ),
+    )
+    ttl_hours: Dict[str, float] = Field(
+        default_factory=lambda: {
+            "evaluate_story": 72,
+            "generate_hashtags": 24,
+            "enhance_transcription": 24,
+        },
+        title="Per-method TTLs, by PromptLLMProxy method name",
+    )
+
+    def ttl_seconds(self, method: str) -> float:
+        return self.ttl_hours.get(method, self.default_ttl_hours) * 3600
+
+
 class PromptLLMConfig(BaseYAMLModel):
     type: Literal["prompt"] = "prompt"
     provider_config: LLMProviderConfig = Field(default_factory=LLMProviderConfig)
+    cache: LLMCacheConfig = Field(
+        default_factory=LLMCacheConfig, title="On-disk LLM response cache"
+    )
 
 
 class MockLLMConfig(BaseYAMLModel):
@@ -12,6 +12,9 @@ class SpeechVoiceConfig(BaseYAMLModel):
 class EdgeTTSSpeechConfig(BaseYAMLModel):
     type: Literal["edge-tts"] = "edge-tts"
     default_rate: float = Field(1.0, title="Default speech rate multiplier")
+    max_concurrent_requests: int = Field(
+        4, title="Sentences synthesized at the same time"
+    )
     voices: Dict[Language, SpeechVoiceConfig] = Field(default_factory=dict)
 
 
@@ -19,6 +22,9 @@ class ElevenLabsSpeechConfig(BaseYAMLModel):
     type: Literal["elevenlabs"] = "elevenlabs"
     voices: Dict[Language, SpeechVoiceConfig] = Field(default_factory=dict)
     api_key: Optional[str] = Field(None, title="Eleven Labs API Key")
+    max_concurrent_requests: int = Field(
+        2, title="Requests in flight at once; keep within the plan's concurrency limit"
+    )
 
 
 SpeechConfigType = Union[EdgeTTSSpeechConfig, ElevenLabsSpeechConfig]
@@ -6,6 +6,37 @@ from src.entities.base_yaml_model import BaseYAMLModel
 class LocalTranscriptionConfig(BaseYAMLModel):
     type: Literal["local"] = "local"
     model: str = Field("base", title="Local Whisper Model Size")
+    workers: int = Field(
+        2,
+        title="Worker processes that keep the model loaded. 0 = in-process",
+    )
+    torch_threads: int = Field(
+        0, title="Torch threads per worker. 0 = CPU count divided by workers"
+    )
+    preload: bool = Field(
+        False, title="Start the workers and load the model when the proxy is created"
+    )
+
+
+class FasterWhisperTranscriptionConfig(BaseYAMLModel):
+    type: Literal["faster-whisper"] = "faster-whisper"
+    model: str = Field("base", title="Whisper model size or CTranslate2 model path")
+    compute_type: str = Field(
+        "int8", title="CTranslate2 weight type (int8, int8_float32, float32)"
+    )
+    workers: int = Field(
+        2, title="Transcriptions the model runs in parallel (CTranslate2 workers)"
+    )
+    cpu_threads: int = Field(
+        0, title="Threads per worker. 0 = CPU count divided by workers"
+    )
+    beam_size: int = Field(5, title="Beam search width")
+    vad_filter: bool = Field(
+        True, title="Skip silence with Silero VAD before decoding"
+    )
+    vad_min_silence_ms: int = Field(
+        500, title="Shortest silence the VAD removes, in milliseconds"
+    )
 
 
 class OpenAITranscriptionConfig(BaseYAMLModel):
@@ -14,4 +45,8 @@ class OpenAITranscriptionConfig(BaseYAMLModel):
     api_key: Optional[str] = Field(None, title="OpenAI API Key (or env var)")
 
 
-TranscriptionConfigType = Union[LocalTranscriptionConfig, OpenAITranscriptionConfig]
+TranscriptionConfigType = Union[
+    LocalTranscriptionConfig,
+    FasterWhisperTranscriptionConfig,
+    OpenAITranscriptionConfig,
+]
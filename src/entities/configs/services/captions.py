@@ -1,7 +1,17 @@
-from typing import Optional
+from typing import Literal, Optional
 from pydantic import Field
 from src.entities.base_yaml_model import BaseYAMLModel
 
+class CaptionsCacheConfig(BaseYAMLModel):
+    enabled: bool = Field(
+        True, title="Cache transcriptions and enhanced captions on disk"
+    )
+    path: str = Field(".storage/captions", title="Directory of the captions caches")
+    max_size_mb: int = Field(
+        256, title="Disk budget of each cache; least recently used entries are evicted"
+    )
+
+
 class CaptionsConfig(BaseYAMLModel):
     upper: bool = Field(True)
     font_path: str = Field("default_font.ttf", title="Path to the font file")
@@ -12,3 +22,39 @@ class CaptionsConfig(BaseYAMLModel):
     upper_text: bool = Field(False)
     marging: int = Field(50)
     fade_duration: float = Field(0)
+    glyph_cache_size: int = Field(
+        256,
+        title="Rasterized caption words kept in the process-wide LRU cache",
+    )
+    use_speech_timings: bool = Field(
+        True,
+        title=(
+            "Build captions from the word timings reported by the speech provider "
+            "(Edge TTS) instead of transcribing the narration"
+        ),
+    )
+    alignment: Literal["local", "llm"] = Field(
+        "local",
+        title=(
+            "How enhanced captions are matched to the script: a deterministic "
+            "local alignment onto the Whisper word timings, or the LLM enhancer"
+        ),
+    )
+    alignment_min_confidence: float = Field(
+        0.8,
+        title=(
+            "Share of script words the local alignment must match to Whisper "
+            "words; below it the LLM enhancer is used instead"
+        ),
+    )
+    cache: CaptionsCacheConfig = Field(
+        default_factory=CaptionsCacheConfig,
+        title="Transcription and enhanced captions cache",
+    )
+    render_mode: Literal["clips", "ass"] = Field(
+        "clips",
+        title=(
+            "How captions are drawn: one moviepy clip per word, or an ASS track "
+            "burned in by ffmpeg's subtitles filter (libass) during encode"
+        ),
+    )
@@ -0,0 +1,22 @@
+from pydantic import Field
+
+from src.entities.base_yaml_model import BaseYAMLModel
+
+
+class SpeechCacheConfig(BaseYAMLModel):
+    enabled: bool = Field(True, title="Cache synthesized sentences on disk")
+    path: str = Field(".storage/tts", title="Directory of the sentence audio cache")
+    max_size_mb: int = Field(
+        1024, title="Disk budget of the cache; least recently used entries are evicted"
+    )
+
+
+class SpeechServiceConfig(BaseYAMLModel):
+    chunked: bool = Field(
+        True,
+        title="Synthesize scripts sentence by sentence, concurrently, and join the audio",
+    )
+    cache: SpeechCacheConfig = Field(
+        default_factory=SpeechCacheConfig,
+        title="Sentence-level text-to-speech cache",
+    )
@@ -51,6 +51,80 @@ class AntiFingerprintConfig(BaseYAMLModel):
     )
 
 
+class BackgroundLibraryConfig(BaseYAMLModel):
+    """Persistent on-disk cache of downloaded YouTube background clips."""
+
+    enabled: bool = Field(True, title="Serve backgrounds from the local library first")
+    path: str = Field(
+        ".storage/backgrounds", title="Directory holding the clips and their index"
+    )
+    max_size_mb: int = Field(
+        4096,
+        title="Disk budget in MB; least recently used clips are evicted beyond it",
+    )
+    eviction_grace_seconds: int = Field(
+        3600,
+        title=(
+            "Clips used within this window are never evicted, so renders that "
+            "reopen them from disk keep working"
+        ),
+    )
+    mezzanine: bool = Field(
+        True,
+        title=(
+            "Transcode each clip once to the render size, fps and pixel format "
+            "so renders decode frames that need no scaling"
+        ),
+    )
+    mezzanine_fps: int = Field(30, title="Frame rate of the mezzanine copies")
+    mezzanine_crf: int = Field(
+        18, title="x264 CRF of the mezzanine copies (lower is higher quality)"
+    )
+
+
+class ScratchConfig(BaseYAMLModel):
+    """Per-job directory for the temporary files handed to moviepy and ffmpeg."""
+
+    root: Optional[str] = Field(
+        None, title="Parent directory of job scratch dirs. Default: tmpfs or the temp dir"
+    )
+    prefer_tmpfs: bool = Field(
+        True,
+        title="Use /dev/shm when it has room for the quota (never without a quota)",
+    )
+    quota_mb: int = Field(
+        2048, title="Maximum size of one job's scratch files in MB. 0 = unlimited"
+    )
+
+
+class YouTubeIndexConfig(BaseYAMLModel):
+    """Persistent metadata about YouTube background candidates."""
+
+    enabled: bool = Field(True, title="Keep a local index of candidate videos")
+    path: str = Field(".storage/youtube", title="Directory holding the index files")
+    duration_fitting: bool = Field(
+        True,
+        title=(
+            "Pick the clips that cover the narration with the least spare "
+            "footage before downloading"
+        ),
+    )
+    max_lookups_per_run: int = Field(
+        8,
+        title=(
+            "Candidates without a known duration looked up (watch page) per "
+            "compilation; the others are only fitted once their duration is known"
+        ),
+    )
+    channel_ttl_seconds: int = Field(
+        21600,
+        title=(
+            "Cached channel listings older than this are refreshed by fetching "
+            "only their newest page. 0 = always refresh"
+        ),
+    )
+
+
 class VideoConfig(BaseYAMLModel):
     watermark_path: Optional[str] = Field(
         None, title="Path to the watermark image file"
@@ -93,11 +167,59 @@ class VideoConfig(BaseYAMLModel):
         "videos",
         title="Which YouTube channel surface to use for background clips",
     )
+    youtube_download_concurrency: int = Field(
+        3,
+        title=(
+            "Background downloads kept in flight while building a compilation. "
+            "Outstanding downloads are cancelled once the duration is covered."
+        ),
+    )
+    youtube_clip_window_seconds: int = Field(
+        0,
+        title=(
+            "Download only the first N seconds of each background, fetching "
+            "just the DASH segments that cover them. 0 = whole videos"
+        ),
+    )
+    scratch: ScratchConfig = Field(
+        default_factory=ScratchConfig,
+        title="Per-job scratch space for editor temp files",
+    )
+    youtube_index: YouTubeIndexConfig = Field(
+        default_factory=YouTubeIndexConfig,
+        title="Local index of YouTube background candidates",
+    )
     ffmpeg_params: List[str] = Field([], title="ffmpeg params")
+    render_backend: Literal["moviepy", "ffmpeg"] = Field(
+        "moviepy",
+        title=(
+            "How satisfying-background videos are rendered: moviepy composites "
+            "frames in Python, ffmpeg builds a single native filter_complex graph."
+        ),
+    )
+    render_segments: int = Field(
+        1,
+        title=(
+            "Split moviepy renders of satisfying-background videos into N "
+            "GOP-aligned time ranges encoded in parallel worker processes and "
+            "joined without re-encoding. 1 = single pass."
+        ),
+    )
+    max_concurrent_renders: int = Field(
+        2,
+        title=(
+            "Renders (e.g. part 1 and part 2) allowed to encode at the same time "
+            "in worker processes. The CPU cores are split between them."
+        ),
+    )
     draw_transition_duration: float = Field(
         1.0,
         title="Duration (seconds) of the draw-in reveal effect. Set to 0 to use a simple crossfade instead.",
     )
+    background_library: BackgroundLibraryConfig = Field(
+        default_factory=BackgroundLibraryConfig,
+        title="Local library of downloaded background clips",
+    )
     anti_fingerprint: AntiFingerprintConfig = Field(
         default_factory=AntiFingerprintConfig,
         title="Subtle randomized transforms to evade content-fingerprint detection",
@@ -0,0 +1,172 @@
+"""ASS (Advanced SubStation Alpha) caption track builder.
+
+Produces a subtitle script equivalent to the per-word ``TextClip`` layers of
+``CaptionsClip`` so ffmpeg's ``subtitles`` filter (libass) can burn the
+captions natively during encode.
+"""
+
+import struct
+from functools import lru_cache
+from typing import List, Tuple
+
+from PIL import ImageColor, ImageFont
+
+from src.entities.captions import Captions
+from src.entities.configs.services.captions import CaptionsConfig
+
+# Same relative top position as ``with_position(["center", 0.25], relative=True)``.
+CAPTION_TOP_RATIO = 0.25
+
+
+def caption_text(text: str, upper: bool) -> str:
+    """Apply the upper-casing and punctuation stripping of ``CaptionsClip``."""
+    show_text = text.upper() if upper else text
+    return show_text.replace(",", "").replace(".", "").strip()
+
+
+def font_family_name(font_path: str) -> str:
+    """Family name libass needs to pick *font_path* from ``fontsdir``."""
+    return ImageFont.truetype(font_path, 12).getname()[0]
+
+
+@lru_cache(maxsize=16)
+def font_line_metrics(font_path: str) -> Tuple[int, int, int]:
+    """Return ``(units_per_em, ascent, descent)`` the way libass reads them.
+
+    libass sizes a font by the OS/2 ``usWinAscent``/``usWinDescent`` pair and
+    only falls back to the ``hhea`` ascender/descender when those are unset.
+    """
+    with open(font_path, "rb") as font_file:
+        data = font_file.read()
+    if data[:4] == b"ttcf":
+        (offset,) = struct.unpack_from(">I", data, 12)
+    else:
+        offset = 0
+    (num_tables,) = struct.unpack_from(">H", data, offset + 4)
+    tables = {}
+    for index in range(num_tables):
+        tag, _, table_offset, _ = struct.unpack_from(
+            ">4sIII", data, offset + 12 + 16 * index
+        )
+        tables[tag] = table_offset
+
+    (units_per_em,) = struct.unpack_from(">H", data, tables[b"head"] + 18)
+    if b"OS/2" in tables:
+        ascent, descent = struct.unpack_from(">hh", data, tables[b"OS/2"] + 74)
+        if ascent + descent != 0:
+            return units_per_em, ascent, descent
+    ascent, descent = struct.unpack_from(">hh", data, tables[b"hhea"] + 4)
+    return units_per_em, ascent, -descent
+
+
+def ass_font_size(font_path: str, font_size: int) -> float:
+    """Translate a PIL point size to the ASS ``Fontsize`` with the same glyphs.
+
+    PIL scales the em square to *font_size* pixels, while libass scales the
+    font so that its win ascent plus descent equal ``Fontsize``.
+    """
+    units_per_em, ascent, descent = font_line_metrics(font_path)
+    return round(font_size * (ascent + descent) / units_per_em, 2)
+
+
+def caption_offset(
+    text: str, font_path: str, font_size: int, stroke_width: int, margin: int
+) -> Tuple[float, float]:
+    """Shift from the word clip's top centre to the libass ``\\pos`` point.
+
+    ``TextClip`` centres the inked bounding box in its image, while libass
+    centres the advance width and hangs the line from the font ascent, so
+    the anchor is moved by the difference to land the glyphs in place.
+    """
+    font = ImageFont.truetype(font_path, font_size)
+    left, top, right, bottom = font.getbbox(
+        text, stroke_width=stroke_width, anchor="lm"
+    )
+    dx = (font.getlength(text) - int(right - left)) / 2
+    clip_ink_top = margin + int(bottom - top) / 2 + top
+    baseline_ink_top = font.getbbox(text, stroke_width=stroke_width, anchor="ls")[1]
+    units_per_em, ascent, _ = font_line_metrics(font_path)
+    dy = clip_ink_top - (ascent * font_size / units_per_em + baseline_ink_top)
+    return dx, dy
+
+
+def ass_color(color: str) -> str:
+    """Convert a PIL color string to the ASS ``&HAABBGGRR`` notation."""
+    rgb = ImageColor.getrgb(color)
+    red, green, blue = rgb[:3]
+    return f"&H00{blue:02X}{green:02X}{red:02X}"
+
+
+def ass_timestamp(seconds: float) -> str:
+    centiseconds = int(round(max(seconds, 0) * 100))
+    hours, centiseconds = divmod(centiseconds, 360000)
+    minutes, centiseconds = divmod(centiseconds, 6000)
+    secs, centiseconds = divmod(centiseconds, 100)
+    return f"{hours}:{minutes:02d}:{secs:02d}.{centiseconds:02d}"
+
+
+def _escape_ass_text(text: str) -> str:
+    return (
+        text.replace("\\", "\\\\")
+        .replace("{", "\\{")
+        .replace("}", "\\}")
+        .replace("\n", "\\N")
+    )
+
+
+def build_ass_subtitles(
+    captions: Captions,
+    config: CaptionsConfig,
+    font_path: str,
+    width: int,
+    height: int,
+    size_rate: float = 1.0,
+) -> str:
+    """Return an ASS script with one event per caption word."""
+    font_size = int(round(config.font_size * size_rate))
+    stroke_width = int(round(config.stroke_width * size_rate))
+    margin = int(round(config.marging * size_rate))
+    fade_ms = int(round(config.fade_duration * 1000))
+
+    center = width / 2
+    top = height * CAPTION_TOP_RATIO
+
+    lines: List[str] = [
+        "[Script Info]",
+        "ScriptType: v4.00+",
+        f"PlayResX: {width}",
+        f"PlayResY: {height}",
+        "WrapStyle: 2",
+        "ScaledBorderAndShadow: yes",
+        "",
+        "[V4+ Styles]",
+        "Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, "
+        "OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, "
+        "ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, "
+        "Alignment, MarginL, MarginR, MarginV, Encoding",
+        "Style: Caption,"
+        f"{font_family_name(font_path)},{ass_font_size(font_path, font_size):g},"
+        f"{ass_color(config.color)},{ass_color(config.color)},"
+        f"{ass_color(config.stroke_color)},&H00000000,"
+        "0,0,0,0,100,100,0,0,1,"
+        f"{stroke_width},0,8,0,0,0,1",
+        "",
+        "[Events]",
+        "Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, "
+        "Effect, Text",
+    ]
+
+    for segment in captions.segments:
+        text = caption_text(segment.text, config.upper_text)
+        if not text or segment.end <= segment.start:
+            continue
+        dx, dy = caption_offset(text, font_path, font_size, stroke_width, margin)
+        overrides = f"\\pos({int(round(center + dx))},{int(round(top + dy))})"
+        if fade_ms > 0:
+            overrides += f"\\fad({fade_ms},{fade_ms})"
+        lines.append(
+            f"Dialogue: 0,{ass_timestamp(segment.start)},{ass_timestamp(segment.end)},"
+            f"Caption,,0,0,0,,{{{overrides}}}{_escape_ass_text(text)}"
+        )
+
+    return "\n".join(lines) + "\n"
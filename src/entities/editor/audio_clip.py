@@ -1,6 +1,4 @@
-import tempfile
 from moviepy import (
-    AudioFileClip,
     CompositeAudioClip,
     AudioArrayClip,
     concatenate_audioclips,
@@ -8,28 +6,45 @@ from moviepy import (
 )
 import numpy as np
 
+from src.entities.editor.pcm import decode_pcm
+from src.entities.editor.scratch import current_scratch
+
+SAMPLE_RATE = 44100
+CHANNELS = 2
+
 
 class AudioClip:
+    """Narration decoded once into memory.
+
+    The clip, its duration and the end silence all come from one
+    ``decode_pcm`` buffer, so no ffmpeg reader is kept open for the file.
+    """
+
     clip: MoviepyAudioClip
 
     def __init__(self, file_path: str = None, volume=1, bytes: bytes = None):
         self.file_path = file_path
+        self.volume = volume
         if bytes:
-            # Create a temporary file with the audio bytes
-            with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmpfile:
-                tmpfile.write(bytes)
-                tmpfile.flush()
-                self.clip = AudioFileClip(tmpfile.name)
+            self.file_path = current_scratch().write_bytes(bytes, ".mp3")
         else:
-            self.clip = AudioFileClip(file_path)
-        self.clip = self.clip.with_volume_scaled(volume)
+            with open(file_path, "rb") as f:
+                bytes = f.read()
+        self.samples = decode_pcm(bytes, SAMPLE_RATE, channels=CHANNELS, cache=False)
+        self.clip = self._clip_from_samples()
+
+    def _clip_from_samples(self) -> MoviepyAudioClip:
+        return AudioArrayClip(self.samples, fps=SAMPLE_RATE).with_volume_scaled(
+            self.volume
+        )
 
     def add_end_silence(self, duration_in_seconds):
-        silence = AudioArrayClip(
-            np.zeros((44100 * duration_in_seconds, 2)),
-            fps=44100,
+        """Pad the decoded buffer with silence; call before trimming or merging."""
+        silence = np.zeros(
+            (int(SAMPLE_RATE * duration_in_seconds), CHANNELS), dtype=np.float32
         )
-        self.clip = concatenate_audioclips([self.clip, silence])
+        self.samples = np.concatenate([self.samples, silence])
+        self.clip = self._clip_from_samples()
 
     def ajust_duration(self, duration):
         if duration > self.clip.duration:
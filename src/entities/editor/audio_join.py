@@ -0,0 +1,86 @@
+"""Join encoded audio files into one MP3 without gaps between them.
+
+Each input is decoded to PCM and the streams are concatenated with ffmpeg's
+``concat`` filter, so the joins fall on exact sample boundaries instead of
+MP3 frame boundaries, and the result is encoded once. An input therefore
+starts in the output at the sum of the :func:`decoded_duration` of the inputs
+before it.
+"""
+
+import struct
+import subprocess
+from typing import List, Sequence
+
+from moviepy.config import FFMPEG_BINARY
+
+
+def join_audio_command(
+    input_paths: Sequence[str], output_path: str, quality: int = 2
+) -> List[str]:
+    command = [FFMPEG_BINARY, "-y", "-hide_banner", "-loglevel", "error"]
+    for path in input_paths:
+        command += ["-i", path]
+    inputs = "".join(f"[{index}:a]" for index in range(len(input_paths)))
+    command += [
+        "-filter_complex",
+        f"{inputs}concat=n={len(input_paths)}:v=0:a=1[out]",
+        "-map",
+        "[out]",
+        "-c:a",
+        "libmp3lame",
+        "-q:a",
+        str(quality),
+        "-f",
+        "mp3",
+        output_path,
+    ]
+    return command
+
+
+def join_audio(input_paths: Sequence[str], output_path: str) -> None:
+    """Write the concatenation of *input_paths* to *output_path* as MP3."""
+    process = subprocess.run(
+        join_audio_command(input_paths, output_path), capture_output=True
+    )
+    if process.returncode != 0:
+        stderr = process.stderr.decode("utf-8", errors="replace")
+        raise RuntimeError(
+            f"ffmpeg audio join failed ({process.returncode}): {stderr[-2000:]}"
+        )
+
+
+def decoded_duration(path: str) -> float:
+    """Duration of *path* as ffmpeg decodes it, exact to the sample."""
+    process = subprocess.run(
+        [
+            FFMPEG_BINARY,
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-i",
+            path,
+            "-ac",
+            "1",
+            "-c:a",
+            "pcm_s16le",
+            "-f",
+            "wav",
+            "pipe:1",
+        ],
+        capture_output=True,
+    )
+    if process.returncode != 0:
+        stderr = process.stderr.decode("utf-8", errors="replace")
+        raise RuntimeError(
+            f"ffmpeg decode failed ({process.returncode}): {stderr[-2000:]}"
+        )
+    wav = process.stdout
+    sample_rate = struct.unpack("<I", wav[24:28])[0]
+    # Piped WAV has no valid data size, so count the bytes after its header.
+    position = 12
+    while position + 8 <= len(wav):
+        chunk_id, size = struct.unpack("<4sI", wav[position : position + 8])
+        if chunk_id == b"data":
+            return (len(wav) - position - 8) / 2 / sample_rate
+        position += 8 + size + (size & 1)
+    raise RuntimeError(f"ffmpeg decode of {path} produced no audio data")
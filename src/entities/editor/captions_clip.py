@@ -1,9 +1,12 @@
-import tempfile
+import hashlib
+import os
 from typing import List
-from moviepy import TextClip
-from moviepy.video.fx import CrossFadeIn, CrossFadeOut
+from moviepy import ImageClip, VideoClip
 from src.entities.captions import CaptionSegment, Captions
 from src.entities.config import CaptionsConfig
+from src.entities.editor.ass_subtitles import build_ass_subtitles
+from src.entities.editor.glyph_cache import Glyph, get_glyph_cache, rasterize_text
+from src.entities.editor.scratch import current_scratch
 
 
 class CaptionsClip:
@@ -15,19 +18,39 @@ class CaptionsClip:
     ):
         self.captions = captions
         self.config = config
-        with tempfile.NamedTemporaryFile(suffix=".ttf", delete=False) as tmpfile:
-            tmpfile.write(font_bytes)
-            tmpfile.seek(0)
-            self.font_path = tmpfile.name
+        self.font_digest = hashlib.sha1(font_bytes).hexdigest()
+        self.glyph_cache = get_glyph_cache(config.glyph_cache_size)
+        # The font sits alone in its own directory so it can double as the
+        # libass ``fontsdir`` when captions are burned in as ASS subtitles.
+        self.font_path = current_scratch().write_bytes(
+            font_bytes, name="caption_font.ttf"
+        )
+        self.fonts_dir = os.path.dirname(self.font_path)
 
-    def get_clips(self, size_rate: float = 1.0) -> List[TextClip]:
+    @property
+    def uses_ass(self) -> bool:
+        return self.config.render_mode == "ass"
+
+    def to_ass(self, width: int, height: int, size_rate: float = 1.0) -> str:
+        return build_ass_subtitles(
+            self.captions, self.config, self.font_path, width, height, size_rate
+        )
+
+    def write_ass(self, width: int, height: int, size_rate: float = 1.0) -> str:
+        """Write the ASS track for a *width* x *height* video and return its path."""
+        path = current_scratch().new_path(".ass")
+        with open(path, "w", encoding="utf-8") as ass_file:
+            ass_file.write(self.to_ass(width, height, size_rate))
+        return path
+
+    def get_clips(self, size_rate: float = 1.0) -> List[ImageClip]:
         clips = []
         for caption_segment in self.captions.segments:
             clip = self.__make_word_clip(caption_segment, size_rate)
             clips.append(clip)
         return clips
 
-    def __make_word_clip(self, caption_segment: CaptionSegment, size_rate: float) -> TextClip:
+    def __make_word_clip(self, caption_segment: CaptionSegment, size_rate: float) -> ImageClip:
         start_time, end_time = [caption_segment.start, caption_segment.end]
         text = caption_segment.text
         show_text = text.upper() if self.config.upper_text else text
@@ -36,23 +59,53 @@ class CaptionsClip:
         font_size = int(round(self.config.font_size * size_rate))
         stroke_width = int(round(self.config.stroke_width * size_rate))
         margin = int(round(self.config.marging * size_rate))
-        
-        word_clip = TextClip(
-            text=show_text,
-            font=self.font_path,
-            font_size=font_size,
-            color=self.config.color,
-            stroke_color=self.config.stroke_color,
-            stroke_width=stroke_width,
-            text_align="center",
-            margin=(margin, margin),
-        ).with_start(start_time)
-        word_clip = word_clip.with_duration(end_time - start_time)
-
-        if self.config.fade_duration > 0:
-            word_clip = CrossFadeIn(duration=self.config.fade_duration).apply(word_clip)
-            word_clip = CrossFadeOut(duration=self.config.fade_duration).apply(
-                word_clip
-            )
-        word_clip: TextClip = word_clip.with_position(["center", 0.25], relative=True)
+
+        glyph = self.__get_glyph(show_text, font_size, stroke_width, margin)
+        duration = end_time - start_time
+
+        word_clip = ImageClip(glyph.rgb, duration=duration)
+        word_clip = word_clip.with_mask(
+            self.__make_mask(glyph, duration, self.config.fade_duration)
+        )
+        word_clip = word_clip.with_start(start_time)
+        word_clip: ImageClip = word_clip.with_position(["center", 0.25], relative=True)
         return word_clip
+
+    def __get_glyph(
+        self, text: str, font_size: int, stroke_width: int, margin: int
+    ) -> Glyph:
+        key = (
+            text,
+            self.font_digest,
+            font_size,
+            stroke_width,
+            self.config.color,
+            self.config.stroke_color,
+            margin,
+        )
+        return self.glyph_cache.get(
+            key,
+            lambda: rasterize_text(
+                text,
+                self.font_path,
+                font_size,
+                stroke_width,
+                self.config.color,
+                self.config.stroke_color,
+                margin,
+            ),
+        )
+
+    @staticmethod
+    def __make_mask(glyph: Glyph, duration: float, fade: float) -> VideoClip:
+        """Alpha plane scaled by the fade in/out ramp at each instant."""
+        if fade <= 0:
+            return ImageClip(glyph.alpha, is_mask=True, duration=duration)
+
+        def alpha_at(t):
+            factor = min(1.0, t / fade, (duration - t) / fade)
+            if factor >= 1.0:
+                return glyph.alpha
+            return glyph.alpha * max(factor, 0.0)
+
+        return VideoClip(alpha_at, is_mask=True, duration=duration)
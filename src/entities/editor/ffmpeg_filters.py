@@ -0,0 +1,14 @@
+"""Helpers shared by everything that writes ffmpeg filtergraph strings."""
+
+# Characters with a special meaning inside an option value (first level) and
+# inside the filtergraph description (second level), see "Notes on filtergraph
+# escaping" in the ffmpeg-filters documentation.
+_OPTION_SPECIAL_CHARS = "\\':"
+_GRAPH_SPECIAL_CHARS = "\\'[],;"
+
+
+def escape_filter_value(value: str) -> str:
+    """Escape *value* so it survives both filtergraph escaping levels."""
+    for level in (_OPTION_SPECIAL_CHARS, _GRAPH_SPECIAL_CHARS):
+        value = "".join("\\" + ch if ch in level else ch for ch in value)
+    return value
@@ -0,0 +1,288 @@
+"""Native ffmpeg render backend.
+
+Turns a :class:`VideoRenderSpec` into a single ``filter_complex`` graph so
+the whole composition (background crop/scale, anti-fingerprint jitter,
+overlays, captions and audio) runs inside ffmpeg instead of being blended
+frame by frame in Python.
+"""
+
+import math
+import os
+import subprocess
+from typing import List, Optional
+
+from moviepy.config import FFMPEG_BINARY
+from PIL import Image
+
+from src.core.logging_config import get_logger
+from src.entities.editor.ass_subtitles import build_ass_subtitles
+from src.entities.editor.ffmpeg_filters import escape_filter_value
+from src.entities.editor.render_spec import BackgroundSource, VideoRenderSpec
+from src.entities.editor.scratch import current_scratch
+
+logger = get_logger(__name__)
+
+
+class FFmpegVideoRender:
+    """Builds and runs the ffmpeg command for a :class:`VideoRenderSpec`."""
+
+    def __init__(self, spec: VideoRenderSpec):
+        self.spec = spec
+        self._inputs: List[List[str]] = []
+        self._filters: List[str] = []
+        self._label_count = 0
+
+    def write_videofile(self, output_path: str, threads: Optional[int] = None) -> None:
+        """Render the spec to *output_path*."""
+        script_path = current_scratch().new_path(".txt")
+        command = self.build_command(output_path, script_path, threads=threads)
+        with open(script_path, "w", encoding="utf-8") as script:
+            script.write(";\n".join(self._filters))
+
+        logger.info(
+            "Rendering %s with ffmpeg (%d inputs, %d filter chains)",
+            output_path,
+            len(self._inputs),
+            len(self._filters),
+        )
+        try:
+            process = subprocess.run(command, capture_output=True)
+        finally:
+            os.unlink(script_path)
+        if process.returncode != 0:
+            stderr = process.stderr.decode("utf-8", errors="replace")
+            raise RuntimeError(
+                f"ffmpeg render failed ({process.returncode}): {stderr[-2000:]}"
+            )
+
+    def build_command(
+        self, output_path: str, script_path: str, threads: Optional[int] = None
+    ) -> List[str]:
+        """Return the ffmpeg argv; the filtergraph is read from *script_path*."""
+        self._inputs = []
+        self._filters = []
+        self._label_count = 0
+
+        spec = self.spec
+        total = spec.total_duration
+
+        audio_idx = self._add_input(["-i", spec.audio_path])
+        self._filters.append(
+            f"[{audio_idx}:a]apad=pad_dur={spec.end_silence:.3f},"
+            f"atrim=duration={total:.3f}[aout]"
+        )
+
+        video = self._background_chain()
+        video = self._overlays(video)
+        video = self._captions(video)
+
+        command = [FFMPEG_BINARY, "-y", "-hide_banner", "-loglevel", "error"]
+        for args in self._inputs:
+            command.extend(args)
+        command.extend(["-filter_complex_script", script_path])
+        command.extend(["-map", f"[{video}]", "-map", "[aout]"])
+        command.extend(
+            [
+                "-c:v",
+                "libx264",
+                "-preset",
+                "medium",
+                "-pix_fmt",
+                "yuv420p",
+                "-r",
+                f"{spec.fps:g}",
+                "-c:a",
+                "libmp3lame",
+                "-t",
+                f"{total:.3f}",
+            ]
+        )
+        if threads:
+            command.extend(["-threads", str(threads)])
+        command.extend(spec.ffmpeg_params)
+        command.append(output_path)
+        return command
+
+    # ------------------------------------------------------------------
+    # Graph pieces
+    # ------------------------------------------------------------------
+
+    def _add_input(self, args: List[str]) -> int:
+        self._inputs.append(args)
+        return len(self._inputs) - 1
+
+    def _label(self, prefix: str) -> str:
+        self._label_count += 1
+        return f"{prefix}{self._label_count}"
+
+    def _background_chain(self) -> str:
+        spec = self.spec
+        if not spec.backgrounds:
+            raise ValueError("At least one background source is required")
+
+        total = spec.total_duration
+        cycle = sum(source.effective_duration for source in spec.backgrounds)
+        repeats = max(1, int(math.ceil(total / cycle))) if cycle > 0 else 1
+
+        labels = []
+        for _ in range(repeats):
+            for source in spec.backgrounds:
+                labels.append(self._background_source(source))
+
+        label = self._label("bg")
+        self._filters.append(
+            "".join(f"[{item}]" for item in labels)
+            + f"concat=n={len(labels)}:v=1:a=0,"
+            f"trim=duration={total:.3f},setpts=PTS-STARTPTS[{label}]"
+        )
+        return label
+
+    def _background_source(self, source: BackgroundSource) -> str:
+        spec = self.spec
+        idx = self._add_input(["-i", source.path])
+        chain = [f"[{idx}:v]setpts=PTS-STARTPTS"]
+        chain.extend(self._anti_fingerprint_filters(source))
+        ratio = spec.width / spec.height
+        chain.append(
+            f"crop=w='trunc(min(iw,ih*{ratio:.6f}))':h='trunc(min(ih,iw/{ratio:.6f}))'"
+        )
+        chain.append(f"scale={spec.width}:{spec.height}")
+        chain.append("setsar=1")
+        chain.append(f"fps={spec.fps:g}")
+        chain.append("format=yuv420p")
+        label = self._label("src")
+        self._filters.append(",".join(chain) + f"[{label}]")
+        return label
+
+    @staticmethod
+    def _anti_fingerprint_filters(source: BackgroundSource) -> List[str]:
+        """Mirror ``VideoClip.apply_anti_fingerprint`` with native filters."""
+        params = source.anti_fingerprint
+        if params is None:
+            return []
+
+        filters = []
+        if params.zoom > 1.0:
+            filters.append(
+                f"crop=w='trunc(iw/{params.zoom:.6f})':h='trunc(ih/{params.zoom:.6f})'"
+            )
+        if params.mirror:
+            filters.append("hflip")
+        if params.brightness != 1.0:
+            b = f"{params.brightness:.6f}"
+            filters.append(f"colorchannelmixer=rr={b}:gg={b}:bb={b}")
+        if params.contrast != 0:
+            # LumContrast: out = im + contrast * (im - 127)
+            c = params.contrast
+            expr = f"clip(val*{1 + c:.6f}-{127 * c:.6f},0,255)"
+            filters.append(f"lutrgb=r='{expr}':g='{expr}':b='{expr}'")
+        if params.speed != 1.0:
+            filters.append(f"setpts=PTS/{params.speed:.6f}")
+        if params.hue_shift != 0:
+            filters.append(f"hue=h={params.hue_shift:.4f}")
+        return filters
+
+    def _overlays(self, video: str) -> str:
+        spec = self.spec
+        total = spec.total_duration
+        fade = spec.crossfade
+
+        if spec.cover_path:
+            video = self._image_overlay(
+                video,
+                spec.cover_path,
+                start=0,
+                duration=spec.cover_duration,
+                fade_out=1,
+            )
+
+        if spec.cta_path and 0 < spec.cta_start < total:
+            video = self._image_overlay(
+                video,
+                spec.cta_path,
+                start=spec.cta_start,
+                duration=total - spec.cta_start,
+                fade_in=fade,
+            )
+
+        if spec.watermark_path:
+            video = self._image_overlay(
+                video, spec.watermark_path, start=0, duration=total
+            )
+        return video
+
+    def _image_overlay(
+        self,
+        video: str,
+        path: str,
+        *,
+        start: float,
+        duration: float,
+        fade_in: float = 0,
+        fade_out: float = 0,
+    ) -> str:
+        """Overlay *path* centered and fit to width, like ``ImageClip.fit_width``."""
+        spec = self.spec
+        if duration <= 0:
+            return video
+
+        with Image.open(path) as img:
+            image_width, image_height = img.size
+        new_width = spec.width - spec.padding
+        new_height = int(new_width / (image_width / image_height))
+        x = (spec.width - new_width) // 2
+        y = (spec.height - new_height) // 2
+
+        idx = self._add_input(
+            ["-loop", "1", "-framerate", f"{spec.fps:g}", "-t", f"{duration:.3f}", "-i", path]
+        )
+        chain = [f"[{idx}:v]scale={new_width}:{new_height}", "format=rgba"]
+        if fade_in > 0:
+            chain.append(f"fade=t=in:st=0:d={fade_in:.3f}:alpha=1")
+        if fade_out > 0:
+            chain.append(
+                f"fade=t=out:st={max(duration - fade_out, 0):.3f}:d={fade_out:.3f}:alpha=1"
+            )
+        chain.append(f"setpts=PTS-STARTPTS+{start:.3f}/TB")
+        image = self._label("img")
+        self._filters.append(",".join(chain) + f"[{image}]")
+
+        out = self._label("ov")
+        self._filters.append(
+            f"[{video}][{image}]overlay=x={x}:y={y}"
+            f":enable='between(t,{start:.3f},{start + duration:.3f})'"
+            f":eof_action=pass[{out}]"
+        )
+        return out
+
+    def _captions(self, video: str) -> str:
+        """Burn the captions in with libass, mirroring ``CaptionsClip``.
+
+        The ffmpeg bundled with moviepy has no ``drawtext`` filter, so word
+        captions are written as an ASS track when the spec does not carry one.
+        """
+        spec = self.spec
+        subtitles_path, fonts_dir = spec.subtitles_path, spec.fonts_dir
+        if not subtitles_path:
+            if spec.captions is None or not spec.captions.segments:
+                return video
+            subtitles_path = current_scratch().new_path(".ass")
+            with open(subtitles_path, "w", encoding="utf-8") as ass_file:
+                ass_file.write(
+                    build_ass_subtitles(
+                        spec.captions,
+                        spec.captions_config,
+                        spec.font_path,
+                        spec.width,
+                        spec.height,
+                        spec.size_rate,
+                    )
+                )
+            fonts_dir = os.path.dirname(spec.font_path)
+
+        options = [f"filename={escape_filter_value(subtitles_path)}"]
+        if fonts_dir:
+            options.append(f"fontsdir={escape_filter_value(fonts_dir)}")
+        out = self._label("cap")
+        self._filters.append(f"[{video}]subtitles=" + ":".join(options) + f"[{out}]")
+        return out
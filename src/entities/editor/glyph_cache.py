@@ -0,0 +1,118 @@
+"""Rasterized caption glyph cache.
+
+Narrated stories repeat the same short words constantly, and rendering each
+one through ``TextClip`` means a PIL rasterization with stroke per word. The
+cache stores each distinct styled word once as an RGB bitmap plus alpha
+plane and hands out the same read-only arrays to every caption that needs
+them, across both parts of a two-part video and across jobs in the process.
+"""
+
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+from moviepy import TextClip
+
+GlyphKey = Tuple[str, str, int, int, str, str, int]
+
+
+@dataclass(frozen=True)
+class Glyph:
+    """One rasterized word: ``rgb`` is HxWx3 uint8, ``alpha`` is HxW float."""
+
+    rgb: np.ndarray
+    alpha: np.ndarray
+
+    @property
+    def nbytes(self) -> int:
+        return self.rgb.nbytes + self.alpha.nbytes
+
+
+def rasterize_text(
+    text: str,
+    font_path: str,
+    font_size: int,
+    stroke_width: int,
+    color: str,
+    stroke_color: str,
+    margin: int,
+) -> Glyph:
+    """Rasterize *text* exactly like ``CaptionsClip`` used to with ``TextClip``."""
+    clip = TextClip(
+        text=text,
+        font=font_path,
+        font_size=font_size,
+        color=color,
+        stroke_color=stroke_color,
+        stroke_width=stroke_width,
+        text_align="center",
+        margin=(margin, margin),
+    )
+    rgb = np.ascontiguousarray(clip.get_frame(0)[:, :, :3], dtype=np.uint8)
+    alpha = np.ascontiguousarray(clip.mask.get_frame(0), dtype=np.float32)
+    rgb.setflags(write=False)
+    alpha.setflags(write=False)
+    return Glyph(rgb=rgb, alpha=alpha)
+
+
+class GlyphCache:
+    """Thread-safe LRU of rasterized glyphs keyed by text and style."""
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[GlyphKey, Glyph]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def resize(self, max_entries: int) -> None:
+        with self._lock:
+            self.max_entries = max_entries
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def get(self, key: GlyphKey, render: Callable[[], Glyph]) -> Glyph:
+        """Return the cached glyph for *key*, rasterizing it on a miss."""
+        with self._lock:
+            glyph = self._entries.get(key)
+            if glyph is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return glyph
+            self.misses += 1
+
+        glyph = render()
+        with self._lock:
+            self._entries[key] = glyph
+            self._entries.move_to_end(key)
+            self._evict()
+        return glyph
+
+    def _evict(self) -> None:
+        while len(self._entries) > max(self.max_entries, 0):
+            self._entries.popitem(last=False)
+
+
+_shared_cache: Optional[GlyphCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_glyph_cache(max_entries: int = 256) -> GlyphCache:
+    """Return the process-wide glyph cache, resized to *max_entries*."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = GlyphCache(max_entries)
+        elif _shared_cache.max_entries != max_entries:
+            _shared_cache.resize(max_entries)
+        return _shared_cache
@@ -1,18 +1,18 @@
-import tempfile
 from moviepy import ImageClip as MoviepyImageClip
 from moviepy.video.fx import CrossFadeIn, CrossFadeOut
 
+from src.entities.editor.scratch import current_scratch
+
 
 class ImageClip:
     clip: MoviepyImageClip
 
     def __init__(self, file_path: str = None, bytes: bytes = None):
         if bytes:
-            with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmpfile:
-                tmpfile.write(bytes)
-                tmpfile.seek(0)
-                self.clip = MoviepyImageClip(tmpfile.name)
+            self.file_path = current_scratch().write_bytes(bytes, ".png")
+            self.clip = MoviepyImageClip(self.file_path)
         else:
+            self.file_path = file_path
             self.clip = MoviepyImageClip(file_path)
 
     def apply_fadein(self, duration):
@@ -0,0 +1,139 @@
+"""Flat timeline compositor.
+
+``CompositeVideoClip.playing_clips`` scans every layer on every frame, and
+wrapping a composite in another composite for each overlay multiplies that
+cost. ``LayerCompositeVideoClip`` keeps all layers of a video in a single
+flat list and indexes them by time bucket, so a frame only visits the
+layers whose ``[start, end)`` interval overlaps it.
+"""
+
+import math
+from typing import Dict, List, Sequence
+
+import numpy as np
+from moviepy import CompositeAudioClip, CompositeVideoClip
+from moviepy import VideoClip as MoviepyVideoClip
+
+
+class LayerIntervalIndex:
+    """Bucketed interval index over clip ``[start, end)`` ranges.
+
+    Each clip is registered in every fixed-width bucket its interval touches;
+    clips without an end are always candidates. Lookups return positions in
+    the original sequence, in order, so layer stacking is preserved.
+    """
+
+    def __init__(self, clips: Sequence[MoviepyVideoClip], bucket_size: float = 1.0):
+        self.bucket_size = bucket_size
+        self._buckets: Dict[int, List[int]] = {}
+        self._unbounded: List[int] = []
+
+        for position, clip in enumerate(clips):
+            if clip.end is None:
+                self._unbounded.append(position)
+                continue
+            first = self._bucket(clip.start)
+            last = self._bucket(max(clip.start, clip.end))
+            for bucket in range(first, last + 1):
+                self._buckets.setdefault(bucket, []).append(position)
+
+    def _bucket(self, t: float) -> int:
+        return int(math.floor(t / self.bucket_size))
+
+    def candidates(self, t: float) -> List[int]:
+        """Positions of clips that may be playing at *t*, in layer order."""
+        bucket = self._buckets.get(self._bucket(t), [])
+        if not self._unbounded:
+            return bucket
+        return sorted(set(bucket).union(self._unbounded))
+
+
+class LayerCompositeVideoClip(CompositeVideoClip):
+    """``CompositeVideoClip`` whose per-frame cost follows visible layers.
+
+    Accepts the same arguments as ``CompositeVideoClip``. When *use_bgclip*
+    is set, the background clip's own audio and duration are kept, matching
+    what a nested ``CompositeVideoClip([background, overlay])`` produces.
+    Use :meth:`with_layers` to stack more layers without nesting.
+    """
+
+    def __init__(
+        self,
+        clips,
+        size=None,
+        bg_color=None,
+        use_bgclip=False,
+        is_mask=False,
+        bucket_size: float = 1.0,
+    ):
+        super().__init__(
+            clips,
+            size=size,
+            bg_color=bg_color,
+            use_bgclip=use_bgclip,
+            is_mask=is_mask,
+        )
+        self.use_bgclip = use_bgclip
+        self.bucket_size = bucket_size
+        self._index = LayerIntervalIndex(self.clips, bucket_size)
+
+        if use_bgclip:
+            ends = [clip.end for clip in [self.bg, *self.clips]]
+            if None not in ends:
+                self.duration = max(ends)
+                self.end = self.duration
+            audioclips = [
+                clip.audio for clip in [self.bg, *self.clips] if clip.audio is not None
+            ]
+            if audioclips:
+                self.audio = (
+                    audioclips[0]
+                    if len(audioclips) == 1
+                    else CompositeAudioClip(audioclips)
+                )
+
+        if isinstance(self.mask, CompositeVideoClip) and not isinstance(
+            self.mask, LayerCompositeVideoClip
+        ):
+            self.mask = LayerCompositeVideoClip(
+                self.mask.clips,
+                self.size,
+                is_mask=True,
+                bg_color=0.0,
+                bucket_size=bucket_size,
+            )
+
+    def playing_clips(self, t=0):
+        if not np.isscalar(t):
+            return super().playing_clips(t)
+        return [
+            self.clips[position]
+            for position in self._index.candidates(t)
+            if self.clips[position].is_playing(t)
+        ]
+
+    def with_layers(self, layers: Sequence[MoviepyVideoClip]) -> "LayerCompositeVideoClip":
+        """Return a flat composite with *layers* stacked on top of this one."""
+        clips = [*self.clips, *layers]
+        if self.use_bgclip:
+            composite = LayerCompositeVideoClip(
+                [self.bg, *clips],
+                size=self.size,
+                use_bgclip=True,
+                bucket_size=self.bucket_size,
+            )
+        else:
+            composite = LayerCompositeVideoClip(
+                clips,
+                size=self.size,
+                bg_color=self.bg_color,
+                is_mask=self.is_mask,
+                bucket_size=self.bucket_size,
+            )
+        if self.duration is not None:
+            composite = composite.with_duration(
+                max(self.duration, composite.duration or 0)
+            )
+        if self.audio is not None:
+            composite = composite.with_audio(self.audio)
+        return composite
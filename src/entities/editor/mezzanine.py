@@ -0,0 +1,110 @@
+"""Ingest-time transcode of background clips to the render geometry.
+
+A mezzanine copy is already cropped to the output aspect ratio, scaled to
+the output size, resampled to a fixed frame rate and stored as yuv420p with
+short GOPs and decoder-friendly x264 settings. Renders that open it skip the
+per-frame rescale in ``VideoClip.resize`` and seek cheaply when looping.
+The anti-fingerprint zoom can be baked in too, so the moviepy path does not
+resize every frame again for it.
+"""
+
+import subprocess
+from typing import List
+
+from moviepy.config import FFMPEG_BINARY
+
+from src.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+
+def mezzanine_filter(width: int, height: int, fps: float, zoom: float = 1.0) -> str:
+    """Center crop to ``width/height`` then scale, like ``VideoClip.resize``.
+
+    A *zoom* above 1 also keeps only the centered ``1/zoom`` of the frame,
+    like the zoom step of ``VideoClip.apply_anti_fingerprint``.
+    """
+    ratio = width / height
+    filters = [
+        f"crop=w='trunc(min(iw,ih*{ratio:.6f}))':h='trunc(min(ih,iw/{ratio:.6f}))'"
+    ]
+    if zoom > 1.0:
+        filters.append(f"crop=w='trunc(iw/{zoom:.6f})':h='trunc(ih/{zoom:.6f})'")
+    filters.extend(
+        [
+            f"scale={width}:{height}",
+            "setsar=1",
+            f"fps={fps:g}",
+            "format=yuv420p",
+        ]
+    )
+    return ",".join(filters)
+
+
+def mezzanine_command(
+    source_path: str,
+    output_path: str,
+    width: int,
+    height: int,
+    fps: float,
+    crf: int,
+    zoom: float = 1.0,
+) -> List[str]:
+    return [
+        FFMPEG_BINARY,
+        "-y",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-i",
+        source_path,
+        "-an",
+        "-vf",
+        mezzanine_filter(width, height, fps, zoom),
+        "-c:v",
+        "libx264",
+        "-preset",
+        "veryfast",
+        "-tune",
+        "fastdecode",
+        "-crf",
+        str(crf),
+        "-g",
+        str(max(1, int(round(fps)))),
+        "-bf",
+        "0",
+        "-movflags",
+        "+faststart",
+        "-f",
+        "mp4",
+        output_path,
+    ]
+
+
+def transcode_mezzanine(
+    source_path: str,
+    output_path: str,
+    width: int,
+    height: int,
+    fps: float,
+    crf: int = 18,
+    zoom: float = 1.0,
+) -> None:
+    """Write the mezzanine copy of *source_path* to *output_path*."""
+    logger.info(
+        "Transcoding mezzanine %dx%d@%g (zoom %g) of %s",
+        width,
+        height,
+        fps,
+        zoom,
+        source_path,
+    )
+    process = subprocess.run(
+        mezzanine_command(source_path, output_path, width, height, fps, crf, zoom),
+        capture_output=True,
+    )
+    if process.returncode != 0:
+        stderr = process.stderr.decode("utf-8", errors="replace")
+        raise RuntimeError(
+            f"ffmpeg mezzanine transcode failed ({process.returncode}): {stderr[-2000:]}"
+        )
@@ -0,0 +1,81 @@
+"""Decode speech bytes to float32 PCM in memory.
+
+Whisper models take 16 kHz mono; ``AudioClip`` takes 44.1 kHz stereo for the
+render. Audio is piped through ffmpeg and back without touching the disk.
+Decoded buffers are kept in a small cache keyed by content, so the captions
+stage reuses one decode of the narration. Returned arrays are read-only.
+"""
+
+import hashlib
+import subprocess
+import threading
+from collections import OrderedDict
+
+import numpy as np
+from moviepy.config import FFMPEG_BINARY
+
+SAMPLE_RATE = 16000
+
+_CACHE_SIZE = 8
+_cache: "OrderedDict[tuple, np.ndarray]" = OrderedDict()
+_cache_lock = threading.Lock()
+
+
+def decode_pcm(
+    audio_bytes: bytes,
+    sample_rate: int = SAMPLE_RATE,
+    channels: int = 1,
+    cache: bool = True,
+) -> np.ndarray:
+    """Return *audio_bytes* as float32 samples in [-1, 1] at *sample_rate*.
+
+    Mono audio is a 1-D array, more *channels* give one column each. Pass
+    ``cache=False`` for large buffers only used once.
+    """
+    key = (hashlib.sha1(audio_bytes).digest(), sample_rate, channels)
+    if cache:
+        with _cache_lock:
+            samples = _cache.get(key)
+            if samples is not None:
+                _cache.move_to_end(key)
+                return samples
+
+    process = subprocess.run(
+        [
+            FFMPEG_BINARY,
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-i",
+            "pipe:0",
+            "-ac",
+            str(channels),
+            "-ar",
+            str(sample_rate),
+            "-f",
+            "s16le",
+            "pipe:1",
+        ],
+        input=audio_bytes,
+        capture_output=True,
+    )
+    if process.returncode != 0:
+        stderr = process.stderr.decode("utf-8", errors="replace")
+        raise RuntimeError(
+            f"ffmpeg decode failed ({process.returncode}): {stderr[-2000:]}"
+        )
+    samples = np.frombuffer(process.stdout, np.int16).astype(np.float32) / 32768.0
+    if channels > 1:
+        samples = samples.reshape(-1, channels)
+    samples.flags.writeable = False
+
+    if cache:
+        with _cache_lock:
+            _cache[key] = samples
+            while len(_cache) > _CACHE_SIZE:
+                _cache.popitem(last=False)
+    return samples
+
+
+def pcm_duration(samples: np.ndarray, sample_rate: int = SAMPLE_RATE) -> float:
+    return len(samples) / sample_rate
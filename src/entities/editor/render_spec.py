@@ -0,0 +1,81 @@
+from dataclasses import dataclass, field
+from typing import List, Optional
+
+from src.entities.captions import Captions
+from src.entities.configs.services.captions import CaptionsConfig
+from src.entities.editor.video_clip import AntiFingerprintParams
+from src.entities.image_story import ImageStory
+
+
+@dataclass
+class BackgroundSource:
+    """One downloaded background clip as it sits on disk."""
+
+    path: str
+    duration: float
+    fps: float
+    anti_fingerprint: Optional[AntiFingerprintParams] = None
+
+    @property
+    def effective_duration(self) -> float:
+        """Duration after the anti-fingerprint speed change is applied."""
+        if self.anti_fingerprint is None:
+            return self.duration
+        return self.duration / self.anti_fingerprint.speed
+
+
+@dataclass
+class VideoRenderSpec:
+    """Picklable description of a satisfying-background render.
+
+    Holds only paths, timings and plain config values, so a render backend
+    can rebuild the final video without the live moviepy objects.
+    """
+
+    audio_path: str
+    audio_duration: float
+    backgrounds: List[BackgroundSource]
+    width: int
+    height: int
+    padding: int
+    end_silence: float
+    fps: float
+    cover_path: Optional[str] = None
+    cover_duration: float = 0
+    intro_end: float = 0
+    cta_path: Optional[str] = None
+    cta_start: float = 0
+    watermark_path: Optional[str] = None
+    captions: Optional[Captions] = None
+    captions_config: Optional[CaptionsConfig] = None
+    font_path: Optional[str] = None
+    subtitles_path: Optional[str] = None
+    fonts_dir: Optional[str] = None
+    size_rate: float = 1.0
+    low_quality: bool = False
+    crossfade: float = 0.5
+    ffmpeg_params: List[str] = field(default_factory=list)
+
+    @property
+    def total_duration(self) -> float:
+        return self.audio_duration + self.end_silence
+
+
+@dataclass
+class ImageStoryRenderSpec:
+    """Picklable description of an AI-image story render.
+
+    Generated images are referenced by path so the spec stays small when it
+    is sent to a worker process.
+    """
+
+    audio_path: str
+    image_story: ImageStory
+    image_paths: List[str]
+    cover_path: Optional[str] = None
+    captions: Optional[Captions] = None
+    captions_config: Optional[CaptionsConfig] = None
+    font_path: Optional[str] = None
+    low_quality: bool = False
+    fps: float = 24
+    ffmpeg_params: List[str] = field(default_factory=list)
@@ -0,0 +1,201 @@
+"""Per-job scratch directories for the files the editor hands to ffmpeg.
+
+moviepy and ffmpeg read their inputs from paths, so the clip wrappers write
+incoming bytes (narration, covers, fonts, downloaded backgrounds) to disk.
+Those files are only needed while a job renders. A :class:`ScratchSpace`
+keeps them together in one directory, on tmpfs when there is room for it,
+stores identical inputs once by content hash, refuses to grow past its quota
+and removes everything when the job ends. Only spaces with a quota go on
+tmpfs, so nothing unbounded piles up in RAM::
+
+    with ScratchSpace(quota_bytes=2 << 30):
+        audio = AudioClip(bytes=speech_bytes)   # written to the job scratch
+        ...
+    # directory removed here
+
+Clips created outside any job use a process-wide scratch space that is
+removed at interpreter exit; it has no quota, so it lives in the temp dir.
+"""
+
+import atexit
+import contextvars
+import hashlib
+import os
+import shutil
+import tempfile
+import threading
+import uuid
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+from src.core.logging_config import get_logger
+from src.entities.configs.services.video import ScratchConfig
+
+logger = get_logger(__name__)
+
+TMPFS_ROOT = "/dev/shm"
+
+_current: contextvars.ContextVar[Optional["ScratchSpace"]] = contextvars.ContextVar(
+    "scratch_space", default=None
+)
+_fallback: Optional["ScratchSpace"] = None
+_fallback_lock = threading.Lock()
+
+
+class ScratchQuotaExceeded(RuntimeError):
+    """Raised when a write would take a scratch space past its quota."""
+
+
+def scratch_root(prefer_tmpfs: bool = True, needed_bytes: int = 0) -> str:
+    """Return tmpfs when it exists, is writable and has *needed_bytes* free."""
+    if prefer_tmpfs and os.path.isdir(TMPFS_ROOT) and os.access(TMPFS_ROOT, os.W_OK):
+        try:
+            if shutil.disk_usage(TMPFS_ROOT).free >= needed_bytes:
+                return TMPFS_ROOT
+        except OSError:
+            pass
+    return tempfile.gettempdir()
+
+
+class ScratchSpace:
+    """A job's temporary directory with content deduplication and a quota.
+
+    Entering the space with ``with`` makes it the current one for the code
+    (and the asyncio tasks and threads it starts) inside the block and
+    removes it on exit; :meth:`activate` only does the former, for spaces
+    that outlive a single block.
+    """
+
+    def __init__(
+        self,
+        root: Optional[str] = None,
+        quota_bytes: Optional[int] = None,
+        prefer_tmpfs: bool = True,
+    ):
+        base = root or scratch_root(
+            prefer_tmpfs and quota_bytes is not None, quota_bytes or 0
+        )
+        os.makedirs(base, exist_ok=True)
+        self.path = tempfile.mkdtemp(prefix="job-", dir=base)
+        self.quota_bytes = quota_bytes
+        self.used_bytes = 0
+        self.deduplicated = 0
+        self._files: Dict[Tuple[str, str], str] = {}
+        # path -> (size, number of writers still using it)
+        self._refs: Dict[str, Tuple[int, int]] = {}
+        self._lock = threading.Lock()
+        self._tokens = []
+
+    @classmethod
+    def from_config(cls, config: ScratchConfig) -> "ScratchSpace":
+        """Scratch space with the root, quota and tmpfs choice of *config*."""
+        return cls(
+            root=config.root,
+            quota_bytes=config.quota_mb * 1024 * 1024 if config.quota_mb > 0 else None,
+            prefer_tmpfs=config.prefer_tmpfs,
+        )
+
+    def write_bytes(
+        self, data: bytes, suffix: str = "", name: Optional[str] = None
+    ) -> str:
+        """Store *data* and return its path, reusing an identical earlier write.
+
+        With *name* the file is written under that name in a directory of
+        its own, for tools that take a directory (like libass ``fontsdir``).
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        key = (digest, name or suffix)
+        with self._lock:
+            path = self._files.get(key)
+            if path is not None and os.path.exists(path):
+                self.deduplicated += 1
+                size, refs = self._refs.get(path, (0, 0))
+                self._refs[path] = (size, refs + 1)
+                return path
+            self._reserve(len(data))
+            os.makedirs(self.path, exist_ok=True)
+            if name:
+                directory = os.path.join(self.path, digest[:16])
+                os.makedirs(directory, exist_ok=True)
+                path = os.path.join(directory, name)
+            else:
+                path = os.path.join(self.path, f"{digest[:32]}{suffix}")
+            with open(path, "wb") as f:
+                f.write(data)
+            self._files[key] = path
+            self._refs[path] = (len(data), 1)
+            return path
+
+    def release(self, path: str) -> None:
+        """Give back a :meth:`write_bytes` file; removed once no writer uses it."""
+        with self._lock:
+            if path not in self._refs:
+                return
+            size, refs = self._refs[path]
+            if refs > 1:
+                self._refs[path] = (size, refs - 1)
+                return
+            del self._refs[path]
+            for key, stored in list(self._files.items()):
+                if stored == path:
+                    del self._files[key]
+            self.used_bytes -= size
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+    def new_path(self, suffix: str = "") -> str:
+        """Return a fresh path in the scratch directory for a file to be written."""
+        os.makedirs(self.path, exist_ok=True)
+        return os.path.join(self.path, f"{uuid.uuid4().hex}{suffix}")
+
+    def _reserve(self, size: int) -> None:
+        if self.quota_bytes is not None and self.used_bytes + size > self.quota_bytes:
+            raise ScratchQuotaExceeded(
+                f"Scratch space {self.path} would exceed its quota of "
+                f"{self.quota_bytes} bytes ({self.used_bytes} used, {size} requested)"
+            )
+        self.used_bytes += size
+
+    @contextmanager
+    def activate(self) -> Iterator["ScratchSpace"]:
+        token = _current.set(self)
+        try:
+            yield self
+        finally:
+            _current.reset(token)
+
+    def cleanup(self) -> None:
+        with self._lock:
+            self._files.clear()
+            self._refs.clear()
+            self.used_bytes = 0
+        shutil.rmtree(self.path, ignore_errors=True)
+
+    def __enter__(self) -> "ScratchSpace":
+        self._tokens.append(_current.set(self))
+        return self
+
+    def __exit__(self, *exc) -> None:
+        _current.reset(self._tokens.pop())
+        logger.debug(
+            "Removing scratch %s (%d bytes, %d deduplicated writes)",
+            self.path,
+            self.used_bytes,
+            self.deduplicated,
+        )
+        self.cleanup()
+
+
+def current_scratch() -> ScratchSpace:
+    """Return the active job's scratch space, or the process-wide one."""
+    scratch = _current.get()
+    if scratch is not None:
+        return scratch
+    global _fallback
+    with _fallback_lock:
+        if _fallback is None:
+            _fallback = ScratchSpace()
+            atexit.register(_fallback.cleanup)
+        return _fallback
@@ -0,0 +1,109 @@
+"""Helpers to render a timeline in GOP-aligned pieces and join them losslessly.
+
+Each piece is encoded as a closed, fixed-length GOP stream, so the concat
+demuxer can stitch the pieces together with ``-c copy`` and the audio track
+is encoded once over the whole timeline.
+"""
+
+import math
+import os
+import subprocess
+import tempfile
+from typing import List, Tuple
+
+from moviepy.config import FFMPEG_BINARY
+
+from src.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+SEGMENT_GOP_SECONDS = 2
+
+
+def gop_frames(fps: float) -> int:
+    return max(1, int(round(fps * SEGMENT_GOP_SECONDS)))
+
+
+def plan_segments(total_frames: int, segments: int, gop: int) -> List[Tuple[int, int]]:
+    """Split ``[0, total_frames)`` into at most *segments* GOP-aligned ranges."""
+    if total_frames <= 0:
+        return []
+    segments = max(1, segments)
+    gops = math.ceil(total_frames / gop)
+    gops_per_segment = math.ceil(gops / segments)
+    step = gops_per_segment * gop
+
+    ranges = []
+    for start in range(0, total_frames, step):
+        ranges.append((start, min(start + step, total_frames)))
+    return ranges
+
+
+def segment_encoder_params(gop: int) -> List[str]:
+    """x264 options that make every segment start on its own closed GOP."""
+    return [
+        "-g",
+        str(gop),
+        "-keyint_min",
+        str(gop),
+        "-sc_threshold",
+        "0",
+        "-flags",
+        "+cgop",
+    ]
+
+
+def concat_segments(
+    segment_paths: List[str],
+    output_path: str,
+    audio_path: str,
+    end_silence: float,
+    total_duration: float,
+) -> None:
+    """Join *segment_paths* with stream copy and mux the padded audio once."""
+    with tempfile.NamedTemporaryFile(
+        "w", suffix=".txt", delete=False, encoding="utf-8"
+    ) as listing:
+        for path in segment_paths:
+            escaped = os.path.abspath(path).replace("'", "'\\''")
+            listing.write(f"file '{escaped}'\n")
+        listing_path = listing.name
+
+    command = [
+        FFMPEG_BINARY,
+        "-y",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-f",
+        "concat",
+        "-safe",
+        "0",
+        "-i",
+        listing_path,
+        "-i",
+        audio_path,
+        "-map",
+        "0:v:0",
+        "-map",
+        "1:a:0",
+        "-c:v",
+        "copy",
+        "-af",
+        f"apad=pad_dur={end_silence:.3f},atrim=duration={total_duration:.3f}",
+        "-c:a",
+        "libmp3lame",
+        "-t",
+        f"{total_duration:.3f}",
+        output_path,
+    ]
+    logger.info("Joining %d rendered segments into %s", len(segment_paths), output_path)
+    try:
+        process = subprocess.run(command, capture_output=True)
+    finally:
+        os.unlink(listing_path)
+    if process.returncode != 0:
+        stderr = process.stderr.decode("utf-8", errors="replace")
+        raise RuntimeError(
+            f"ffmpeg concat failed ({process.returncode}): {stderr[-2000:]}"
+        )
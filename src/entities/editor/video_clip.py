@@ -1,12 +1,12 @@
 import random
-import tempfile
+from dataclasses import dataclass
+from typing import List, Optional
 
 import numpy as np
 from moviepy import (
     VideoClip as MoviepyVideoClip,
     VideoFileClip,
     concatenate_videoclips,
-    CompositeVideoClip,
 )
 from moviepy.video.fx import (
     LumContrast,
@@ -17,23 +17,79 @@ from moviepy.video.fx import (
 from PIL import Image
 
 from src.entities.editor.captions_clip import CaptionsClip
+from src.entities.editor.ffmpeg_filters import escape_filter_value
+from src.entities.editor.layer_compositor import LayerCompositeVideoClip
+from src.entities.editor.scratch import ScratchSpace, current_scratch
 from src.entities.configs.services.video import AntiFingerprintConfig
 
 
+@dataclass
+class AntiFingerprintParams:
+    """Concrete jitter values sampled from an ``AntiFingerprintConfig``.
+
+    Sampling once and keeping the values around lets every render backend
+    apply exactly the same transform to a given background clip.
+    """
+
+    zoom: float = 1.0
+    mirror: bool = False
+    brightness: float = 1.0
+    contrast: float = 0.0
+    speed: float = 1.0
+    hue_shift: float = 0.0
+
+    @classmethod
+    def sample(cls, config: AntiFingerprintConfig) -> "AntiFingerprintParams":
+        params = cls(zoom=config.zoom, mirror=config.mirror)
+        if config.brightness_delta > 0:
+            params.brightness = 1.0 + random.uniform(
+                -config.brightness_delta, config.brightness_delta
+            )
+        if config.contrast_delta > 0:
+            params.contrast = random.uniform(
+                -config.contrast_delta, config.contrast_delta
+            )
+        if config.speed_delta > 0:
+            params.speed = 1.0 + random.uniform(
+                -config.speed_delta, config.speed_delta
+            )
+        if config.hue_shift_degrees > 0:
+            params.hue_shift = random.uniform(
+                -config.hue_shift_degrees, config.hue_shift_degrees
+            )
+        return params
+
+
 class VideoClip:
     clip: MoviepyVideoClip
+    file_path: Optional[str] = None
+    anti_fingerprint_params: Optional[AntiFingerprintParams] = None
+    # Zoom already baked into the file by the mezzanine transcode.
+    baked_zoom: float = 1.0
+    subtitles_path: Optional[str] = None
+    fonts_dir: Optional[str] = None
+    # Scratch space holding ``file_path`` when the clip was built from bytes.
+    _scratch: Optional[ScratchSpace] = None
 
     def __init__(self, file_path=None, audio_clip=None, bytes=None):
+        self._scratch = current_scratch() if bytes else None
         if bytes:
-            with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as tmpfile:
-                tmpfile.write(bytes)
-                tmpfile.seek(0)
-                self.clip = VideoFileClip(tmpfile.name)
+            self.file_path = self._scratch.write_bytes(bytes, ".mp4")
+            self.clip = VideoFileClip(self.file_path)
         else:
+            self.file_path = file_path
             self.clip = None if file_path == None else VideoFileClip(file_path)
             if audio_clip:
                 self.set_audio(audio_clip)
 
+    def close(self) -> None:
+        """Close the ffmpeg reader and drop the scratch copy of downloaded bytes."""
+        if self.clip is not None:
+            self.clip.close()
+        if self._scratch is not None:
+            self._scratch.release(self.file_path)
+            self._scratch = None
+
     def set_audio(self, audio_clip):
         self.audio_clip = audio_clip
         self.clip = self.clip.with_audio(audio_clip.clip)
@@ -45,12 +101,78 @@ class VideoClip:
             self.clip = concatenate_videoclips([self.clip, video_clip.clip])
 
     def merge(self, video_clip):
-        self.clip = CompositeVideoClip([self.clip, video_clip.clip])
+        self.add_layers([video_clip.clip])
 
     def insert_captions(self, captions: CaptionsClip, size_rate: float = 1.0):
-        self.clip = CompositeVideoClip([self.clip, *captions.get_clips(size_rate)])
+        self.add_layers(captions.get_clips(size_rate))
+
+    def add_layers(self, layers):
+        """Stack *layers* on top of the clip in a single flat composite.
+
+        Repeated calls extend the same ``LayerCompositeVideoClip`` instead of
+        nesting composites, so each frame only blends the visible layers.
+        """
+        if isinstance(self.clip, LayerCompositeVideoClip):
+            self.clip = self.clip.with_layers(layers)
+        else:
+            self.clip = LayerCompositeVideoClip([self.clip, *layers], use_bgclip=True)
+
+    def burn_subtitles(self, subtitles_path: str, fonts_dir: Optional[str] = None):
+        """Burn the ASS track at *subtitles_path* in when the clip is written."""
+        self.subtitles_path = subtitles_path
+        self.fonts_dir = fonts_dir
+
+    def write_videofile(self, path: str, ffmpeg_params: Optional[List[str]] = None, **kwargs):
+        """``write_videofile`` on the moviepy clip, adding the subtitles filter.
+
+        The filter runs in the same ffmpeg process that encodes the frames
+        piped by moviepy, so burning captions costs no extra encode pass.
+        """
+        params = self._with_subtitles_filter(list(ffmpeg_params or []))
+        self.clip.write_videofile(path, ffmpeg_params=params or None, **kwargs)
+
+    def write_frame_range(
+        self,
+        path: str,
+        fps: float,
+        start_frame: int,
+        end_frame: int,
+        ffmpeg_params: Optional[List[str]] = None,
+        **kwargs,
+    ):
+        """Write frames ``[start_frame, end_frame)`` as a standalone video-only file.
+
+        Frame ``k`` of the output is frame ``start_frame + k`` of a single-pass
+        render at *fps*, so consecutive ranges join back into the same stream.
+        """
+        start = start_frame / fps
+        count = end_frame - start_frame
+        # Half a frame of slack keeps int(duration * fps) == count despite rounding.
+        segment = self.clip.subclipped(start).with_duration((count + 0.5) / fps)
+        params = self._with_subtitles_filter(list(ffmpeg_params or []), offset=start)
+        segment.write_videofile(
+            path, fps=fps, audio=False, ffmpeg_params=params or None, **kwargs
+        )
+
+    def _with_subtitles_filter(self, params: List[str], offset: float = 0) -> List[str]:
+        if not self.subtitles_path:
+            return params
+        subtitles = f"subtitles=filename={escape_filter_value(self.subtitles_path)}"
+        if self.fonts_dir:
+            subtitles += f":fontsdir={escape_filter_value(self.fonts_dir)}"
+        if offset > 0:
+            # Shift timestamps so the ASS events line up with the full timeline.
+            subtitles = f"setpts=PTS+{offset:.6f}/TB,{subtitles},setpts=PTS-STARTPTS"
+        if "-vf" in params:
+            idx = params.index("-vf") + 1
+            params[idx] = f"{params[idx]},{subtitles}"
+        else:
+            params.extend(["-vf", subtitles])
+        return params
 
     def resize(self, width, height):
+        if tuple(self.clip.size) == (width, height):
+            return
         original_aspect_ratio = self.clip.size[0] / self.clip.size[1]
         desired_aspect_ratio = width / height
         if original_aspect_ratio > desired_aspect_ratio:
@@ -67,51 +189,56 @@ class VideoClip:
         video_duration = self.clip.duration
         if duration > video_duration:
             repeats = int(-(-duration // video_duration))
-            self.clip = self.clip * repeats
+            self.clip = (self.clip * repeats).subclipped(0, duration)
         elif duration < video_duration:
             self.clip = self.clip.subclipped(0, duration)
 
-    def apply_anti_fingerprint(self, config: AntiFingerprintConfig) -> None:
+    def apply_anti_fingerprint(
+        self,
+        config: AntiFingerprintConfig,
+        params: Optional[AntiFingerprintParams] = None,
+    ) -> None:
         """Apply randomized geometric/color/speed jitter to evade fingerprinting.
 
         Should be called before the clip's audio is replaced. Speed changes
         also rescale the audio track, but the pipeline replaces audio with
         the TTS narration further downstream, so any pitch shift is dropped.
+        Pass *params* to replay a previously sampled transform; the values
+        actually applied are kept in ``anti_fingerprint_params``. Freshly
+        sampled params skip the zoom when ``baked_zoom`` already covers it.
         """
         if not config.enabled or self.clip is None:
             return
 
-        if config.zoom > 1.0:
+        if params is None:
+            params = AntiFingerprintParams.sample(config)
+            if self.baked_zoom >= params.zoom:
+                params.zoom = 1.0
+        self.anti_fingerprint_params = params
+
+        if params.zoom > 1.0:
             ow, oh = self.clip.size
-            zoomed = self.clip.resized(config.zoom)
+            zoomed = self.clip.resized(params.zoom)
             zw, zh = zoomed.size
             x1 = (zw - ow) // 2
             y1 = (zh - oh) // 2
             self.clip = zoomed.cropped(x1=x1, y1=y1, x2=x1 + ow, y2=y1 + oh)
 
         effects = []
-        if config.mirror:
+        if params.mirror:
             effects.append(MirrorX())
-        if config.brightness_delta > 0:
-            factor = 1.0 + random.uniform(
-                -config.brightness_delta, config.brightness_delta
-            )
-            effects.append(MultiplyColor(factor))
-        if config.contrast_delta > 0:
-            contrast = random.uniform(-config.contrast_delta, config.contrast_delta)
-            effects.append(LumContrast(contrast=contrast))
-        if config.speed_delta > 0:
-            speed = 1.0 + random.uniform(-config.speed_delta, config.speed_delta)
-            effects.append(MultiplySpeed(speed))
+        if params.brightness != 1.0:
+            effects.append(MultiplyColor(params.brightness))
+        if params.contrast != 0:
+            effects.append(LumContrast(contrast=params.contrast))
+        if params.speed != 1.0:
+            effects.append(MultiplySpeed(params.speed))
 
         if effects:
             self.clip = self.clip.with_effects(effects)
 
-        if config.hue_shift_degrees > 0:
-            shift = random.uniform(
-                -config.hue_shift_degrees, config.hue_shift_degrees
-            )
-            self.clip = _apply_hue_shift(self.clip, shift)
+        if params.hue_shift != 0:
+            self.clip = _apply_hue_shift(self.clip, params.hue_shift)
 
 
 def _apply_hue_shift(clip: MoviepyVideoClip, degrees: float) -> MoviepyVideoClip:
@@ -0,0 +1,10 @@
+from typing import List, Optional
+from pydantic import BaseModel
+
+from src.entities.transcription import TranscriptionWord
+
+
+class SynthesizedSpeech(BaseModel):
+    audio: bytes
+    # Word timings reported by the provider while synthesizing, if it has them.
+    words: Optional[List[TranscriptionWord]] = None
@@ -0,0 +1,13 @@
+from typing import Literal, Optional
+from pydantic import BaseModel
+
+
+class YouTubeVideoMetadata(BaseModel):
+    video_id: str
+    duration: float
+    width: Optional[int] = None
+    height: Optional[int] = None
+    fps: Optional[float] = None
+    # "listing": channel page or watch page data, "probe": read from the file
+    source: Literal["listing", "probe"] = "listing"
+    updated_at: float = 0
@@ -0,0 +1,91 @@
+"""Transcription proxy wrapper that remembers results by audio content.
+
+Results are keyed by the SHA-256 of the audio bytes, the wrapped backend's
+``model_identity`` and the requested language, so retries, bot edits and
+re-renders of the same narration skip speech recognition. Entries are
+gzipped JSON with each word stored as a ``[word, start, end, probability]``
+row and times rounded to milliseconds.
+"""
+
+import gzip
+import hashlib
+import json
+from typing import Optional
+
+from src.core.disk_cache import DiskCache
+from src.entities.language import Language
+from src.entities.transcription import TranscriptionResult, TranscriptionWord
+from src.proxies.interfaces import ITranscriptionProxy
+
+
+def encode_transcription(result: TranscriptionResult) -> bytes:
+    payload = {
+        "text": result.text,
+        "language": result.language,
+        "words": [
+            [
+                w.word,
+                round(w.start, 3),
+                round(w.end, 3),
+                None if w.probability is None else round(w.probability, 3),
+            ]
+            for w in result.words
+        ],
+    }
+    encoded = json.dumps(payload, ensure_ascii=False, separators=(",", ":"))
+    return gzip.compress(encoded.encode("utf-8"))
+
+
+def decode_transcription(data: bytes) -> TranscriptionResult:
+    payload = json.loads(gzip.decompress(data))
+    return TranscriptionResult(
+        text=payload["text"],
+        language=payload["language"],
+        words=[
+            TranscriptionWord(word=word, start=start, end=end, probability=probability)
+            for word, start, end, probability in payload["words"]
+        ],
+    )
+
+
+class CachedTranscriptionProxy(ITranscriptionProxy):
+    def __init__(self, proxy: ITranscriptionProxy, cache: DiskCache):
+        self.proxy = proxy
+        self.cache = cache
+
+    @property
+    def model_identity(self) -> str:
+        return self.proxy.model_identity
+
+    def key(self, audio_bytes: bytes, language: Optional[Language] = None) -> str:
+        return DiskCache.make_key(
+            hashlib.sha256(audio_bytes).hexdigest(),
+            self.proxy.model_identity,
+            language.value if language else None,
+        )
+
+    def transcribe(
+        self, audio_bytes: bytes, language: Optional[Language] = None
+    ) -> TranscriptionResult:
+        key = self.key(audio_bytes, language)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+        result = self.proxy.transcribe(audio_bytes, language)
+        self.cache.put(key, encode_transcription(result))
+        return result
+
+    async def transcribe_async(
+        self, audio_bytes: bytes, language: Optional[Language] = None
+    ) -> TranscriptionResult:
+        key = self.key(audio_bytes, language)
+        cached = self._cached(key)
+        if cached is not None:
+            return cached
+        result = await self.proxy.transcribe_async(audio_bytes, language)
+        self.cache.put(key, encode_transcription(result))
+        return result
+
+    def _cached(self, key: str) -> Optional[TranscriptionResult]:
+        data = self.cache.get(key)
+        return decode_transcription(data) if data is not None else None
@@ -0,0 +1,237 @@
+"""Fetch a time window of a DASH (fragmented) MP4 with HTTP range requests.
+
+YouTube's adaptive streams are laid out as ``ftyp``, ``moov``, a single
+``sidx`` segment index and then one ``moof``/``mdat`` pair per segment. The
+index gives the byte size and duration of every segment, so the bytes
+covering a time window can be requested directly instead of downloading
+the whole stream. The init boxes plus the selected segments form a valid
+fragmented MP4, which is remuxed with ``-c copy`` so timestamps start at
+zero and the container reports the trimmed duration.
+"""
+
+import os
+import struct
+import subprocess
+import tempfile
+import urllib.request
+from dataclasses import dataclass
+from typing import Callable, Iterator, List, Optional, Tuple
+
+from moviepy.config import FFMPEG_BINARY
+
+from src.core.logging_config import get_logger
+
+logger = get_logger(__name__)
+
+# Fetch ``(first, last)`` inclusive byte range and return the bytes.
+RangeFetcher = Callable[[int, int], bytes]
+
+HEAD_BYTES = 64 * 1024
+
+
+@dataclass
+class SegmentReference:
+    offset: int
+    size: int
+    start: float
+    duration: float
+
+
+@dataclass
+class SegmentIndex:
+    init: bytes
+    references: List[SegmentReference]
+
+    @property
+    def duration(self) -> float:
+        return sum(reference.duration for reference in self.references)
+
+
+def http_range_fetcher(url: str, timeout: float = 30) -> RangeFetcher:
+    def fetch(first: int, last: int) -> bytes:
+        request = urllib.request.Request(
+            url, headers={"Range": f"bytes={first}-{last}"}
+        )
+        with urllib.request.urlopen(request, timeout=timeout) as response:
+            if response.status != 206:
+                raise ValueError(
+                    f"Server ignored the range request ({response.status})"
+                )
+            return response.read()
+
+    return fetch
+
+
+def iter_boxes(data: bytes, offset: int = 0) -> Iterator[Tuple[bytes, int, int, int]]:
+    """Yield ``(type, start, size, header_size)`` of the top-level boxes in *data*.
+
+    A box is yielded as soon as its header is in *data*, even when its body
+    extends past the end, so callers can fetch the rest.
+    """
+    position = offset
+    while position + 8 <= len(data):
+        size, box_type = struct.unpack(">I4s", data[position : position + 8])
+        header = 8
+        if size == 1:
+            if position + 16 > len(data):
+                return
+            size = struct.unpack(">Q", data[position + 8 : position + 16])[0]
+            header = 16
+        elif size == 0:
+            return
+        yield box_type, position, size, header
+        position += size
+
+
+def parse_sidx(
+    data: bytes, box_start: int, box_size: int, header: int
+) -> List[SegmentReference]:
+    """Parse the ``sidx`` box at *box_start* of *data* into absolute references."""
+    body = box_start + header
+    version = data[body]
+    position = body + 4
+    _, timescale = struct.unpack(">II", data[position : position + 8])
+    position += 8
+    if version == 0:
+        earliest, first_offset = struct.unpack(">II", data[position : position + 8])
+        position += 8
+    else:
+        earliest, first_offset = struct.unpack(">QQ", data[position : position + 16])
+        position += 16
+    reference_count = struct.unpack(">H", data[position + 2 : position + 4])[0]
+    position += 4
+
+    references = []
+    offset = box_start + box_size + first_offset
+    start = earliest / timescale
+    for _ in range(reference_count):
+        size_field, duration, _ = struct.unpack(">III", data[position : position + 12])
+        position += 12
+        if size_field >> 31:
+            raise ValueError("Hierarchical segment indexes are not supported")
+        size = size_field & 0x7FFFFFFF
+        references.append(
+            SegmentReference(
+                offset=offset, size=size, start=start, duration=duration / timescale
+            )
+        )
+        offset += size
+        start += duration / timescale
+    return references
+
+
+def read_segment_index(fetch: RangeFetcher) -> Optional[SegmentIndex]:
+    """Read the init boxes and ``sidx`` of a stream, or ``None`` if it has none."""
+    data = b""
+    complete = False
+
+    def read_to(last: int) -> None:
+        nonlocal data, complete
+        data += fetch(len(data), last)
+        complete = len(data) <= last
+
+    read_to(HEAD_BYTES - 1)
+    init_end = None
+    position = 0
+    while True:
+        box = next(iter_boxes(data, position), None)
+        if box is None:
+            if complete:
+                return None
+            read_to(len(data) + HEAD_BYTES - 1)
+            continue
+
+        box_type, start, size, header = box
+        if box_type in (b"moof", b"mdat"):
+            return None
+        if start + size > len(data):
+            read_to(start + size - 1)
+            if complete:
+                return None
+        if box_type == b"moov":
+            init_end = start + size
+        elif box_type == b"sidx":
+            if init_end is None:
+                return None
+            return SegmentIndex(
+                init=data[:init_end],
+                references=parse_sidx(data, start, size, header),
+            )
+        position = start + size
+
+
+def select_references(
+    references: List[SegmentReference], start: float, duration: float
+) -> List[SegmentReference]:
+    """Return the contiguous segments overlapping ``[start, start + duration)``."""
+    end = start + duration
+    first = references[0].start if references else 0
+    return [
+        reference
+        for reference in references
+        if reference.start - first < end
+        and reference.start - first + reference.duration > start
+    ]
+
+
+def download_time_range(
+    fetch: RangeFetcher, start: float, duration: float, output_path: str
+) -> Optional[float]:
+    """Write the segments covering the window to *output_path* as a regular MP4.
+
+    Returns the duration of the written clip, or ``None`` when the stream
+    has no usable segment index, so callers can fall back to a full download.
+    The window is widened to segment boundaries, which are keyframes.
+    """
+    index = read_segment_index(fetch)
+    if index is None or not index.references:
+        return None
+    selected = select_references(index.references, start, duration)
+    if not selected:
+        return None
+
+    first, last = selected[0], selected[-1]
+    logger.info(
+        "Fetching %d of %d segments (%d bytes) for %.1fs at %.1fs",
+        len(selected),
+        len(index.references),
+        last.offset + last.size - first.offset,
+        duration,
+        start,
+    )
+    media = fetch(first.offset, last.offset + last.size - 1)
+
+    fd, fragmented_path = tempfile.mkstemp(suffix=".mp4")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(index.init)
+            f.write(media)
+        process = subprocess.run(
+            [
+                FFMPEG_BINARY,
+                "-y",
+                "-hide_banner",
+                "-loglevel",
+                "error",
+                "-i",
+                fragmented_path,
+                "-c",
+                "copy",
+                "-avoid_negative_ts",
+                "make_zero",
+                "-movflags",
+                "+faststart",
+                "-f",
+                "mp4",
+                output_path,
+            ],
+            capture_output=True,
+        )
+    finally:
+        os.unlink(fragmented_path)
+    if process.returncode != 0:
+        stderr = process.stderr.decode("utf-8", errors="replace")
+        raise RuntimeError(
+            f"ffmpeg remux failed ({process.returncode}): {stderr[-2000:]}"
+        )
+    return sum(reference.duration for reference in selected)
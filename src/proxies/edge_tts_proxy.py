@@ -2,6 +2,8 @@ from typing import Literal, Optional
 from src.proxies.interfaces import ISpeechProxy
 from src.entities.configs.proxies.speech import EdgeTTSSpeechConfig
 from src.entities.language import Language
+from src.entities.synthesized_speech import SynthesizedSpeech
+from src.entities.transcription import TranscriptionWord
 from src.core.logging_config import get_logger
 
 
@@ -36,6 +38,19 @@ class EdgeTTSSpeechProxy(ISpeechProxy):
             else voice_config.female_voice_id
         )
 
+    @property
+    def max_concurrent_requests(self) -> int:
+        return self.config.max_concurrent_requests
+
+    def voice_identity(
+        self,
+        gender: Literal["male", "female"] = "male",
+        language: Language = Language.PORTUGUESE,
+        override_voice_id: Optional[str] = None,
+    ) -> str:
+        voice_id = self._get_voice_id(gender, language, override_voice_id)
+        return f"edge-tts:{voice_id}:{self.config.default_rate}"
+
     async def generate_speech(
         self,
         text: str,
@@ -44,6 +59,23 @@ class EdgeTTSSpeechProxy(ISpeechProxy):
         language: Language = Language.PORTUGUESE,
         override_voice_id: Optional[str] = None,
     ) -> bytes:
+        speech = await self.generate_speech_with_words(
+            text=text,
+            gender=gender,
+            rate=rate,
+            language=language,
+            override_voice_id=override_voice_id,
+        )
+        return speech.audio
+
+    async def generate_speech_with_words(
+        self,
+        text: str,
+        gender: Literal["male", "female"] = "male",
+        rate: float = 1.0,
+        language: Language = Language.PORTUGUESE,
+        override_voice_id: Optional[str] = None,
+    ) -> SynthesizedSpeech:
         import edge_tts
 
         voice_id = self._get_voice_id(gender, language, override_voice_id)
@@ -54,14 +86,24 @@ class EdgeTTSSpeechProxy(ISpeechProxy):
         rate_percent = int((effective_rate - 1.0) * 100)
         rate_str = f"+{rate_percent}%" if rate_percent >= 0 else f"{rate_percent}%"
 
-        communicate = edge_tts.Communicate(text=text, voice=voice_id, rate=rate_str)
+        communicate = edge_tts.Communicate(
+            text=text, voice=voice_id, rate=rate_str, boundary="WordBoundary"
+        )
 
         audio_data = bytearray()
+        words = []
         async for chunk in communicate.stream():
             if chunk["type"] == "audio":
                 audio_data.extend(chunk["data"])
+            elif chunk["type"] == "WordBoundary":
+                # Offsets and durations are in 100-nanosecond ticks.
+                start = chunk["offset"] / 10_000_000
+                end = start + chunk["duration"] / 10_000_000
+                words.append(
+                    TranscriptionWord(word=chunk["text"], start=start, end=end)
+                )
 
-        return bytes(audio_data)
+        return SynthesizedSpeech(audio=bytes(audio_data), words=words or None)
 
     def list_voices(self) -> list:
         from src.entities.speech_voice import SpeechVoice
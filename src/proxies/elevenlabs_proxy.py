@@ -1,5 +1,5 @@
-import requests
 from typing import Literal, Optional
+from src.proxies.http_client import AsyncHTTPClient, shared_http_client
 from src.proxies.interfaces import ISpeechProxy
 from src.entities.configs.proxies.speech import ElevenLabsSpeechConfig
 from src.entities.language import Language
@@ -7,10 +7,17 @@ from src.core.logging_config import get_logger
 
 
 class ElevenLabsSpeechProxy(ISpeechProxy):
-    def __init__(self, config: ElevenLabsSpeechConfig):
+    MODEL_ID = "eleven_multilingual_v2"
+
+    def __init__(
+        self,
+        config: ElevenLabsSpeechConfig,
+        http_client: Optional[AsyncHTTPClient] = None,
+    ):
         self.logger = get_logger(__name__)
         self.config = config
         self.api_key = config.api_key
+        self.http_client = http_client or shared_http_client()
 
         if not self.api_key:
             raise ValueError("ElevenLabs API key is not set")
@@ -35,6 +42,19 @@ class ElevenLabsSpeechProxy(ISpeechProxy):
             else voice_config.female_voice_id
         )
 
+    @property
+    def max_concurrent_requests(self) -> int:
+        return self.config.max_concurrent_requests
+
+    def voice_identity(
+        self,
+        gender: Literal["male", "female"] = "male",
+        language: Language = Language.PORTUGUESE,
+        override_voice_id: Optional[str] = None,
+    ) -> str:
+        voice_id = self._get_voice_id(gender, language, override_voice_id)
+        return f"elevenlabs:{voice_id}:{self.MODEL_ID}"
+
     async def generate_speech(
         self,
         text: str,
@@ -56,7 +76,7 @@ class ElevenLabsSpeechProxy(ISpeechProxy):
 
         data = {
             "text": text,
-            "model_id": "eleven_multilingual_v2",
+            "model_id": self.MODEL_ID,
             "voice_settings": {
                 "stability": 0.5,
                 "similarity_boost": 0.5,
@@ -66,14 +86,14 @@ class ElevenLabsSpeechProxy(ISpeechProxy):
             },
         }
 
-        response = requests.post(url, json=data, headers=headers)
+        response = await self.http_client.post(url, json_body=data, headers=headers)
 
-        if response.status_code != 200:
+        if response.status != 200:
             raise Exception(
-                f"ElevenLabs API Error: {response.status_code} - {response.text}"
+                f"ElevenLabs API Error: {response.status} - {response.text}"
             )
 
-        return response.content
+        return response.body
 
     def list_voices(self) -> list:
         from src.entities.speech_voice import SpeechVoice
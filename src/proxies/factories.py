@@ -1,3 +1,5 @@
+from typing import Optional
+
 from src.entities.configs.proxies.image_generation import (
     ImageGenerationConfigType,
     LeonardoImageGenerationConfig,
@@ -18,10 +20,12 @@ from src.proxies.mock_image_proxy import MockImageGeneratorProxy
 from src.entities.configs.proxies.transcription import (
     TranscriptionConfigType,
     LocalTranscriptionConfig,
+    FasterWhisperTranscriptionConfig,
     OpenAITranscriptionConfig,
 )
 from src.proxies.local_whisper_proxy import LocalWhisperProxy
 from src.proxies.openai_whisper_proxy import OpenAIWhisperProxy
+from src.proxies.http_client import AsyncHTTPClient
 from src.entities.configs.proxies.speech import (
     SpeechConfigType,
     EdgeTTSSpeechConfig,
@@ -107,25 +111,35 @@ class ImageGeneratorFactory:
 class TranscriptionProxyFactory:
     @staticmethod
     def create(
-        config: TranscriptionConfigType, openai_api_key: str = None
+        config: TranscriptionConfigType,
+        openai_api_key: str = None,
+        http_client: Optional[AsyncHTTPClient] = None,
     ) -> ITranscriptionProxy:
         if isinstance(config, LocalTranscriptionConfig):
             return LocalWhisperProxy(config=config)
+        elif isinstance(config, FasterWhisperTranscriptionConfig):
+            # Imported on use so configs without this backend don't need
+            # faster-whisper and its CTranslate2 runtime installed.
+            from src.proxies.faster_whisper_proxy import FasterWhisperProxy
+
+            return FasterWhisperProxy(config=config)
         elif isinstance(config, OpenAITranscriptionConfig):
             config.api_key = openai_api_key
-            return OpenAIWhisperProxy(config=config)
+            return OpenAIWhisperProxy(config=config, http_client=http_client)
 
 
 class SpeechProxyFactory:
     @staticmethod
     def create(
-        config: SpeechConfigType, elevenlabs_api_key: str = None
+        config: SpeechConfigType,
+        elevenlabs_api_key: str = None,
+        http_client: Optional[AsyncHTTPClient] = None,
     ) -> ISpeechProxy:
         if isinstance(config, EdgeTTSSpeechConfig):
             return EdgeTTSSpeechProxy(config=config)
         elif isinstance(config, ElevenLabsSpeechConfig):
             config.api_key = elevenlabs_api_key
-            return ElevenLabsSpeechProxy(config=config)
+            return ElevenLabsSpeechProxy(config=config, http_client=http_client)
         else:
             raise ValueError(f"Unknown Speech Configuration: {type(config)}")
 
@@ -0,0 +1,105 @@
+"""CPU transcription with faster-whisper (CTranslate2, int8-quantized Whisper).
+
+The model is loaded once with ``workers`` CTranslate2 workers, so that many
+transcriptions run in parallel from separate threads inside this process;
+the event loop awaits them on a thread. Silero VAD drops silent stretches
+before decoding. Audio is decoded to 16 kHz PCM in memory like the local
+Whisper proxy, and the result has the same ``TranscriptionResult`` shape.
+"""
+
+import asyncio
+import os
+from typing import Optional
+
+import numpy as np
+from faster_whisper import WhisperModel
+
+from src.core.logging_config import get_logger
+from src.entities.configs.proxies.transcription import (
+    FasterWhisperTranscriptionConfig,
+)
+from src.entities.editor.pcm import decode_pcm, pcm_duration
+from src.entities.language import Language
+from src.entities.transcription import TranscriptionResult, TranscriptionWord
+from src.proxies.interfaces import ITranscriptionProxy
+
+
+class FasterWhisperProxy(ITranscriptionProxy):
+    def __init__(self, config: FasterWhisperTranscriptionConfig):
+        self.logger = get_logger(__name__)
+        self.config = config
+        workers = max(1, config.workers)
+        cpu_threads = config.cpu_threads or max(1, (os.cpu_count() or 1) // workers)
+        self.model = WhisperModel(
+            config.model,
+            device="cpu",
+            compute_type=config.compute_type,
+            cpu_threads=cpu_threads,
+            num_workers=workers,
+        )
+        self.logger.info(
+            "faster-whisper: model=%s, %s, %d workers x %d threads",
+            config.model,
+            config.compute_type,
+            workers,
+            cpu_threads,
+        )
+
+    @property
+    def model_identity(self) -> str:
+        config = self.config
+        return ":".join(
+            [
+                "faster-whisper",
+                config.model,
+                config.compute_type,
+                f"beam{config.beam_size}",
+                f"vad{config.vad_min_silence_ms}" if config.vad_filter else "novad",
+            ]
+        )
+
+    def transcribe(
+        self, audio_bytes: bytes, language: Optional[Language] = None
+    ) -> TranscriptionResult:
+        return self._transcribe_samples(decode_pcm(audio_bytes), language)
+
+    async def transcribe_async(
+        self, audio_bytes: bytes, language: Optional[Language] = None
+    ) -> TranscriptionResult:
+        return await asyncio.to_thread(self.transcribe, audio_bytes, language)
+
+    def _transcribe_samples(
+        self, audio: np.ndarray, language: Optional[Language]
+    ) -> TranscriptionResult:
+        segments, info = self.model.transcribe(
+            audio,
+            language=language.value if language else None,
+            beam_size=self.config.beam_size,
+            word_timestamps=True,
+            vad_filter=self.config.vad_filter,
+            vad_parameters={
+                "min_silence_duration_ms": self.config.vad_min_silence_ms
+            },
+        )
+
+        # Segments are decoded lazily while iterating.
+        duration = pcm_duration(audio)
+        texts = []
+        transcription_words = []
+        for segment in segments:
+            texts.append(segment.text)
+            for word in segment.words or []:
+                transcription_words.append(
+                    TranscriptionWord(
+                        word=word.word,
+                        start=min(word.start, duration),
+                        end=min(word.end, duration),
+                        probability=word.probability,
+                    )
+                )
+
+        return TranscriptionResult(
+            text="".join(texts),
+            words=transcription_words,
+            language=info.language,
+        )
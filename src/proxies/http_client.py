@@ -0,0 +1,176 @@
+"""Shared async HTTP client for the API-backed proxies.
+
+One pooled ``aiohttp`` session per event loop keeps connections to the same
+API alive between requests. Requests have connect and total timeouts, and
+connection errors, timeouts, ``429`` and ``5xx`` responses are retried with
+exponential backoff and jitter (honouring ``Retry-After``). Responses are
+read completely and returned as :class:`HTTPResponse`, so callers never hold
+a connection open.
+"""
+
+import asyncio
+import json
+import random
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Mapping, Optional, Union
+
+import aiohttp
+
+from src.core.logging_config import get_logger
+from src.entities.configs.proxies.http import HTTPClientConfig
+
+logger = get_logger(__name__)
+
+RETRY_STATUSES = frozenset({408, 429, 500, 502, 503, 504})
+
+# Request bodies that can only be sent once (like aiohttp.FormData) are
+# passed as a factory and rebuilt for every attempt.
+Body = Union[bytes, str, aiohttp.FormData, Callable[[], Any], None]
+
+
+@dataclass
+class HTTPResponse:
+    status: int
+    headers: Mapping[str, str]
+    body: bytes
+
+    @property
+    def ok(self) -> bool:
+        return 200 <= self.status < 300
+
+    @property
+    def text(self) -> str:
+        return self.body.decode("utf-8", errors="replace")
+
+    def json(self) -> Any:
+        return json.loads(self.body)
+
+
+class AsyncHTTPClient:
+    def __init__(self, config: Optional[HTTPClientConfig] = None):
+        self._config = config or HTTPClientConfig()
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    async def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is not None and self._loop is not loop:
+            await self._close_stale_session(self._session, self._loop)
+            self._session = None
+        if self._session is None or self._session.closed:
+            config = self._config
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit=config.max_connections,
+                    limit_per_host=config.max_connections_per_host,
+                    keepalive_timeout=config.keepalive_seconds,
+                ),
+                timeout=aiohttp.ClientTimeout(
+                    total=config.timeout_seconds,
+                    connect=config.connect_timeout_seconds,
+                ),
+            )
+            self._loop = loop
+        return self._session
+
+    @staticmethod
+    async def _close_stale_session(
+        session: aiohttp.ClientSession, loop: Optional[asyncio.AbstractEventLoop]
+    ) -> None:
+        """Close a session created on another event loop.
+
+        A loop still running in another thread closes it itself; otherwise
+        its connections are already gone and closing only releases it.
+        """
+        if session.closed:
+            return
+        if loop is not None and loop.is_running():
+            asyncio.run_coroutine_threadsafe(session.close(), loop)
+        else:
+            await session.close()
+
+    async def request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Optional[Dict[str, str]] = None,
+        json_body: Any = None,
+        data: Body = None,
+        params: Optional[Dict[str, str]] = None,
+    ) -> HTTPResponse:
+        """Send a request, retrying transient failures, and return the response.
+
+        Non-retryable error statuses are returned, not raised; check ``ok``.
+        """
+        attempts = self._config.max_retries + 1
+        for attempt in range(attempts):
+            body = data() if callable(data) else data
+            try:
+                session = await self._get_session()
+                async with session.request(
+                    method,
+                    url,
+                    headers=headers,
+                    json=json_body,
+                    data=body,
+                    params=params,
+                ) as response:
+                    result = HTTPResponse(
+                        status=response.status,
+                        headers=dict(response.headers),
+                        body=await response.read(),
+                    )
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt + 1 == attempts:
+                    raise
+                delay = self._backoff(attempt)
+                logger.warning(
+                    "%s %s failed (%s), retrying in %.1fs", method, url, e, delay
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            if result.status not in RETRY_STATUSES or attempt + 1 == attempts:
+                return result
+            delay = self._backoff(attempt, result.headers.get("Retry-After"))
+            logger.warning(
+                "%s %s returned %d, retrying in %.1fs",
+                method,
+                url,
+                result.status,
+                delay,
+            )
+            await asyncio.sleep(delay)
+
+    async def post(self, url: str, **kwargs) -> HTTPResponse:
+        return await self.request("POST", url, **kwargs)
+
+    async def get(self, url: str, **kwargs) -> HTTPResponse:
+        return await self.request("GET", url, **kwargs)
+
+    def _backoff(self, attempt: int, retry_after: Optional[str] = None) -> float:
+        config = self._config
+        if retry_after:
+            try:
+                return min(float(retry_after), config.max_backoff_seconds)
+            except ValueError:
+                pass
+        delay = min(config.backoff_seconds * 2**attempt, config.max_backoff_seconds)
+        return delay * random.uniform(0.5, 1.0)
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+
+_shared: Optional[AsyncHTTPClient] = None
+
+
+def shared_http_client() -> AsyncHTTPClient:
+    """Process-wide client for proxies constructed without one."""
+    global _shared
+    if _shared is None:
+        _shared = AsyncHTTPClient()
+    return _shared
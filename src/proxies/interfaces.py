@@ -1,3 +1,4 @@
+import asyncio
 from abc import ABC, abstractmethod
 from datetime import datetime
 from typing import List, Optional, Literal
@@ -7,6 +8,8 @@ from ..entities.reddit_post import RedditPost
 from ..entities.transcription import TranscriptionResult
 from ..entities.language import Language
 from ..entities.speech_voice import SpeechVoice
+from ..entities.synthesized_speech import SynthesizedSpeech
+from ..entities.youtube_video import YouTubeVideoMetadata
 
 
 class IRedditProxy(ABC):
@@ -46,6 +49,17 @@ class ITranscriptionProxy(ABC):
         """Generate transcription result from audio bytes"""
         ...
 
+    async def transcribe_async(
+        self, audio_bytes: bytes, language: Optional[Language] = None
+    ) -> TranscriptionResult:
+        """Transcribe without blocking the event loop"""
+        return await asyncio.to_thread(self.transcribe, audio_bytes, language)
+
+    @property
+    def model_identity(self) -> str:
+        """Identify the backend and model settings, for caching"""
+        return type(self).__name__
+
 
 class IImageGeneratorProxy(ABC):
     @abstractmethod
@@ -93,6 +107,40 @@ class ISpeechProxy(ABC):
         """Generate speech bytes from text"""
         ...
 
+    async def generate_speech_with_words(
+        self,
+        text: str,
+        gender: Literal["male", "female"] = "male",
+        rate: float = 1.0,
+        language: Language = Language.PORTUGUESE,
+        override_voice_id: Optional[str] = None,
+    ) -> SynthesizedSpeech:
+        """Generate speech with word timings when the provider reports them"""
+        audio = await self.generate_speech(
+            text=text,
+            gender=gender,
+            rate=rate,
+            language=language,
+            override_voice_id=override_voice_id,
+        )
+        return SynthesizedSpeech(audio=audio)
+
+    @property
+    def max_concurrent_requests(self) -> int:
+        """Synthesis requests the provider accepts at the same time"""
+        return 1
+
+    def voice_identity(
+        self,
+        gender: Literal["male", "female"] = "male",
+        language: Language = Language.PORTUGUESE,
+        override_voice_id: Optional[str] = None,
+    ) -> str:
+        """Identify the provider and voice a request would use, for caching"""
+        return ":".join(
+            [type(self).__name__, override_voice_id or gender, language.value]
+        )
+
     @abstractmethod
     def list_voices(self) -> List[SpeechVoice]:
         """List all available voices"""
@@ -180,15 +228,38 @@ class IYouTubeProxy(ABC):
         self,
         url: str,
         surface: Literal["videos", "shorts"] = "videos",
+        newest_only: bool = False,
     ) -> List[str]:
-        """List video IDs from a YouTube channel or playlist URL"""
+        """List video IDs from a YouTube channel or playlist URL.
+
+        With *newest_only* a channel listing stops after its first page,
+        which is enough to refresh a cached listing.
+        """
         ...
 
     @abstractmethod
-    async def download_video(self, video_id: str, low_quality: bool = False) -> bytes:
-        """Download a YouTube video and return its bytes"""
+    async def download_video(
+        self,
+        video_id: str,
+        low_quality: bool = False,
+        start: float = 0,
+        duration: Optional[float] = None,
+    ) -> bytes:
+        """Download a YouTube video and return its bytes.
+
+        With *duration* only the window starting at *start* seconds is
+        fetched where the stream allows it; the result may be slightly
+        longer, since it is cut at keyframes.
+        """
         ...
 
+    async def get_video_metadata(self, video_id: str) -> Optional[YouTubeVideoMetadata]:
+        """Return duration and format details without downloading the video.
+
+        Proxies that cannot look this up return ``None``.
+        """
+        return None
+
 
 class ICoverProxy(ABC):
     @abstractmethod
@@ -1,6 +1,9 @@
 import logging
 import sys
+import time
 import types
+from dataclasses import dataclass
+from typing import Optional
 
 import litellm
 
@@ -8,6 +11,8 @@ from src.proxies.interfaces import ILLMProxy
 from src.entities.configs.proxies.llm import PromptLLMConfig
 from src.entities.image_story import ImageStory
 from src.entities.language import Language, get_language_name
+from src.core.disk_cache import DiskCache
+from src.core.rate_limiter import AsyncRateLimiter, shared_rate_limiter
 from src.core.logging_config import get_logger
 from src.services.tiktok_caption import normalize_hashtags
 import os
@@ -27,6 +32,15 @@ _stub.general_settings = {}  # type: ignore[attr-defined]
 sys.modules.setdefault("litellm.proxy.proxy_server", _stub)
 
 
+@dataclass
+class _Completion:
+    text: Optional[str]
+    finish_reason: Optional[str]
+    # Set on fresh responses that may be cached once they parse.
+    cache_key: Optional[str] = None
+    cache_method: Optional[str] = None
+
+
 class PromptLLMProxy(ILLMProxy):
     GEMINI_SAFETY_SETTINGS = [
         {"category": "HARM_CATEGORY_HARASSMENT", "threshold": "BLOCK_NONE"},
@@ -38,6 +52,23 @@ class PromptLLMProxy(ILLMProxy):
     def __init__(self, config: PromptLLMConfig):
         self._logger = get_logger(__name__)
         self.config = config.provider_config
+        self.cache_config = config.cache
+        self._cache = (
+            DiskCache(
+                config.cache.path,
+                suffix=".json",
+                max_size_bytes=config.cache.max_size_mb * 1024 * 1024,
+            )
+            if config.cache.enabled
+            else None
+        )
+        self._rate_limiter: Optional[AsyncRateLimiter] = (
+            shared_rate_limiter(
+                f"llm:{self.config.provider}", self.config.requests_per_minute
+            )
+            if self.config.requests_per_minute
+            else None
+        )
 
     @staticmethod
     def _clean_json(text: str) -> str:
@@ -212,6 +243,73 @@ class PromptLLMProxy(ILLMProxy):
             kwargs.pop("max_completion_tokens", None)
         return kwargs
 
+    async def _complete(
+        self, method: str, model_str: str, messages: list[dict], **kwargs
+    ) -> _Completion:
+        """Call litellm.acompletion, or reuse a cached response to the same request.
+
+        Requests are fingerprinted by provider, model, rendered messages,
+        temperature and the remaining completion kwargs (response_format,
+        token limit). Fresh responses are only stored once the caller has
+        parsed them, through :meth:`_remember`.
+        """
+        ttl = self.cache_config.ttl_seconds(method)
+        key = None
+        if self._cache is not None and ttl > 0:
+            key = DiskCache.make_key(
+                method,
+                self.config.provider,
+                model_str,
+                messages,
+                self.config.temperature,
+                kwargs,
+            )
+            if not self.cache_config.bypass:
+                cached = self._cached_completion(key, ttl)
+                if cached is not None:
+                    self._logger.info("%s: reusing cached LLM response", method)
+                    return cached
+
+        if self._rate_limiter is not None:
+            await self._rate_limiter.acquire()
+        response = await litellm.acompletion(
+            model=model_str,
+            messages=messages,
+            api_key=self.config.api_key,
+            temperature=self.config.temperature,
+            **kwargs,
+        )
+        return _Completion(
+            text=response.choices[0].message.content,
+            finish_reason=response.choices[0].finish_reason,
+            cache_key=key,
+            cache_method=method,
+        )
+
+    def _cached_completion(self, key: str, ttl: float) -> Optional[_Completion]:
+        data = self._cache.get(key)
+        if data is None:
+            return None
+        entry = json.loads(data)
+        if time.time() - entry["created"] > ttl:
+            return None
+        return _Completion(text=entry["text"], finish_reason=entry["finish_reason"])
+
+    def _remember(self, completion: _Completion) -> None:
+        """Cache a fresh response after it parsed successfully."""
+        if completion.cache_key is None or self._cache is None:
+            return
+        entry = {
+            "created": time.time(),
+            "method": completion.cache_method,
+            "text": completion.text,
+            "finish_reason": completion.finish_reason,
+        }
+        self._cache.put(
+            completion.cache_key,
+            json.dumps(entry, ensure_ascii=False).encode("utf-8"),
+        )
+
     async def generate_two_part_story(
         self, title: str, content: str, target_language: Language
     ) -> dict:
@@ -245,20 +343,19 @@ class PromptLLMProxy(ILLMProxy):
             {"role": "user", "content": prompt},
         ]
 
-        response = await litellm.acompletion(
-            model=model_str,
-            messages=messages,
-            api_key=self.config.api_key,
-            temperature=self.config.temperature,
+        completion = await self._complete(
+            "generate_two_part_story",
+            model_str,
+            messages,
             **self._get_completion_kwargs(model_str),
         )
 
-        response_text = response.choices[0].message.content
+        response_text = completion.text
 
         if not response_text:
             self._logger.error(
                 f"LLM returned empty response. "
-                f"Finish reason: {response.choices[0].finish_reason}"
+                f"Finish reason: {completion.finish_reason}"
             )
             raise RuntimeError(
                 "LLM returned empty content for story generation. "
@@ -267,12 +364,14 @@ class PromptLLMProxy(ILLMProxy):
 
         try:
             result = json.loads(self._clean_json(response_text))
-            return {
+            story = {
                 "title": result.get("title", ""),
                 "narrator_gender": result.get("narrator_gender", "unknown"),
                 "part1": result.get("part1", ""),
                 "part2": result.get("part2", ""),
             }
+            self._remember(completion)
+            return story
         except json.JSONDecodeError as e:
             self._logger.error(f"Failed to parse LLM JSON response: {response_text}")
             raise RuntimeError(f"Could not parse valid JSON from LLM: {e}")
@@ -298,20 +397,19 @@ class PromptLLMProxy(ILLMProxy):
             {"role": "user", "content": prompt},
         ]
 
-        response = await litellm.acompletion(
-            model=model_str,
-            messages=messages,
-            api_key=self.config.api_key,
-            temperature=self.config.temperature,
+        completion = await self._complete(
+            "generate_story",
+            model_str,
+            messages,
             **self._get_completion_kwargs(model_str),
         )
 
-        response_text = response.choices[0].message.content
+        response_text = completion.text
 
         if not response_text:
             self._logger.error(
                 f"LLM returned empty response. "
-                f"Finish reason: {response.choices[0].finish_reason}"
+                f"Finish reason: {completion.finish_reason}"
             )
             raise RuntimeError(
                 "LLM returned empty content for story generation. "
@@ -320,11 +418,13 @@ class PromptLLMProxy(ILLMProxy):
 
         try:
             result = json.loads(self._clean_json(response_text))
-            return {
+            story = {
                 "title": result.get("title", ""),
                 "narrator_gender": result.get("narrator_gender", "unknown"),
                 "script": result.get("script", ""),
             }
+            self._remember(completion)
+            return story
         except json.JSONDecodeError as e:
             self._logger.error(f"Failed to parse LLM JSON response: {response_text}")
             raise RuntimeError(f"Could not parse valid JSON from LLM: {e}")
@@ -347,20 +447,19 @@ class PromptLLMProxy(ILLMProxy):
 
         messages = [{"role": "user", "content": prompt}]
 
-        response = await litellm.acompletion(
-            model=model_str,
-            messages=messages,
-            api_key=self.config.api_key,
-            temperature=self.config.temperature,
+        completion = await self._complete(
+            "evaluate_story",
+            model_str,
+            messages,
             **self._get_completion_kwargs(model_str),
         )
 
-        response_text = response.choices[0].message.content
+        response_text = completion.text
 
         if not response_text:
             self._logger.error(
                 "LLM returned empty response. Finish reason: %s",
-                response.choices[0].finish_reason,
+                completion.finish_reason,
             )
             raise RuntimeError(
                 "LLM returned empty content for story evaluation. "
@@ -369,7 +468,9 @@ class PromptLLMProxy(ILLMProxy):
 
         try:
             data = json.loads(self._clean_json(response_text))
-            return self._normalize_evaluation(data)
+            evaluation = self._normalize_evaluation(data)
+            self._remember(completion)
+            return evaluation
         except json.JSONDecodeError as e:
             self._logger.error(f"Failed to parse evaluation JSON: {response_text}")
             raise RuntimeError(f"Could not parse valid JSON from LLM: {e}")
@@ -417,15 +518,14 @@ class PromptLLMProxy(ILLMProxy):
 
         messages = [{"role": "user", "content": prompt}]
 
-        response = await litellm.acompletion(
-            model=model_str,
-            messages=messages,
-            api_key=self.config.api_key,
-            temperature=self.config.temperature,
+        completion = await self._complete(
+            "generate_hashtags",
+            model_str,
+            messages,
             **self._get_completion_kwargs(model_str, default_max_tokens=256),
         )
 
-        response_text = response.choices[0].message.content
+        response_text = completion.text
         if not response_text:
             self._logger.warning("LLM returned empty hashtag response, using defaults")
             return ["fyp", "storytime", "reddit"]
@@ -433,6 +533,7 @@ class PromptLLMProxy(ILLMProxy):
         try:
             data = json.loads(self._clean_json(response_text))
             tags = data.get("hashtags", [])
+            self._remember(completion)
             return normalize_hashtags(tags)
         except (json.JSONDecodeError, AttributeError):
             self._logger.warning("Failed to parse hashtag JSON: %s", response_text)
@@ -456,15 +557,14 @@ class PromptLLMProxy(ILLMProxy):
 
         messages = [{"role": "user", "content": prompt}]
 
-        response = await litellm.acompletion(
-            model=model_str,
-            messages=messages,
-            api_key=self.config.api_key,
-            temperature=self.config.temperature,
+        completion = await self._complete(
+            "revise_story",
+            model_str,
+            messages,
             **self._get_completion_kwargs(model_str),
         )
 
-        response_text = response.choices[0].message.content
+        response_text = completion.text
 
         if not response_text:
             raise RuntimeError(
@@ -474,12 +574,14 @@ class PromptLLMProxy(ILLMProxy):
 
         try:
             result = json.loads(self._clean_json(response_text))
-            return {
+            story = {
                 "title": result.get("title", ""),
                 "narrator_gender": result.get("narrator_gender", "unknown"),
                 "part1": result.get("part1", ""),
                 "part2": result.get("part2", ""),
             }
+            self._remember(completion)
+            return story
         except json.JSONDecodeError as e:
             self._logger.error(f"Failed to parse revised story JSON: {response_text}")
             raise RuntimeError(f"Could not parse valid JSON from LLM: {e}")
@@ -514,20 +616,19 @@ class PromptLLMProxy(ILLMProxy):
             {"role": "user", "content": prompt},
         ]
 
-        response = await litellm.acompletion(
-            model=model_str,
-            messages=messages,
-            api_key=self.config.api_key,
-            temperature=self.config.temperature,
+        completion = await self._complete(
+            "enhance_transcription",
+            model_str,
+            messages,
             **self._get_completion_kwargs(model_str, json_mode=False),
         )
 
-        response_text = response.choices[0].message.content
+        response_text = completion.text
 
         if not response_text:
             self._logger.error(
                 f"LLM returned empty response. "
-                f"Finish reason: {response.choices[0].finish_reason}"
+                f"Finish reason: {completion.finish_reason}"
             )
             raise RuntimeError(
                 "LLM returned empty content for transcription enhancement. "
@@ -544,6 +645,7 @@ class PromptLLMProxy(ILLMProxy):
                     "enhance_transcription: ignored %d trailing chars after first JSON value",
                     len(tail),
                 )
+            self._remember(completion)
             if isinstance(result, list):
                 return result
             if isinstance(result, dict):
@@ -576,15 +678,14 @@ class PromptLLMProxy(ILLMProxy):
 
         messages = [{"role": "user", "content": prompt}]
 
-        response = await litellm.acompletion(
-            model=model_str,
-            messages=messages,
-            api_key=self.config.api_key,
-            temperature=self.config.temperature,
+        completion = await self._complete(
+            "generate_characters",
+            model_str,
+            messages,
             **self._get_completion_kwargs(model_str),
         )
 
-        response_text = response.choices[0].message.content
+        response_text = completion.text
         if not response_text:
             raise RuntimeError("LLM returned empty content for character generation.")
 
@@ -598,6 +699,7 @@ class PromptLLMProxy(ILLMProxy):
                 data = [data]
             if not isinstance(data, list):
                 raise ValueError(f"Expected list of characters, got {type(data)}")
+            self._remember(completion)
             return data
         except (json.JSONDecodeError, ValueError) as e:
             self._logger.error(f"Failed to parse characters JSON: {response_text}")
@@ -628,16 +730,15 @@ class PromptLLMProxy(ILLMProxy):
 
         messages = [{"role": "user", "content": prompt}]
 
-        response = await litellm.acompletion(
-            model=model_str,
-            messages=messages,
-            api_key=self.config.api_key,
-            temperature=self.config.temperature,
+        completion = await self._complete(
+            "generate_image_story",
+            model_str,
+            messages,
             **self._get_completion_kwargs(model_str, default_max_tokens=8192),
         )
 
-        response_text = response.choices[0].message.content
-        finish_reason = response.choices[0].finish_reason
+        response_text = completion.text
+        finish_reason = completion.finish_reason
 
         if finish_reason == "length":
             self._logger.warning("Image story response was truncated (hit token limit)")
@@ -673,7 +774,9 @@ class PromptLLMProxy(ILLMProxy):
 
             data["introduction_end_time"] = introduction_end_time
             data["call_to_action_start_time"] = call_to_action_start_time
-            return ImageStory(**data)
+            image_story = ImageStory(**data)
+            self._remember(completion)
+            return image_story
         except (json.JSONDecodeError, ValueError) as e:
             self._logger.error(f"Failed to parse image story JSON: {response_text}")
             raise RuntimeError(f"Could not parse valid ImageStory from LLM: {e}")
@@ -1,51 +1,143 @@
+"""Local openai-whisper transcription, served by a pool of warm worker processes.
+
+Each worker loads the configured model once (in the pool initializer) and
+then takes transcription jobs from the pool's queue, so concurrent requests
+(like the two parts of a story) run in parallel on separate cores, and the
+event loop only awaits a future.
+
+Workers start on the first request unless ``preload`` is set, and the pool
+is shut down at interpreter exit.
+
+Audio is decoded to 16 kHz PCM in memory by the caller's process and the
+array is handed to the model, so whisper never writes a temp file or runs
+its own ffmpeg decode.
+"""
+
+import asyncio
+import atexit
+import multiprocessing
 import os
-import tempfile
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
 import whisper
 from typing import Optional
+from src.entities.editor.pcm import decode_pcm, pcm_duration
 from src.proxies.interfaces import ITranscriptionProxy
 from src.entities.language import Language
 from src.entities.transcription import TranscriptionResult, TranscriptionWord
 from src.entities.configs.proxies.transcription import LocalTranscriptionConfig
 from src.core.logging_config import get_logger
 
+# Model loaded by the pool initializer, one per worker process.
+_worker_model = None
+
+
+def _load_worker_model(model_name: str, torch_threads: int) -> None:
+    import torch
+
+    global _worker_model
+    torch.set_num_threads(torch_threads)
+    _worker_model = whisper.load_model(model_name)
+
+
+def _worker_ready() -> int:
+    return os.getpid()
+
+
+def _transcribe_in_worker(
+    audio: np.ndarray, language: Optional[Language]
+) -> TranscriptionResult:
+    return _transcribe_with_model(_worker_model, audio, language)
+
+
+def _transcribe_with_model(
+    model, audio: np.ndarray, language: Optional[Language]
+) -> TranscriptionResult:
+    """Transcribe 16 kHz mono float32 samples with word timestamps."""
+    kwargs = {"word_timestamps": True}
+    if language:
+        kwargs["language"] = language.value
+
+    # torch wants a writable buffer; cached decodes are read-only.
+    output = model.transcribe(np.require(audio, requirements="W"), **kwargs)
+
+    # Whisper can place the last word's end past the end of the audio.
+    duration = pcm_duration(audio)
+    transcription_words = []
+    for segment in output.get("segments", []):
+        for word_data in segment.get("words", []):
+            transcription_words.append(
+                TranscriptionWord(
+                    word=word_data["word"],
+                    start=min(word_data["start"], duration),
+                    end=min(word_data["end"], duration),
+                    probability=word_data.get("probability"),
+                )
+            )
+
+    return TranscriptionResult(
+        text=output.get("text", ""),
+        words=transcription_words,
+        language=output.get("language"),
+    )
+
 
 class LocalWhisperProxy(ITranscriptionProxy):
     def __init__(self, config: LocalTranscriptionConfig):
         self.logger = get_logger(__name__)
-        self.model = whisper.load_model(config.model)
+        self.model_name = config.model
+        self.model = None
+        self.pool: Optional[ProcessPoolExecutor] = None
+
+        if config.workers <= 0:
+            self.model = whisper.load_model(config.model)
+            return
+
+        torch_threads = config.torch_threads or max(
+            1, (os.cpu_count() or 1) // config.workers
+        )
+        self.pool = ProcessPoolExecutor(
+            max_workers=config.workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_load_worker_model,
+            initargs=(config.model, torch_threads),
+        )
+        atexit.register(self.close)
+        self.logger.info(
+            "Whisper pool: %d workers, model=%s, %d torch threads each",
+            config.workers,
+            config.model,
+            torch_threads,
+        )
+        if config.preload:
+            # Workers start on demand; one job per worker starts them all and
+            # loads the model in the background.
+            for _ in range(config.workers):
+                self.pool.submit(_worker_ready)
+
+    @property
+    def model_identity(self) -> str:
+        return f"whisper:{self.model_name}"
 
     def transcribe(
         self, audio_bytes: bytes, language: Optional[Language] = None
     ) -> TranscriptionResult:
-        # Local whisper requires a file path, so write bytes to a temp file
-        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as temp_audio:
-            temp_audio.write(audio_bytes)
-            temp_path = temp_audio.name
-
-        try:
-            kwargs = {"word_timestamps": True}
-            if language:
-                kwargs["language"] = language.value
-
-            output = self.model.transcribe(temp_path, **kwargs)
-
-            transcription_words = []
-            for segment in output.get("segments", []):
-                for word_data in segment.get("words", []):
-                    transcription_words.append(
-                        TranscriptionWord(
-                            word=word_data["word"],
-                            start=word_data["start"],
-                            end=word_data["end"],
-                            probability=word_data.get("probability"),
-                        )
-                    )
-
-            return TranscriptionResult(
-                text=output.get("text", ""),
-                words=transcription_words,
-                language=output.get("language"),
-            )
-        finally:
-            if os.path.exists(temp_path):
-                os.remove(temp_path)
+        audio = decode_pcm(audio_bytes)
+        if self.pool is None:
+            return _transcribe_with_model(self.model, audio, language)
+        return self.pool.submit(_transcribe_in_worker, audio, language).result()
+
+    async def transcribe_async(
+        self, audio_bytes: bytes, language: Optional[Language] = None
+    ) -> TranscriptionResult:
+        if self.pool is None:
+            return await asyncio.to_thread(self.transcribe, audio_bytes, language)
+        audio = await asyncio.to_thread(decode_pcm, audio_bytes)
+        return await asyncio.wrap_future(
+            self.pool.submit(_transcribe_in_worker, audio, language)
+        )
+
+    def close(self) -> None:
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+            self.pool = None
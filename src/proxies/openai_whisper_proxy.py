@@ -1,6 +1,9 @@
 from io import BytesIO
 from typing import Optional
+
+import aiohttp
 from openai import OpenAI
+from src.proxies.http_client import AsyncHTTPClient, shared_http_client
 from src.proxies.interfaces import ITranscriptionProxy
 from src.entities.language import Language
 from src.entities.transcription import TranscriptionResult, TranscriptionWord
@@ -9,14 +12,26 @@ from src.core.logging_config import get_logger
 
 
 class OpenAIWhisperProxy(ITranscriptionProxy):
-    def __init__(self, config: OpenAITranscriptionConfig):
+    TRANSCRIPTIONS_URL = "https://api.openai.com/v1/audio/transcriptions"
+
+    def __init__(
+        self,
+        config: OpenAITranscriptionConfig,
+        http_client: Optional[AsyncHTTPClient] = None,
+    ):
         self.logger = get_logger(__name__)
         api_key = config.api_key
         if not api_key:
             raise ValueError("OpenAI API key not provided")
 
+        self.api_key = api_key
         self.model_id = config.model
         self.client = OpenAI(api_key=api_key)
+        self.http_client = http_client or shared_http_client()
+
+    @property
+    def model_identity(self) -> str:
+        return f"openai:{self.model_id}"
 
     def transcribe(
         self, audio_bytes: bytes, language: Optional[Language] = None
@@ -36,8 +51,36 @@ class OpenAIWhisperProxy(ITranscriptionProxy):
             file=audio_stream, **kwargs
         )
 
-        transcription_dict = transcription.model_dump()
+        return self._to_result(transcription.model_dump())
+
+    async def transcribe_async(
+        self, audio_bytes: bytes, language: Optional[Language] = None
+    ) -> TranscriptionResult:
+        def form() -> aiohttp.FormData:
+            data = aiohttp.FormData()
+            data.add_field(
+                "file", audio_bytes, filename="audio.mp3", content_type="audio/mpeg"
+            )
+            data.add_field("model", self.model_id)
+            data.add_field("response_format", "verbose_json")
+            data.add_field("timestamp_granularities[]", "word")
+            if language:
+                data.add_field("language", language.value)
+            return data
+
+        response = await self.http_client.post(
+            self.TRANSCRIPTIONS_URL,
+            data=form,
+            headers={"Authorization": f"Bearer {self.api_key}"},
+        )
+        if not response.ok:
+            raise Exception(
+                f"OpenAI transcription error: {response.status} - {response.text}"
+            )
+        return self._to_result(response.json())
 
+    @staticmethod
+    def _to_result(transcription_dict: dict) -> TranscriptionResult:
         transcription_words = []
         for word_data in transcription_dict.get("words", []):
             transcription_words.append(
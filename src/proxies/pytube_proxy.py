@@ -1,13 +1,20 @@
 import asyncio
+import inspect
+import json
 import logging
+import os
 import re
 import tempfile
-from typing import Any, List, Literal
+import time
+from typing import Any, Dict, List, Literal, Optional
 
 from pytubefix import YouTube, Channel, Playlist
+from pytubefix.helpers import DeferredGeneratorList
 
+from src.proxies.dash_range import download_time_range, http_range_fetcher
 from src.proxies.interfaces import IYouTubeProxy
 from src.entities.configs.proxies.youtube import PyTubeYouTubeConfig
+from src.entities.youtube_video import YouTubeVideoMetadata
 
 logger = logging.getLogger(__name__)
 
@@ -15,23 +22,31 @@ logger = logging.getLogger(__name__)
 class PyTubeProxy(IYouTubeProxy):
     def __init__(self, config: PyTubeYouTubeConfig):
         self.config = config
+        # Durations read from channel listings, so metadata lookups for
+        # listed videos need no extra request.
+        self._listing_durations: Dict[str, float] = {}
 
     async def list_video_ids(
         self,
         url: str,
         surface: Literal["videos", "shorts"] = "videos",
+        newest_only: bool = False,
     ) -> List[str]:
         """List video IDs from a YouTube channel or playlist URL"""
-        return await asyncio.to_thread(self._extract_video_ids, url, surface)
+        return await asyncio.to_thread(
+            self._extract_video_ids, url, surface, newest_only
+        )
 
     def _extract_video_ids(
         self,
         url: str,
         surface: Literal["videos", "shorts"] = "videos",
+        newest_only: bool = False,
     ) -> List[str]:
         try:
             if "playlist" in url or "list=" in url:
                 playlist = Playlist(url)
+                self._record_page_durations(playlist)
                 video_ids = [vid for vid in playlist.video_urls]
             elif (
                 "channel/" in url
@@ -40,17 +55,35 @@ class PyTubeProxy(IYouTubeProxy):
                 or url.startswith("https://www.youtube.com/@")
             ):
                 channel = Channel(url)
-                if surface == "shorts" or url.rstrip("/").endswith("/shorts"):
-                    video_ids = self._collect_video_ids(channel.shorts)
+                shorts = surface == "shorts" or url.rstrip("/").endswith("/shorts")
+                if newest_only:
+                    # ``initial_data`` only holds the first page of the tab,
+                    # the continuation requests are what makes a full scrape
+                    # slow.
+                    channel.html_url = (
+                        channel.shorts_url if shorts else channel.videos_url
+                    )
+                    return self._collect_video_ids(
+                        channel.initial_data, self._listing_durations
+                    )
+                if shorts:
+                    video_ids = self._collect_video_ids(
+                        channel.shorts, self._listing_durations
+                    )
                     if not video_ids:
                         channel.html_url = channel.shorts_url
-                        video_ids = self._collect_video_ids(channel.initial_data)
+                        video_ids = self._collect_video_ids(
+                            channel.initial_data, self._listing_durations
+                        )
                     return video_ids
 
+                self._record_page_durations(channel)
                 video_ids = self._collect_video_ids(channel.video_urls)
                 if not video_ids:
                     channel.html_url = channel.videos_url
-                    video_ids = self._collect_video_ids(channel.initial_data)
+                    video_ids = self._collect_video_ids(
+                        channel.initial_data, self._listing_durations
+                    )
                 return video_ids
             else:
                 # Assume it's a single video url
@@ -62,14 +95,51 @@ class PyTubeProxy(IYouTubeProxy):
 
         return self._collect_video_ids(video_ids)
 
+    def _record_page_durations(self, listing: Any) -> None:
+        """Record ``lengthText`` durations of every page *listing* fetches.
+
+        ``video_urls`` only keeps the watch ids and pytubefix fetches the
+        continuation pages itself, so the raw page JSON is read on its way
+        into the private ``_extract_videos``. A pytubefix release that drops
+        or reshapes that method only costs the cached durations, so it is
+        logged rather than raised.
+        """
+        extract_videos = getattr(listing, "_extract_videos", None)
+        try:
+            parameters = list(inspect.signature(extract_videos).parameters)
+        except (TypeError, ValueError):
+            parameters = []
+        if parameters[:2] != ["raw_json", "context"]:
+            logger.warning(
+                "pytubefix %s._extract_videos changed; listing durations "
+                "will not be recorded",
+                type(listing).__name__,
+            )
+            return
+
+        def recording_extract(raw_json: Any, context: Any = None):
+            try:
+                page = json.loads(raw_json) if isinstance(raw_json, str) else raw_json
+                self._collect_video_ids(page, self._listing_durations)
+            except ValueError:
+                pass
+            return extract_videos(raw_json, context)
+
+        listing._extract_videos = recording_extract
+
     @classmethod
-    def _collect_video_ids(cls, value: Any) -> List[str]:
+    def _collect_video_ids(
+        cls, value: Any, durations: Optional[Dict[str, float]] = None
+    ) -> List[str]:
         """Extract unique YouTube video IDs from pytubefix channel shapes.
 
         pytubefix 10.3.8 currently returns ``Channel.video_urls`` entries as
         empty lists for some handle URLs, while ``initial_data`` still has
         ``videoId`` fields. This recursive collector handles both the old URL
         list shape and the current nested dict/list shape.
+
+        When *durations* is given, the ``lengthText`` of renderers that carry
+        one is recorded there in seconds.
         """
         extracted: list[str] = []
         seen: set[str] = set()
@@ -97,28 +167,104 @@ class PyTubeProxy(IYouTubeProxy):
                 video_id = item.get("videoId")
                 if isinstance(video_id, str):
                     add(video_id)
+                    length = cls._parse_length_text(item.get("lengthText"))
+                    if durations is not None and length is not None:
+                        durations[video_id] = length
                 for nested in item.values():
                     visit(nested)
                 return
 
-            if isinstance(item, (list, tuple)):
+            if isinstance(item, (list, tuple, DeferredGeneratorList)):
                 for nested in item:
                     visit(nested)
 
         visit(value)
         return extracted
 
-    async def download_video(self, video_id: str, low_quality: bool = False) -> bytes:
+    @staticmethod
+    def _parse_length_text(value: Any) -> Optional[float]:
+        """Parse a renderer ``lengthText`` such as ``"1:02:03"`` to seconds."""
+        if isinstance(value, dict):
+            text = value.get("simpleText")
+            if text is None:
+                runs = value.get("runs") or []
+                text = "".join(run.get("text", "") for run in runs)
+            value = text
+        if not isinstance(value, str) or not re.fullmatch(r"\d+(:\d{1,2}){0,2}", value):
+            return None
+        seconds = 0
+        for part in value.split(":"):
+            seconds = seconds * 60 + int(part)
+        return float(seconds)
+
+    async def get_video_metadata(self, video_id: str) -> Optional[YouTubeVideoMetadata]:
+        """Return listing metadata, falling back to the watch page."""
+        duration = self._listing_durations.get(video_id)
+        if duration is not None:
+            return YouTubeVideoMetadata(
+                video_id=video_id, duration=duration, updated_at=time.time()
+            )
+        return await asyncio.to_thread(self._video_metadata_sync, video_id)
+
+    def _video_metadata_sync(self, video_id: str) -> Optional[YouTubeVideoMetadata]:
+        try:
+            yt = YouTube(f"https://www.youtube.com/watch?v={video_id}")
+            duration = float(yt.length or 0)
+        except Exception as e:
+            logger.warning(f"Failed to read metadata of video {video_id}: {e}")
+            return None
+
+        width = height = fps = None
+        try:
+            stream = (
+                yt.streams.filter(file_extension="mp4", only_video=True)
+                .order_by("resolution")
+                .desc()
+                .first()
+            )
+            if stream is not None:
+                width = getattr(stream, "width", None)
+                height = getattr(stream, "height", None)
+                fps = getattr(stream, "fps", None)
+        except Exception as e:
+            logger.info(f"No stream details for video {video_id}: {e}")
+
+        return YouTubeVideoMetadata(
+            video_id=video_id,
+            duration=duration,
+            width=width,
+            height=height,
+            fps=fps,
+            updated_at=time.time(),
+        )
+
+    async def download_video(
+        self,
+        video_id: str,
+        low_quality: bool = False,
+        start: float = 0,
+        duration: Optional[float] = None,
+    ) -> bytes:
         """Download a YouTube video and return its bytes"""
-        return await asyncio.to_thread(self._download_video_sync, video_id, low_quality)
+        return await asyncio.to_thread(
+            self._download_video_sync, video_id, low_quality, start, duration
+        )
 
-    def _download_video_sync(self, video_id: str, low_quality: bool = False) -> bytes:
+    def _download_video_sync(
+        self,
+        video_id: str,
+        low_quality: bool = False,
+        start: float = 0,
+        duration: Optional[float] = None,
+    ) -> bytes:
         try:
             url = f"https://www.youtube.com/watch?v={video_id}"
             yt = YouTube(url)
 
-            if not low_quality:
-                result = self._try_adaptive_download(yt)
+            if not low_quality or duration is not None:
+                result = self._try_adaptive_download(
+                    yt, low_quality, start, duration
+                )
                 if result is not None:
                     return result
 
@@ -150,25 +296,38 @@ class PyTubeProxy(IYouTubeProxy):
             logger.error(f"Failed to download video {video_id}: {e}")
             raise e
 
-    def _try_adaptive_download(self, yt: YouTube) -> bytes | None:
+    def _try_adaptive_download(
+        self,
+        yt: YouTube,
+        low_quality: bool = False,
+        start: float = 0,
+        duration: Optional[float] = None,
+    ) -> bytes | None:
         """Download a video-only adaptive stream (no audio needed).
 
-        Returns the MP4 bytes, or None if adaptive streams are
+        With *duration*, only the DASH segments covering the window are
+        fetched. Returns the MP4 bytes, or None if adaptive streams are
         unavailable so the caller can fall back to progressive.
         """
-        candidates = (
-            yt.streams
-            .filter(adaptive=True, file_extension="mp4", only_video=True, res="1080p")
-        )
-        if not candidates:
-            candidates = (
-                yt.streams
-                .filter(adaptive=True, file_extension="mp4", only_video=True, res="720p")
+        resolutions = ["360p", "480p"] if low_quality else ["1080p", "720p"]
+        candidates = None
+        for res in resolutions:
+            candidates = yt.streams.filter(
+                adaptive=True, file_extension="mp4", only_video=True, res=res
             )
+            if candidates:
+                break
         video_stream = candidates.first() if candidates else None
         if not video_stream:
             return None
 
+        if duration is not None:
+            result = self._download_time_range(video_stream, start, duration)
+            if result is not None:
+                return result
+            if low_quality:
+                return None
+
         logger.info(
             "Downloading adaptive %s video-only for %s",
             video_stream.resolution, yt.video_id,
@@ -178,3 +337,23 @@ class PyTubeProxy(IYouTubeProxy):
             file_path = video_stream.download(output_path=td, filename="video.mp4")
             with open(file_path, "rb") as f:
                 return f.read()
+
+    @staticmethod
+    def _download_time_range(
+        stream: Any, start: float, duration: float
+    ) -> bytes | None:
+        """Fetch ``[start, start + duration)`` of a DASH stream by byte ranges."""
+        with tempfile.TemporaryDirectory() as td:
+            file_path = os.path.join(td, "window.mp4")
+            try:
+                fetched = download_time_range(
+                    http_range_fetcher(stream.url), start, duration, file_path
+                )
+            except Exception as e:
+                logger.warning(f"Ranged download failed, fetching whole stream: {e}")
+                return None
+            if fetched is None:
+                logger.info("Stream has no segment index, fetching whole stream")
+                return None
+            with open(file_path, "rb") as f:
+                return f.read()
@@ -0,0 +1,332 @@
+"""Persistent, content-addressed library of YouTube background clips.
+
+Layout under ``BackgroundLibraryConfig.path``::
+
+    objects/<2 hex>/<sha256>.mp4   clip files, named after their content hash
+    mezzanine/<sha256>_<WxH@fps[zZOOM]>.mp4
+                                   clips transcoded once to a render geometry
+    index.json                     (video_id, quality) -> object + metadata
+    index.lock                     cross-process lock held while the index changes
+
+Several keys may point at the same object, which is only deleted once no
+key references it, together with its mezzanine copies. The index keeps the last access time of every key so
+the library can stay under its disk budget by evicting the least recently
+used clips. Lookups update that time in memory only; it is written along
+with the next change to the index.
+
+The bots and scripts share one library, so every change to the index is
+made under an exclusive ``fcntl`` lock on ``index.lock`` after merging in
+whatever the other processes wrote since the index was last read.
+"""
+
+import atexit
+import fcntl
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Dict, Iterator, Optional
+
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+
+from ..core.logging_config import get_logger
+from ..entities.configs.services.video import BackgroundLibraryConfig
+from ..entities.editor.mezzanine import transcode_mezzanine
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class BackgroundEntry:
+    video_id: str
+    low_quality: bool
+    digest: str
+    path: str
+    size: int
+    duration: float
+    width: int
+    height: int
+    fps: float
+    created_at: float
+    last_access: float
+    # mezzanine spec ("WxH@fps", "WxH@fpszZOOM" when zoomed) -> size in bytes
+    mezzanines: Dict[str, int] = field(default_factory=dict)
+
+
+class BackgroundLibrary:
+    """On-disk LRU of downloaded background clips keyed by video id and quality."""
+
+    INDEX_FILE = "index.json"
+    LOCK_FILE = "index.lock"
+
+    def __init__(self, config: BackgroundLibraryConfig):
+        self._config = config
+        self._root = config.path
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        # Hits only refresh recency in memory; it reaches the index with the
+        # next put, mezzanine or eviction, or at exit.
+        self._recency_dirty = False
+        os.makedirs(os.path.join(self._root, "objects"), exist_ok=True)
+        self._entries: Dict[str, BackgroundEntry] = self._load_index()
+        atexit.register(self.flush)
+
+    @staticmethod
+    def create_optional(
+        config: BackgroundLibraryConfig | None,
+    ) -> "BackgroundLibrary | None":
+        if config is None or not config.enabled:
+            return None
+        return BackgroundLibrary(config)
+
+    @staticmethod
+    def key(video_id: str, low_quality: bool) -> str:
+        return f"{video_id}:{'low' if low_quality else 'high'}"
+
+    @staticmethod
+    def mezzanine_spec(
+        width: int, height: int, fps: float, zoom: float = 1.0
+    ) -> str:
+        spec = f"{width}x{height}@{fps:g}"
+        return f"{spec}z{zoom:g}" if zoom > 1.0 else spec
+
+    @property
+    def total_size(self) -> int:
+        return sum(self._digest_sizes().values())
+
+    def get(self, video_id: str, low_quality: bool = False) -> Optional[BackgroundEntry]:
+        """Return the stored clip for *video_id*, or ``None`` on a miss."""
+        key = self.key(video_id, low_quality)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and os.path.exists(entry.path):
+                entry.last_access = time.time()
+                self.hits += 1
+                self._recency_dirty = True
+                return entry
+            self.misses += 1
+        if entry is not None:
+            # The merge drops entries whose object file is gone.
+            with self._locked_index():
+                self._save_index()
+        return None
+
+    def flush(self) -> None:
+        """Write access times refreshed by :meth:`get` to the index."""
+        if not self._recency_dirty:
+            return
+        with self._locked_index():
+            self._save_index()
+
+    def put(self, video_id: str, low_quality: bool, data: bytes) -> BackgroundEntry:
+        """Store *data* for *video_id*, probe its metadata and enforce the budget.
+
+        Raises when the bytes are not a readable video, so nothing unusable
+        is kept.
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        path = self._object_path(digest)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".part")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                infos = ffmpeg_parse_infos(tmp_path)
+                os.replace(tmp_path, path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+        else:
+            infos = ffmpeg_parse_infos(path)
+
+        width, height = infos.get("video_size") or (0, 0)
+        now = time.time()
+        entry = BackgroundEntry(
+            video_id=video_id,
+            low_quality=low_quality,
+            digest=digest,
+            path=path,
+            size=len(data),
+            duration=float(infos.get("duration") or 0),
+            width=int(width),
+            height=int(height),
+            fps=float(infos.get("video_fps") or 0),
+            created_at=now,
+            last_access=now,
+        )
+        with self._locked_index():
+            for other in self._entries.values():
+                if other.digest == digest:
+                    entry.mezzanines.update(other.mezzanines)
+            self._entries[self.key(video_id, low_quality)] = entry
+            self._evict(keep=self.key(video_id, low_quality))
+            self._save_index()
+        return entry
+
+    def mezzanine(
+        self,
+        entry: BackgroundEntry,
+        width: int,
+        height: int,
+        fps: float,
+        zoom: float = 1.0,
+    ) -> str:
+        """Return the path of *entry* transcoded to ``width``x``height`` at *fps*.
+
+        A *zoom* above 1 bakes the anti-fingerprint zoom into the copy. The
+        transcode runs once per clip, geometry and zoom; later calls reuse the
+        stored copy. Clips sharing a digest share their mezzanines too.
+        """
+        spec = self.mezzanine_spec(width, height, fps, zoom)
+        path = self._mezzanine_path(entry.digest, spec)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".part")
+            os.close(fd)
+            try:
+                transcode_mezzanine(
+                    entry.path,
+                    tmp_path,
+                    width,
+                    height,
+                    fps,
+                    crf=self._config.mezzanine_crf,
+                    zoom=zoom,
+                )
+                os.replace(tmp_path, path)
+            finally:
+                if os.path.exists(tmp_path):
+                    os.unlink(tmp_path)
+
+        size = os.path.getsize(path)
+        with self._locked_index():
+            for other in self._entries.values():
+                if other.digest == entry.digest:
+                    other.mezzanines[spec] = size
+            entry.mezzanines[spec] = size
+            self._evict(keep=self.key(entry.video_id, entry.low_quality))
+            self._save_index()
+        return path
+
+    def _digest_sizes(self) -> Dict[str, int]:
+        """Bytes on disk per stored object, its mezzanine copies included."""
+        objects: Dict[str, int] = {}
+        mezzanines: Dict[str, Dict[str, int]] = {}
+        for entry in self._entries.values():
+            objects[entry.digest] = entry.size
+            mezzanines.setdefault(entry.digest, {}).update(entry.mezzanines)
+        return {
+            digest: size + sum(mezzanines[digest].values())
+            for digest, size in objects.items()
+        }
+
+    def _evict(self, keep: str) -> None:
+        budget = self._config.max_size_mb * 1024 * 1024
+        grace_limit = time.time() - self._config.eviction_grace_seconds
+        candidates = sorted(
+            (
+                (key, entry)
+                for key, entry in self._entries.items()
+                if key != keep and entry.last_access < grace_limit
+            ),
+            key=lambda item: item[1].last_access,
+        )
+        digest_sizes = self._digest_sizes()
+        references = Counter(entry.digest for entry in self._entries.values())
+        total = sum(digest_sizes.values())
+        for key, entry in candidates:
+            if total <= budget:
+                break
+            del self._entries[key]
+            references[entry.digest] -= 1
+            if references[entry.digest] == 0:
+                total -= digest_sizes[entry.digest]
+                paths = [entry.path] + [
+                    self._mezzanine_path(entry.digest, spec)
+                    for spec in entry.mezzanines
+                ]
+                for path in paths:
+                    try:
+                        os.unlink(path)
+                    except FileNotFoundError:
+                        pass
+            logger.info("Evicted background %s (%d bytes)", key, entry.size)
+
+    def _object_path(self, digest: str) -> str:
+        return os.path.join(self._root, "objects", digest[:2], f"{digest}.mp4")
+
+    def _mezzanine_path(self, digest: str, spec: str) -> str:
+        return os.path.join(self._root, "mezzanine", f"{digest}_{spec}.mp4")
+
+    def _index_path(self) -> str:
+        return os.path.join(self._root, self.INDEX_FILE)
+
+    @contextmanager
+    def _locked_index(self) -> Iterator[None]:
+        """Hold the thread lock and the cross-process index lock.
+
+        Entries written by other processes are merged in on entry, so a
+        save inside the block never drops them.
+        """
+        with self._lock, open(os.path.join(self._root, self.LOCK_FILE), "a") as lock:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+            try:
+                self._merge_index()
+                yield
+            finally:
+                fcntl.flock(lock, fcntl.LOCK_UN)
+
+    def _merge_index(self) -> None:
+        """Fold the stored index into memory and drop entries whose files are gone.
+
+        A key present on both sides keeps the newer clip, the later access
+        time and every mezzanine either side knows about.
+        """
+        for key, stored in self._load_index().items():
+            entry = self._entries.get(key)
+            if entry is None or stored.created_at > entry.created_at:
+                if entry is not None:
+                    stored.last_access = max(stored.last_access, entry.last_access)
+                self._entries[key] = stored
+                continue
+            entry.last_access = max(entry.last_access, stored.last_access)
+            if stored.digest == entry.digest:
+                for spec, size in stored.mezzanines.items():
+                    entry.mezzanines.setdefault(spec, size)
+
+        for key, entry in list(self._entries.items()):
+            if not os.path.exists(entry.path):
+                del self._entries[key]
+                continue
+            for spec in list(entry.mezzanines):
+                if not os.path.exists(self._mezzanine_path(entry.digest, spec)):
+                    del entry.mezzanines[spec]
+
+    def _load_index(self) -> Dict[str, BackgroundEntry]:
+        try:
+            with open(self._index_path(), "r", encoding="utf-8") as f:
+                raw = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            logger.exception("Ignoring unreadable background index")
+            return {}
+        return {key: BackgroundEntry(**value) for key, value in raw.items()}
+
+    def _save_index(self) -> None:
+        self._recency_dirty = False
+        fd, tmp_path = tempfile.mkstemp(dir=self._root, suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(
+                {key: asdict(entry) for key, entry in self._entries.items()},
+                f,
+                indent=2,
+            )
+        os.replace(tmp_path, self._index_path())
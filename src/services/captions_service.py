@@ -1,12 +1,19 @@
+import hashlib
+import json
+import os
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 from ..proxies.interfaces import ITranscriptionProxy, ILLMProxy
+from ..proxies.cached_transcription_proxy import CachedTranscriptionProxy
 
 from ..entities.captions import Captions, CaptionSegment
 from ..entities.configs.services.captions import CaptionsConfig
 from ..entities.editor.captions_clip import CaptionsClip
 from ..entities.language import Language
+from ..entities.transcription import TranscriptionWord
+from ..core.disk_cache import DiskCache
 from ..core.logging_config import get_logger
+from .script_aligner import align_script
 
 
 @dataclass
@@ -27,6 +34,25 @@ class CaptionsService:
         self._llm_proxy = llm_proxy
         self._transcription_proxy = transcription_proxy
         self._captions_config = captions_config
+        # Locally aligned captions, keyed by transcription and script. LLM
+        # enhancements are cached by the LLM proxy under its own identity.
+        self._enhanced_cache: Optional[DiskCache] = None
+        cache_config = captions_config.cache
+        if cache_config.enabled:
+            max_size_bytes = cache_config.max_size_mb * 1024 * 1024
+            self._transcription_proxy = CachedTranscriptionProxy(
+                transcription_proxy,
+                DiskCache(
+                    os.path.join(cache_config.path, "transcriptions"),
+                    suffix=".json.gz",
+                    max_size_bytes=max_size_bytes,
+                ),
+            )
+            self._enhanced_cache = DiskCache(
+                os.path.join(cache_config.path, "enhanced"),
+                suffix=".json",
+                max_size_bytes=max_size_bytes,
+            )
         with open(self._captions_config.font_path, "rb") as f:
             self._font_bytes = f.read()
         self._logger = get_logger(__name__)
@@ -37,9 +63,44 @@ class CaptionsService:
         enhance_captions: bool = False,
         language: Optional[Language] = None,
         base_text: Optional[str] = None,
+        words: Optional[List[TranscriptionWord]] = None,
     ) -> CaptionsResult:
-        """Generate captions from audio bytes and return a CaptionsResult"""
-        transcription_result = self._transcription_proxy.transcribe(
+        """Generate captions from audio bytes and return a CaptionsResult
+
+        When *words* (timings reported by the speech provider) are given and
+        ``use_speech_timings`` is on, captions are built from them directly
+        and the audio is neither transcribed nor enhanced.
+        """
+        if words and self._captions_config.use_speech_timings:
+            self._logger.info("Captions from %d speech word timings", len(words))
+            if base_text:
+                # Same alignment, and so the same segments per script token,
+                # as transcribed captions; tokens the provider does not time
+                # (dashes) take the gap between their neighbours.
+                caption_segments = align_script(base_text, words).segments
+            else:
+                caption_segments = [
+                    CaptionSegment(start=w.start, end=w.end, text=w.word)
+                    for w in words
+                ]
+            return self._result(Captions(segments=caption_segments))
+
+        if enhance_captions and not base_text:
+            raise ValueError("base_text must be provided when enhance_captions is True")
+
+        enhanced_key = None
+        if enhance_captions and self._enhanced_cache is not None:
+            enhanced_key = self._enhanced_key(audio_bytes, language, base_text)
+            cached = self._enhanced_cache.get(enhanced_key)
+            if cached is not None:
+                self._logger.info("Enhanced captions loaded from cache")
+                segments = [
+                    CaptionSegment(text=text, start=start, end=end)
+                    for text, start, end in json.loads(cached)
+                ]
+                return self._result(Captions(segments=segments))
+
+        transcription_result = await self._transcription_proxy.transcribe_async(
             audio_bytes, language=language
         )
 
@@ -49,35 +110,81 @@ class CaptionsService:
         ]
 
         if enhance_captions:
-            if not base_text:
-                raise ValueError(
-                    "base_text must be provided when enhance_captions is True"
+            aligned = self._align(base_text, transcription_result.words)
+            if aligned is None:
+                caption_segments = await self._enhance_with_llm(
+                    base_text, caption_segments
                 )
+            else:
+                caption_segments = aligned
+                if enhanced_key is not None:
+                    rows = [[s.text, s.start, s.end] for s in caption_segments]
+                    self._enhanced_cache.put(
+                        enhanced_key,
+                        json.dumps(rows, ensure_ascii=False).encode("utf-8"),
+                    )
 
-            raw_transcription = [
-                {"word": s.text, "start": s.start, "end": s.end, "probability": 1.0}
-                for s in caption_segments
-            ]
+        return self._result(Captions(segments=caption_segments))
 
-            enhanced = await self._llm_proxy.enhance_transcription(
-                base_text=base_text, raw_transcription=raw_transcription
-            )
+    def _enhanced_key(
+        self, audio_bytes: bytes, language: Optional[Language], base_text: str
+    ) -> str:
+        config = self._captions_config
+        return DiskCache.make_key(
+            hashlib.sha256(audio_bytes).hexdigest(),
+            self._transcription_proxy.model_identity,
+            language.value if language else None,
+            hashlib.sha256(base_text.encode("utf-8")).hexdigest(),
+            config.alignment,
+            config.alignment_min_confidence,
+        )
 
-            if not isinstance(enhanced, list):
-                raise ValueError(
-                    f"LLM enhancer returned invalid type: {type(enhanced)}. Expected list of dicts."
-                )
+    def _align(
+        self, base_text: str, words: List[TranscriptionWord]
+    ) -> Optional[List[CaptionSegment]]:
+        """*base_text* aligned onto *words*, or ``None`` when the LLM should do it."""
+        if self._captions_config.alignment != "local":
+            return None
+        alignment = align_script(base_text, words)
+        threshold = self._captions_config.alignment_min_confidence
+        if alignment.confidence >= threshold:
+            return alignment.segments
+        self._logger.warning(
+            "Script alignment matched %.0f%% of words (< %.0f%%), "
+            "falling back to the LLM enhancer",
+            alignment.confidence * 100,
+            threshold * 100,
+        )
+        return None
 
-            caption_segments = [
-                CaptionSegment(
-                    start=e.get("start", 0),
-                    end=e.get("end", 0),
-                    text=e.get("word", ""),
-                )
-                for e in enhanced
-            ]
+    async def _enhance_with_llm(
+        self, base_text: str, caption_segments: List[CaptionSegment]
+    ) -> List[CaptionSegment]:
+        """Have the LLM rewrite the transcribed segments as the words of *base_text*."""
+        raw_transcription = [
+            {"word": s.text, "start": s.start, "end": s.end, "probability": 1.0}
+            for s in caption_segments
+        ]
+
+        enhanced = await self._llm_proxy.enhance_transcription(
+            base_text=base_text, raw_transcription=raw_transcription
+        )
+
+        if not isinstance(enhanced, list):
+            raise ValueError(
+                f"LLM enhancer returned invalid type: {type(enhanced)}. Expected list of dicts."
+            )
+
+        return [
+            CaptionSegment(
+                start=e.get("start", 0),
+                end=e.get("end", 0),
+                text=e.get("word", ""),
+            )
+            for e in enhanced
+        ]
 
-        captions = Captions(segments=caption_segments)
+    def _result(self, captions: Captions) -> CaptionsResult:
         clip = CaptionsClip(
             captions=captions,
             config=self._captions_config,
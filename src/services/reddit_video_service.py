@@ -1,12 +1,13 @@
 import asyncio
+import functools
 import json
 import logging
-import os
 import re
-import tempfile
 from concurrent.futures import ThreadPoolExecutor
-from dataclasses import dataclass
-from typing import Literal, Optional
+from dataclasses import dataclass, fields
+from typing import Callable, Literal, Optional
+
+from ..core.artifacts import Artifact, ArtifactStore
 
 from ..entities.captions import Captions
 from ..entities.cover import RedditCover
@@ -14,6 +15,7 @@ from ..entities.editor import image_clip
 from ..entities.image_story import ImageStory
 from ..entities.editor.audio_clip import AudioClip
 from ..entities.editor.captions_clip import CaptionsClip
+from ..entities.editor.scratch import ScratchSpace
 from ..entities.language import Language
 from ..entities.reddit_post import RedditPost
 from ..proxies.interfaces import IImageGeneratorProxy, ILLMProxy, IRedditProxy
@@ -70,10 +72,26 @@ class ImageStoryPair:
     generated_images_2: list[bytes]
 
 
+class ArtifactResult:
+    """Mixin releasing every :class:`Artifact` field of a result dataclass."""
+
+    def release(self) -> None:
+        for item in fields(self):
+            value = getattr(self, item.name)
+            if isinstance(value, Artifact):
+                value.release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.release()
+
+
 @dataclass
-class VideoPair:
-    part1_video: bytes
-    part2_video: bytes
+class VideoPair(ArtifactResult):
+    part1_video: Artifact
+    part2_video: Artifact
 
 
 # ---------------------------------------------------------------------------
@@ -82,19 +100,19 @@ class VideoPair:
 
 
 @dataclass
-class TwoPartVideoResult:
-    """All generated artifacts as in-memory bytes / strings."""
+class TwoPartVideoResult(ArtifactResult):
+    """Generated media as file-backed artifacts, texts as strings."""
 
-    part1_video: bytes
-    part2_video: bytes
+    part1_video: Artifact
+    part2_video: Artifact
     story_md: str
     original_post_md: str
-    audio_part1: bytes
-    audio_part2: bytes
+    audio_part1: Artifact
+    audio_part2: Artifact
     captions_part1_json: str
     captions_part2_json: str
-    cover_part1_png: Optional[bytes] = None
-    cover_part2_png: Optional[bytes] = None
+    cover_part1_png: Optional[Artifact] = None
+    cover_part2_png: Optional[Artifact] = None
 
 
 @dataclass
@@ -113,34 +131,45 @@ class PreparedStory:
 
 
 @dataclass
-class SingleVideoResult:
+class SingleVideoResult(ArtifactResult):
     """All generated artifacts for a single satisfying-background video."""
 
-    video: bytes
+    video: Artifact
     story_md: str
     original_post_md: str
-    audio: bytes
+    audio: Artifact
     captions_json: str
     localized_title: str
-    cover_png: Optional[bytes] = None
+    cover_png: Optional[Artifact] = None
 
 
 @dataclass
-class ImageStoryVideoResult:
+class ImageStoryVideoResult(ArtifactResult):
     """All generated artifacts for an image-story video."""
 
-    part1_video: bytes
-    part2_video: bytes
+    part1_video: Artifact
+    part2_video: Artifact
     story_md: str
     original_post_md: str
-    audio_part1: bytes
-    audio_part2: bytes
+    audio_part1: Artifact
+    audio_part2: Artifact
     captions_part1_json: str
     captions_part2_json: str
     image_story_part1_json: str
     image_story_part2_json: str
-    cover_part1_png: Optional[bytes] = None
-    cover_part2_png: Optional[bytes] = None
+    cover_part1_png: Optional[Artifact] = None
+    cover_part2_png: Optional[Artifact] = None
+
+
+def _in_job_scratch(method):
+    """Run a full pipeline inside a scratch space of its own."""
+
+    @functools.wraps(method)
+    async def wrapper(self: "RedditVideoService", *args, **kwargs):
+        with self.new_scratch():
+            return await method(self, *args, **kwargs)
+
+    return wrapper
 
 
 # ---------------------------------------------------------------------------
@@ -163,6 +192,7 @@ class RedditVideoService:
         portrait_generation_proxy: Optional[IImageGeneratorProxy] = None,
         history_adaptation_llm_proxy: Optional[ILLMProxy] = None,
         text_censor: Optional[TextCensor] = None,
+        artifact_store: Optional[ArtifactStore] = None,
     ) -> None:
         self._reddit_proxy = reddit_proxy
         self._llm_proxy = llm_proxy
@@ -174,6 +204,14 @@ class RedditVideoService:
         self._cover_service = cover_service
         self._video_service = video_service
         self._text_censor = text_censor or TextCensor()
+        self._artifacts = artifact_store or ArtifactStore()
+        self._render_slots = asyncio.Semaphore(
+            max(1, video_service._video_config.max_concurrent_renders)
+        )
+
+    def new_scratch(self) -> ScratchSpace:
+        """Create a scratch space for one job's editor temp files."""
+        return ScratchSpace.from_config(self._video_service._video_config.scratch)
 
     # ------------------------------------------------------------------
     # Step methods (used individually by the interactive bot)
@@ -235,17 +273,19 @@ class RedditVideoService:
         speech_rate: float = 1.0,
         language: Language = Language.PORTUGUESE,
     ) -> AudioPair:
-        part1 = await self._speech_service.generate_speech(
-            text=script.part1,
-            gender=script.resolved_gender,
-            rate=speech_rate,
-            language=language,
-        )
-        part2 = await self._speech_service.generate_speech(
-            text=script.part2,
-            gender=script.resolved_gender,
-            rate=speech_rate,
-            language=language,
+        part1, part2 = await asyncio.gather(
+            self._speech_service.generate_speech(
+                text=script.part1,
+                gender=script.resolved_gender,
+                rate=speech_rate,
+                language=language,
+            ),
+            self._speech_service.generate_speech(
+                text=script.part2,
+                gender=script.resolved_gender,
+                rate=speech_rate,
+                language=language,
+            ),
         )
         return AudioPair(part1=part1, part2=part2)
 
@@ -255,17 +295,21 @@ class RedditVideoService:
         script: StoryScript,
         language: Language = Language.PORTUGUESE,
     ) -> CaptionsPair:
-        cap1 = await self._captions_service.generate_captions(
-            audio_bytes=audio.part1.bytes,
-            enhance_captions=True,
-            language=language,
-            base_text=script.part1,
-        )
-        cap2 = await self._captions_service.generate_captions(
-            audio_bytes=audio.part2.bytes,
-            enhance_captions=True,
-            language=language,
-            base_text=script.part2,
+        cap1, cap2 = await asyncio.gather(
+            self._captions_service.generate_captions(
+                audio_bytes=audio.part1.bytes,
+                enhance_captions=True,
+                language=language,
+                base_text=script.part1,
+                words=audio.part1.words,
+            ),
+            self._captions_service.generate_captions(
+                audio_bytes=audio.part2.bytes,
+                enhance_captions=True,
+                language=language,
+                base_text=script.part2,
+                words=audio.part2.words,
+            ),
         )
         raw1 = [
             {"word": s.text, "start": s.start, "end": s.end}
@@ -327,19 +371,21 @@ class RedditVideoService:
         cover_part2: CoverResult,
         low_quality: bool = False,
     ) -> VideoPair:
-        video_bytes_1 = await self._render_video_to_bytes(
-            speech=audio.part1.clip,
-            captions_clip_obj=captions.part1.clip,
-            cover=cover_part1.clip,
-            low_quality=low_quality,
-        )
-        video_bytes_2 = await self._render_video_to_bytes(
-            speech=audio.part2.clip,
-            captions_clip_obj=captions.part2.clip,
-            cover=cover_part2.clip,
-            low_quality=low_quality,
+        video_1, video_2 = await asyncio.gather(
+            self._render_video_to_artifact(
+                speech=audio.part1.clip,
+                captions_clip_obj=captions.part1.clip,
+                cover=cover_part1.clip,
+                low_quality=low_quality,
+            ),
+            self._render_video_to_artifact(
+                speech=audio.part2.clip,
+                captions_clip_obj=captions.part2.clip,
+                cover=cover_part2.clip,
+                low_quality=low_quality,
+            ),
         )
-        return VideoPair(part1_video=video_bytes_1, part2_video=video_bytes_2)
+        return VideoPair(part1_video=video_1, part2_video=video_2)
 
     async def generate_characters(
         self,
@@ -423,28 +469,31 @@ class RedditVideoService:
         cover_part2: CoverResult,
         low_quality: bool = False,
     ) -> VideoPair:
-        video_bytes_1 = await self._render_image_story_to_bytes(
-            audio=audio.part1.clip,
-            image_story=image_stories.part1,
-            generated_images=image_stories.generated_images_1,
-            cover=cover_part1.clip,
-            captions=captions.part1.clip,
-            low_quality=low_quality,
-        )
-        video_bytes_2 = await self._render_image_story_to_bytes(
-            audio=audio.part2.clip,
-            image_story=image_stories.part2,
-            generated_images=image_stories.generated_images_2,
-            cover=cover_part2.clip,
-            captions=captions.part2.clip,
-            low_quality=low_quality,
+        video_1, video_2 = await asyncio.gather(
+            self._render_image_story_to_artifact(
+                audio=audio.part1.clip,
+                image_story=image_stories.part1,
+                generated_images=image_stories.generated_images_1,
+                cover=cover_part1.clip,
+                captions=captions.part1.clip,
+                low_quality=low_quality,
+            ),
+            self._render_image_story_to_artifact(
+                audio=audio.part2.clip,
+                image_story=image_stories.part2,
+                generated_images=image_stories.generated_images_2,
+                cover=cover_part2.clip,
+                captions=captions.part2.clip,
+                low_quality=low_quality,
+            ),
         )
-        return VideoPair(part1_video=video_bytes_1, part2_video=video_bytes_2)
+        return VideoPair(part1_video=video_1, part2_video=video_2)
 
     # ------------------------------------------------------------------
     # Public API (monolithic, kept for backward compat)
     # ------------------------------------------------------------------
 
+    @_in_job_scratch
     async def generate_two_part_history_video(
         self,
         *,
@@ -477,16 +526,16 @@ class RedditVideoService:
             part2_video=videos.part2_video,
             story_md=story_md,
             original_post_md=original_post_md,
-            audio_part1=audio.part1.bytes,
-            audio_part2=audio.part2.bytes,
+            audio_part1=self._artifacts.put_bytes(audio.part1.bytes, ".mp3"),
+            audio_part2=self._artifacts.put_bytes(audio.part2.bytes, ".mp3"),
             captions_part1_json=json.dumps(
                 captions.part1_data, ensure_ascii=False, indent=2
             ),
             captions_part2_json=json.dumps(
                 captions.part2_data, ensure_ascii=False, indent=2
             ),
-            cover_part1_png=cover1.bytes,
-            cover_part2_png=cover2.bytes,
+            cover_part1_png=self._cover_artifact(cover1),
+            cover_part2_png=self._cover_artifact(cover2),
         )
 
     async def prepare_satisfying_story(
@@ -522,6 +571,7 @@ class RedditVideoService:
             original_post_md=original_post_md,
         )
 
+    @_in_job_scratch
     async def generate_satisfying_video_from_story(
         self,
         prepared: PreparedStory,
@@ -544,6 +594,7 @@ class RedditVideoService:
             enhance_captions=True,
             language=language,
             base_text=prepared.script_text,
+            words=speech_result.words,
         )
 
         segments_data = [
@@ -576,7 +627,7 @@ class RedditVideoService:
             )
         )
 
-        video_bytes = await self._render_video_to_bytes(
+        video = await self._render_video_to_artifact(
             speech=speech_result.clip,
             captions_clip_obj=captions_result.clip,
             cover=cover_result.clip,
@@ -590,13 +641,13 @@ class RedditVideoService:
         story_md += f"{prepared.script_text}\n"
 
         return SingleVideoResult(
-            video=video_bytes,
+            video=video,
             story_md=story_md,
             original_post_md=prepared.original_post_md,
-            audio=speech_result.bytes,
+            audio=self._artifacts.put_bytes(speech_result.bytes, ".mp3"),
             captions_json=json.dumps(captions_data, ensure_ascii=False, indent=2),
             localized_title=prepared.story_title,
-            cover_png=cover_result.bytes,
+            cover_png=self._cover_artifact(cover_result),
         )
 
     async def generate_satisfying_video(
@@ -622,6 +673,7 @@ class RedditVideoService:
             language=language,
         )
 
+    @_in_job_scratch
     async def generate_image_story_video(
         self,
         *,
@@ -652,31 +704,37 @@ class RedditVideoService:
         )
 
         # 3. Speech
-        speech_result_1 = await self._speech_service.generate_speech(
-            text=part1_text,
-            gender=resolved_gender,
-            rate=speech_rate,
-            language=language,
-        )
-        speech_result_2 = await self._speech_service.generate_speech(
-            text=part2_text,
-            gender=resolved_gender,
-            rate=speech_rate,
-            language=language,
+        speech_result_1, speech_result_2 = await asyncio.gather(
+            self._speech_service.generate_speech(
+                text=part1_text,
+                gender=resolved_gender,
+                rate=speech_rate,
+                language=language,
+            ),
+            self._speech_service.generate_speech(
+                text=part2_text,
+                gender=resolved_gender,
+                rate=speech_rate,
+                language=language,
+            ),
         )
 
         # 4. Captions
-        captions_result_1 = await self._captions_service.generate_captions(
-            audio_bytes=speech_result_1.bytes,
-            enhance_captions=True,
-            language=language,
-            base_text=part1_text,
-        )
-        captions_result_2 = await self._captions_service.generate_captions(
-            audio_bytes=speech_result_2.bytes,
-            enhance_captions=True,
-            language=language,
-            base_text=part2_text,
+        captions_result_1, captions_result_2 = await asyncio.gather(
+            self._captions_service.generate_captions(
+                audio_bytes=speech_result_1.bytes,
+                enhance_captions=True,
+                language=language,
+                base_text=part1_text,
+                words=speech_result_1.words,
+            ),
+            self._captions_service.generate_captions(
+                audio_bytes=speech_result_2.bytes,
+                enhance_captions=True,
+                language=language,
+                base_text=part2_text,
+                words=speech_result_2.words,
+            ),
         )
 
         raw_captions_1 = [
@@ -772,30 +830,32 @@ class RedditVideoService:
         story_md += f"## Part 2\n\n{part2_text}\n"
 
         # 10. Compose videos
-        video_bytes_1 = await self._render_image_story_to_bytes(
-            audio=speech_result_1.clip,
-            image_story=image_story_1,
-            generated_images=generated_images_1,
-            cover=cover_result_1.clip,
-            captions=captions_result_1.clip,
-            low_quality=low_quality,
-        )
-        video_bytes_2 = await self._render_image_story_to_bytes(
-            audio=speech_result_2.clip,
-            image_story=image_story_2,
-            generated_images=generated_images_2,
-            cover=cover_result_2.clip,
-            captions=captions_result_2.clip,
-            low_quality=low_quality,
+        video_1, video_2 = await asyncio.gather(
+            self._render_image_story_to_artifact(
+                audio=speech_result_1.clip,
+                image_story=image_story_1,
+                generated_images=generated_images_1,
+                cover=cover_result_1.clip,
+                captions=captions_result_1.clip,
+                low_quality=low_quality,
+            ),
+            self._render_image_story_to_artifact(
+                audio=speech_result_2.clip,
+                image_story=image_story_2,
+                generated_images=generated_images_2,
+                cover=cover_result_2.clip,
+                captions=captions_result_2.clip,
+                low_quality=low_quality,
+            ),
         )
 
         return ImageStoryVideoResult(
-            part1_video=video_bytes_1,
-            part2_video=video_bytes_2,
+            part1_video=video_1,
+            part2_video=video_2,
             story_md=story_md,
             original_post_md=original_post_md,
-            audio_part1=speech_result_1.bytes,
-            audio_part2=speech_result_2.bytes,
+            audio_part1=self._artifacts.put_bytes(speech_result_1.bytes, ".mp3"),
+            audio_part2=self._artifacts.put_bytes(speech_result_2.bytes, ".mp3"),
             captions_part1_json=json.dumps(
                 captions_1_data, ensure_ascii=False, indent=2
             ),
@@ -804,8 +864,8 @@ class RedditVideoService:
             ),
             image_story_part1_json=image_story_1.model_dump_json(indent=2),
             image_story_part2_json=image_story_2.model_dump_json(indent=2),
-            cover_part1_png=cover_result_1.bytes,
-            cover_part2_png=cover_result_2.bytes,
+            cover_part1_png=self._cover_artifact(cover_result_1),
+            cover_part2_png=self._cover_artifact(cover_result_2),
         )
 
     # ------------------------------------------------------------------
@@ -1007,7 +1067,7 @@ class RedditVideoService:
             futures = [pool.submit(_generate_single, img_def) for img_def in image_story.images]
             return [f.result() for f in futures]
 
-    async def _render_image_story_to_bytes(
+    async def _render_image_story_to_artifact(
         self,
         *,
         audio: AudioClip,
@@ -1016,8 +1076,8 @@ class RedditVideoService:
         cover: Optional[image_clip.ImageClip],
         captions: Optional[CaptionsClip],
         low_quality: bool,
-    ) -> bytes:
-        final_video = self._video_service.generate_image_story_video(
+    ) -> Artifact:
+        spec = self._video_service.build_image_story_render_spec(
             audio=audio,
             image_story=image_story,
             generated_images=generated_images,
@@ -1025,25 +1085,34 @@ class RedditVideoService:
             captions=captions,
             low_quality=low_quality,
         )
-        with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as tmp:
-            tmp_path = tmp.name
-
-        def _write_and_read() -> bytes:
-            try:
-                final_video.clip.write_videofile(
-                    tmp_path,
-                    fps=24,
-                    ffmpeg_params=self._video_service._video_config.ffmpeg_params,
-                )
-                with open(tmp_path, "rb") as f:
-                    return f.read()
-            finally:
-                if os.path.exists(tmp_path):
-                    os.unlink(tmp_path)
+        threads = self._video_service.render_threads()
+        async with self._render_slots:
+            return await self._write_to_artifact(
+                lambda path: self._video_service.render_in_worker(spec, path, threads)
+            )
 
-        return await asyncio.to_thread(_write_and_read)
+    async def _write_to_artifact(
+        self, write: Callable[[str], None], suffix: str = ".mp4"
+    ) -> Artifact:
+        """Run *write* on a new artifact's path in a worker thread.
 
-    async def _render_video_to_bytes(
+        The render goes straight to the artifact file, so the video is never
+        read back into memory. The artifact is released if *write* fails.
+        """
+        artifact = self._artifacts.create(suffix)
+        try:
+            await asyncio.to_thread(write, artifact.path)
+        except BaseException:
+            artifact.release()
+            raise
+        return artifact
+
+    def _cover_artifact(self, cover: CoverResult) -> Optional[Artifact]:
+        if not cover.bytes:
+            return None
+        return self._artifacts.put_bytes(cover.bytes, ".png")
+
+    async def _render_video_to_artifact(
         self,
         *,
         speech,
@@ -1052,43 +1121,48 @@ class RedditVideoService:
         low_quality: bool,
         intro_end: float = 0,
         cta_start: float = 0,
-    ) -> bytes:
-        """Compile a single video and return it as bytes."""
+    ) -> Artifact:
+        """Compile a single video into an artifact.
+
+        Uses the backend selected by ``VideoConfig.render_backend``: the
+        moviepy composition (rendered in a worker process) or a single native
+        ffmpeg filtergraph. With ``render_segments`` above 1 the moviepy
+        composition is rendered in parallel segments. At most
+        ``max_concurrent_renders`` renders encode at once.
+        """
 
-        # Download YouTube compilation background
+        # Download YouTube compilation background. Every backend renders from
+        # the spec, so the live composition is never built here.
         compilation_result = await self._video_service.create_youtube_video_compilation(
             min_duration=speech.clip.duration,
             low_quality=low_quality,
+            sources_only=True,
         )
-        background_video = compilation_result.clip
 
-        if background_video is None:
+        if not compilation_result.sources:
             raise RuntimeError("Failed to create background video compilation.")
 
-        # Compose
-        final_video = self._video_service.generate_video(
+        config = self._video_service._video_config
+        spec = self._video_service.build_video_render_spec(
             audio=speech,
-            background_video=background_video,
+            backgrounds=compilation_result.sources,
             low_quality=low_quality,
             cover=cover,
             captions=captions_clip_obj,
             intro_end=intro_end,
             cta_start=cta_start,
         )
+        threads = self._video_service.render_threads()
 
-        with tempfile.NamedTemporaryFile(suffix=".mp4", delete=False) as tmp:
-            tmp_path = tmp.name
-
-        def _write_and_read() -> bytes:
-            try:
-                final_video.clip.write_videofile(
-                    tmp_path,
-                    ffmpeg_params=self._video_service._video_config.ffmpeg_params,
+        def render(path: str) -> None:
+            if config.render_backend == "ffmpeg":
+                self._video_service.render_video_ffmpeg(spec, path, threads)
+            elif config.render_segments > 1:
+                self._video_service.render_video_segmented(
+                    spec, path, config.render_segments, threads
                 )
-                with open(tmp_path, "rb") as f:
-                    return f.read()
-            finally:
-                if os.path.exists(tmp_path):
-                    os.unlink(tmp_path)
+            else:
+                self._video_service.render_in_worker(spec, path, threads)
 
-        return await asyncio.to_thread(_write_and_read)
+        async with self._render_slots:
+            return await self._write_to_artifact(render)
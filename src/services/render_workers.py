@@ -0,0 +1,152 @@
+"""Process-pool entry points for CPU-bound video renders.
+
+Workers only receive picklable jobs (config plus a render spec) and rebuild
+the moviepy composition themselves, so the parent never ships live clips
+across process boundaries. Their temp files go to a scratch space built
+from ``video_config.scratch``, like the parent's job scratch.
+"""
+
+import multiprocessing
+import os
+import shutil
+import tempfile
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import List, Optional, Union
+
+from ..core.logging_config import get_logger
+from ..entities.configs.services.video import VideoConfig
+from ..entities.editor.render_spec import ImageStoryRenderSpec, VideoRenderSpec
+from ..entities.editor.scratch import ScratchSpace
+from ..entities.editor.segmented_render import (
+    concat_segments,
+    gop_frames,
+    plan_segments,
+    segment_encoder_params,
+)
+
+logger = get_logger(__name__)
+
+
+@dataclass
+class SegmentJob:
+    video_config: VideoConfig
+    spec: VideoRenderSpec
+    start_frame: int
+    end_frame: int
+    output_path: str
+    ffmpeg_params: List[str] = field(default_factory=list)
+    threads: Optional[int] = None
+
+
+@dataclass
+class RenderJob:
+    video_config: VideoConfig
+    spec: Union[VideoRenderSpec, ImageStoryRenderSpec]
+    output_path: str
+    threads: Optional[int] = None
+
+
+def render_video(job: RenderJob) -> str:
+    """Compose *job.spec* with moviepy and encode it to *job.output_path*."""
+    from .video_service import VideoService
+
+    service = VideoService(youtube_proxy=None, video_config=job.video_config)
+    with ScratchSpace.from_config(job.video_config.scratch):
+        if isinstance(job.spec, ImageStoryRenderSpec):
+            video = service.compose_image_story_from_spec(job.spec)
+        else:
+            video = service.compose_video_from_spec(job.spec)
+        video.write_videofile(
+            job.output_path,
+            fps=job.spec.fps,
+            ffmpeg_params=job.spec.ffmpeg_params,
+            threads=job.threads,
+            logger=None,
+        )
+    return job.output_path
+
+
+def render_segment(job: SegmentJob) -> str:
+    """Render one frame range of *job.spec* to *job.output_path*."""
+    from .video_service import VideoService
+
+    service = VideoService(youtube_proxy=None, video_config=job.video_config)
+    with ScratchSpace.from_config(job.video_config.scratch):
+        video = service.compose_video_from_spec(job.spec)
+        video.write_frame_range(
+            job.output_path,
+            fps=job.spec.fps,
+            start_frame=job.start_frame,
+            end_frame=job.end_frame,
+            ffmpeg_params=job.ffmpeg_params,
+            threads=job.threads,
+            logger=None,
+        )
+    return job.output_path
+
+
+def create_render_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Process pool for renders; ``spawn`` keeps workers free of parent threads."""
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def render_segmented(
+    video_config: VideoConfig,
+    spec: VideoRenderSpec,
+    output_path: str,
+    segments: int,
+    threads: Optional[int] = None,
+    pool: Optional[Executor] = None,
+) -> None:
+    """Render *spec* as GOP-aligned segments in parallel and join them losslessly.
+
+    *threads* is the encoder thread budget for the whole render; it is split
+    evenly between the segments (all cores by default). Segments run on
+    *pool*, or on a pool started for this render when none is given.
+    """
+    total_frames = int(spec.total_duration * spec.fps)
+    gop = gop_frames(spec.fps)
+    ranges = plan_segments(total_frames, segments, gop)
+    budget = threads or os.cpu_count() or 1
+    threads = max(1, budget // max(len(ranges), 1))
+    params = segment_encoder_params(gop) + list(spec.ffmpeg_params)
+
+    work_dir = tempfile.mkdtemp(prefix="segments_")
+    try:
+        jobs = [
+            SegmentJob(
+                video_config=video_config,
+                spec=spec,
+                start_frame=start,
+                end_frame=end,
+                output_path=os.path.join(work_dir, f"segment_{idx:03d}.mp4"),
+                ffmpeg_params=params,
+                threads=threads,
+            )
+            for idx, (start, end) in enumerate(ranges)
+        ]
+        logger.info(
+            "Rendering %d frames in %d segments (gop=%d, %d threads each)",
+            total_frames,
+            len(jobs),
+            gop,
+            threads,
+        )
+        if pool is None:
+            with create_render_pool(len(jobs)) as own_pool:
+                segment_paths = list(own_pool.map(render_segment, jobs))
+        else:
+            segment_paths = list(pool.map(render_segment, jobs))
+        concat_segments(
+            segment_paths,
+            output_path,
+            audio_path=spec.audio_path,
+            end_silence=spec.end_silence,
+            total_duration=spec.total_duration,
+        )
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
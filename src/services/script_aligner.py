@@ -0,0 +1,139 @@
+"""Align the narration script onto Whisper word timings without an LLM.
+
+The script is the ground truth for caption text; Whisper only supplies
+timings. Both sides are reduced to comparison keys (lowercase, accents and
+punctuation removed) and aligned with :class:`difflib.SequenceMatcher`:
+
+* equal runs copy Whisper's timings onto the script tokens one to one;
+* replaced runs of the same length are paired when the words are similar
+  (misheard accents, typos); any other replaced run (numbers said as words,
+  merged or split words) spreads its time span over the script tokens by
+  character length, and counts as matched when its joined words are similar
+  or it sits between equal runs;
+* script tokens Whisper missed get times interpolated between their
+  neighbours, and words Whisper heard that are not in the script are dropped.
+
+``confidence`` is the share of script tokens matched to a heard word, so
+callers can fall back to the LLM enhancer on poor alignments.
+"""
+
+import unicodedata
+from dataclasses import dataclass
+from difflib import SequenceMatcher
+from typing import List, Optional, Sequence, Tuple
+
+from ..entities.captions import CaptionSegment
+from ..entities.transcription import TranscriptionWord
+
+# Replaced words at least this similar count as the same word.
+SIMILAR_WORD_RATIO = 0.6
+
+
+@dataclass
+class ScriptAlignment:
+    segments: List[CaptionSegment]
+    confidence: float
+
+
+def word_key(text: str) -> str:
+    """Comparison form of a word: lowercase, no accents, letters and digits only."""
+    decomposed = unicodedata.normalize("NFKD", text.lower())
+    return "".join(
+        char
+        for char in decomposed
+        if char.isalnum() and not unicodedata.combining(char)
+    )
+
+
+def _spread(
+    tokens: Sequence[str], start: float, end: float
+) -> List[Tuple[float, float]]:
+    """Split ``[start, end]`` over *tokens* in proportion to their length."""
+    weights = [max(len(word_key(token)), 1) for token in tokens]
+    total = sum(weights)
+    spans = []
+    position = start
+    for weight in weights:
+        step = (end - start) * weight / total
+        spans.append((position, position + step))
+        position += step
+    return spans
+
+
+def align_script(
+    base_text: str, words: Sequence[TranscriptionWord]
+) -> ScriptAlignment:
+    tokens = base_text.split()
+    if not tokens:
+        return ScriptAlignment(segments=[], confidence=1.0)
+    if not words:
+        return ScriptAlignment(segments=[], confidence=0.0)
+
+    script_keys = [word_key(token) for token in tokens]
+    heard_keys = [word_key(word.word) for word in words]
+    timings: List[Optional[Tuple[float, float]]] = [None] * len(tokens)
+    matched = 0
+
+    matcher = SequenceMatcher(None, script_keys, heard_keys, autojunk=False)
+    opcodes = matcher.get_opcodes()
+    for index, (tag, i1, i2, j1, j2) in enumerate(opcodes):
+        if tag == "equal":
+            for i, j in zip(range(i1, i2), range(j1, j2)):
+                timings[i] = (words[j].start, words[j].end)
+            matched += i2 - i1
+        elif tag == "replace":
+            if i2 - i1 == j2 - j1:
+                for i, j in zip(range(i1, i2), range(j1, j2)):
+                    timings[i] = (words[j].start, words[j].end)
+                    ratio = SequenceMatcher(None, script_keys[i], heard_keys[j]).ratio()
+                    if ratio >= SIMILAR_WORD_RATIO:
+                        matched += 1
+            else:
+                spans = _spread(tokens[i1:i2], words[j1].start, words[j2 - 1].end)
+                timings[i1:i2] = spans
+                joined_ratio = SequenceMatcher(
+                    None, "".join(script_keys[i1:i2]), "".join(heard_keys[j1:j2])
+                ).ratio()
+                if joined_ratio >= SIMILAR_WORD_RATIO or _is_anchored(opcodes, index):
+                    matched += i2 - i1
+
+    _interpolate_missing(tokens, timings, words[-1].end)
+    segments = [
+        CaptionSegment(start=start, end=end, text=token)
+        for token, (start, end) in zip(tokens, timings)
+    ]
+    return ScriptAlignment(segments=segments, confidence=matched / len(tokens))
+
+
+def _is_anchored(opcodes: Sequence[Tuple[str, int, int, int, int]], index: int) -> bool:
+    """Whether the opcode at *index* lies between equal runs.
+
+    The start or end of both sequences stands in for one of the anchors,
+    but at least one neighbour has to be an equal run.
+    """
+    before = opcodes[index - 1][0] if index > 0 else None
+    after = opcodes[index + 1][0] if index + 1 < len(opcodes) else None
+    if "equal" not in (before, after):
+        return False
+    return before in ("equal", None) and after in ("equal", None)
+
+
+def _interpolate_missing(
+    tokens: Sequence[str],
+    timings: List[Optional[Tuple[float, float]]],
+    audio_end: float,
+) -> None:
+    """Give runs of unmatched tokens the gap between their timed neighbours."""
+    index = 0
+    while index < len(tokens):
+        if timings[index] is not None:
+            index += 1
+            continue
+        run_end = index
+        while run_end < len(tokens) and timings[run_end] is None:
+            run_end += 1
+        gap_start = timings[index - 1][1] if index > 0 else 0.0
+        gap_end = timings[run_end][0] if run_end < len(tokens) else audio_end
+        gap_end = max(gap_end, gap_start)
+        timings[index:run_end] = _spread(tokens[index:run_end], gap_start, gap_end)
+        index = run_end
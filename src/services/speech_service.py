@@ -1,24 +1,115 @@
+import asyncio
+import json
+import os
+import re
+import unicodedata
 from dataclasses import dataclass
-from typing import Literal, Optional
+from typing import List, Literal, Optional
 
+from ..core.disk_cache import CacheStats, DiskCache
 from ..proxies.interfaces import ISpeechProxy
+from ..entities.configs.services.speech import SpeechServiceConfig
 from ..entities.editor.audio_clip import AudioClip
+from ..entities.editor.audio_join import decoded_duration, join_audio
+from ..entities.editor.scratch import current_scratch
 from ..entities.language import Language
+from ..entities.synthesized_speech import SynthesizedSpeech
+from ..entities.transcription import TranscriptionWord
 from ..core.logging_config import get_logger
 
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?…])\s+|\n+")
+_SPOKEN = re.compile(r"\w")
+
+
+def normalize_sentence(sentence: str) -> str:
+    """Canonical form used both as cache key and as the text sent to TTS."""
+    return " ".join(unicodedata.normalize("NFC", sentence).split())
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split *text* at sentence ends and line breaks.
+
+    Fragments without any word characters (stray ellipses, dashes) are
+    attached to the previous sentence so no request is sent for silence.
+    """
+    sentences: List[str] = []
+    for fragment in _SENTENCE_BREAK.split(text):
+        fragment = normalize_sentence(fragment)
+        if not fragment:
+            continue
+        if sentences and not _SPOKEN.search(fragment):
+            sentences[-1] = f"{sentences[-1]} {fragment}"
+        else:
+            sentences.append(fragment)
+    return sentences
+
 
 @dataclass
 class SpeechResult:
     clip: AudioClip
     bytes: bytes
+    # Word timings in the joined audio, when the provider reports them.
+    words: Optional[List[TranscriptionWord]] = None
+
+
+@dataclass
+class _Sentence:
+    path: str
+    duration: Optional[float] = None
+    words: Optional[List[TranscriptionWord]] = None
 
 
 class SpeechService:
-    """Speech generation service that returns a SpeechResult"""
+    """Speech generation service that returns a SpeechResult
 
-    def __init__(self, speech_proxy: ISpeechProxy):
+    Scripts are split at sentence boundaries and the sentences are synthesized
+    concurrently, at most ``speech_proxy.max_concurrent_requests`` at a time,
+    then joined sample-accurately into one MP3. With the cache enabled each
+    sentence's audio is stored under (provider and voice, rate, sentence), so
+    a revised script only synthesizes the sentences that changed.
+
+    Word timings reported by the provider are kept per sentence (in a JSON
+    entry under the cache's ``timings`` directory) together with the sentence's decoded
+    duration, and shifted by the sentences before it in the joined audio.
+    """
+
+    def __init__(
+        self,
+        speech_proxy: ISpeechProxy,
+        config: Optional[SpeechServiceConfig] = None,
+    ):
         self._speech_proxy = speech_proxy
+        self._config = config or SpeechServiceConfig()
         self._logger = get_logger(__name__)
+        cache_config = self._config.cache
+        self._cache = (
+            DiskCache(
+                cache_config.path,
+                suffix=".mp3",
+                max_size_bytes=cache_config.max_size_mb * 1024 * 1024,
+            )
+            if cache_config.enabled
+            else None
+        )
+        # Timings live in their own directory so the audio cache's size
+        # accounting and eviction only ever see MP3 entries.
+        self._timings = (
+            DiskCache(os.path.join(cache_config.path, "timings"), suffix=".json")
+            if cache_config.enabled
+            else None
+        )
+        self._stats = CacheStats()
+        self._synthesis_slots = asyncio.Semaphore(
+            max(1, speech_proxy.max_concurrent_requests)
+        )
+
+    @property
+    def cache_stats(self) -> CacheStats:
+        """Sentence cache hits and misses since the service was created.
+
+        A hit needs both the audio and its timings entry.
+        """
+        return self._stats
 
     async def generate_speech(
         self,
@@ -35,12 +126,131 @@ class SpeechService:
             gender,
             rate,
         )
-        speech_bytes = await self._speech_proxy.generate_speech(
-            text=text,
-            gender=gender,
-            rate=rate,
-            language=language,
-            override_voice_id=override_voice_id,
+        sentences = split_sentences(text)
+        if not sentences or (self._cache is None and not self._config.chunked):
+            speech = await self._synthesize(
+                text, gender, rate, language, override_voice_id
+            )
+            clip = AudioClip(bytes=speech.audio)
+            return SpeechResult(clip=clip, bytes=speech.audio, words=speech.words)
+
+        voice = self._speech_proxy.voice_identity(gender, language, override_voice_id)
+        keys = [DiskCache.make_key(voice, rate, sentence) for sentence in sentences]
+        by_key = {}
+        missing = {}
+        for key, sentence in zip(keys, sentences):
+            if key in by_key or key in missing:
+                continue
+            cached = self._cached_sentence(key)
+            if cached is None:
+                missing[key] = sentence
+            else:
+                by_key[key] = cached
+
+        async def synthesize(key: str, sentence: str) -> None:
+            speech = await self._synthesize(
+                sentence, gender, rate, language, override_voice_id
+            )
+            by_key[key] = await asyncio.to_thread(self._store_sentence, key, speech)
+
+        await asyncio.gather(
+            *(synthesize(key, sentence) for key, sentence in missing.items())
+        )
+        parts = [by_key[key] for key in keys]
+        paths = [part.path for part in parts]
+        words = self._joined_words(parts)
+
+        stats = self.cache_stats
+        self._logger.info(
+            "Speech: %d sentences, %d synthesized, %d reused "
+            "(cache totals: %d hits, %d misses)",
+            len(sentences),
+            len(missing),
+            len(sentences) - len(missing),
+            stats.hits,
+            stats.misses,
+        )
+
+        if len(paths) == 1:
+            with open(paths[0], "rb") as f:
+                speech_bytes = f.read()
+            return SpeechResult(
+                clip=AudioClip(bytes=speech_bytes), bytes=speech_bytes, words=words
+            )
+
+        output_path = current_scratch().new_path(".mp3")
+        await asyncio.to_thread(join_audio, paths, output_path)
+        with open(output_path, "rb") as f:
+            speech_bytes = f.read()
+        return SpeechResult(
+            clip=AudioClip(file_path=output_path), bytes=speech_bytes, words=words
+        )
+
+    def _cached_sentence(self, key: str) -> Optional[_Sentence]:
+        if self._cache is None:
+            return None
+        path = self._cache.get_path(key)
+        timings = self._timings.get(key) if path is not None else None
+        if timings is None:
+            self._stats.misses += 1
+            return None
+        self._stats.hits += 1
+        entry = json.loads(timings)
+        words = entry.get("words")
+        return _Sentence(
+            path=path,
+            duration=entry.get("duration"),
+            words=[TranscriptionWord(**word) for word in words] if words else None,
         )
-        clip = AudioClip(bytes=speech_bytes)
-        return SpeechResult(clip=clip, bytes=speech_bytes)
+
+    def _store_sentence(self, key: str, speech: SynthesizedSpeech) -> _Sentence:
+        if self._cache is not None:
+            path = self._cache.put(key, speech.audio)
+        else:
+            path = current_scratch().write_bytes(speech.audio, ".mp3")
+        # Offsets of later sentences need this one's exact length, which is
+        # only worth decoding for when there are timings to shift.
+        duration = decoded_duration(path) if speech.words else None
+        sentence = _Sentence(path=path, duration=duration, words=speech.words)
+        if self._timings is not None:
+            words = [word.model_dump() for word in speech.words or []]
+            entry = {"duration": duration, "words": words or None}
+            self._timings.put(key, json.dumps(entry).encode("utf-8"))
+        return sentence
+
+    @staticmethod
+    def _joined_words(parts: List[_Sentence]) -> Optional[List[TranscriptionWord]]:
+        """Shift each sentence's word timings by the audio joined before it."""
+        if any(part.words is None or part.duration is None for part in parts):
+            return None
+        words = []
+        offset = 0.0
+        for part in parts:
+            words.extend(
+                TranscriptionWord(
+                    word=word.word,
+                    start=word.start + offset,
+                    end=word.end + offset,
+                    probability=word.probability,
+                )
+                for word in part.words
+            )
+            offset += part.duration
+        return words
+
+    async def _synthesize(
+        self,
+        text: str,
+        gender: Literal["male", "female"],
+        rate: float,
+        language: Language,
+        override_voice_id: Optional[str],
+    ) -> SynthesizedSpeech:
+        async with self._synthesis_slots:
+            return await self._speech_proxy.generate_speech_with_words(
+                text=text,
+                gender=gender,
+                rate=rate,
+                language=language,
+                override_voice_id=override_voice_id,
+            )
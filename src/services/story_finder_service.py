@@ -4,14 +4,15 @@ Pipeline:
 1. Fetch posts from all configured subreddits.
 2. Compute deterministic scores per-sub (relative) + global (absolute).
 3. Take the top N candidates globally.
-4. Evaluate each with the LLM.
+4. Evaluate them with the LLM, several at a time.
 5. Return EvaluatedStory list sorted by LLM grade descending.
 """
 
+import asyncio
 import math
 import re
 import time
-from typing import List, Literal, Optional
+from typing import Awaitable, Callable, List, Literal, Optional
 import statistics
 
 from src.core.logging_config import get_logger
@@ -23,6 +24,9 @@ from src.proxies.interfaces import IRedditProxy, ILLMProxy
 
 logger = get_logger(__name__)
 
+# Called with (completed, total) as finalist evaluations finish.
+ProgressCallback = Callable[[int, int], Awaitable[None]]
+
 IDEAL_CHAR_MIN = 1500
 IDEAL_CHAR_MAX = 4000
 
@@ -236,6 +240,7 @@ class StoryFinderService:
         top_per_sub: int = 5,
         language: Language | None = None,
         subreddits: Optional[List[str]] = None,
+        on_progress: Optional[ProgressCallback] = None,
     ) -> List[EvaluatedStory]:
         finalists: List[StoryCandidate] = []
         target_language = language or Language.PORTUGUESE
@@ -287,36 +292,57 @@ class StoryFinderService:
             len(subreddit_names),
         )
 
-        evaluated: List[EvaluatedStory] = []
-        for i, candidate in enumerate(finalists, 1):
+        slots = asyncio.Semaphore(max(1, self._config.max_concurrent_evaluations))
+        completed = 0
+
+        async def evaluate(i: int, candidate: StoryCandidate) -> EvaluatedStory:
+            nonlocal completed
             post = candidate.post
             sub_name = post.community.replace("r/", "")
-            logger.info(
-                "  [%d/%d] Evaluating (r/%s, det=%.1f): %s",
-                i,
-                len(finalists),
-                sub_name,
-                candidate.deterministic_score,
-                post.title[:50],
-            )
-            try:
-                evaluation = await self._llm.evaluate_story(
-                    title=post.title,
-                    content=post.content,
-                    target_language=target_language,
-                )
-            except Exception:
-                logger.exception("LLM evaluation failed for '%s'", post.title[:60])
-                evaluation = {"nota_geral": 0.0, "veredito": "Erro", "resumo": "", "notas": {}}
-
-            evaluated.append(
-                EvaluatedStory(
-                    post=post,
-                    deterministic_score=candidate.deterministic_score,
-                    evaluation=evaluation,
+            async with slots:
+                logger.info(
+                    "  [%d/%d] Evaluating (r/%s, det=%.1f): %s",
+                    i,
+                    len(finalists),
+                    sub_name,
+                    candidate.deterministic_score,
+                    post.title[:50],
                 )
+                try:
+                    evaluation = await self._llm.evaluate_story(
+                        title=post.title,
+                        content=post.content,
+                        target_language=target_language,
+                    )
+                except Exception:
+                    logger.exception("LLM evaluation failed for '%s'", post.title[:60])
+                    evaluation = {
+                        "nota_geral": 0.0,
+                        "veredito": "Erro",
+                        "resumo": "",
+                        "notas": {},
+                    }
+
+            completed += 1
+            if on_progress is not None:
+                try:
+                    await on_progress(completed, len(finalists))
+                except Exception:
+                    logger.exception("Evaluation progress callback failed")
+            return EvaluatedStory(
+                post=post,
+                deterministic_score=candidate.deterministic_score,
+                evaluation=evaluation,
             )
 
+        # gather keeps finalist order, so the stable sort below ranks ties
+        # exactly as a sequential run would.
+        evaluated: List[EvaluatedStory] = list(
+            await asyncio.gather(
+                *(evaluate(i, c) for i, c in enumerate(finalists, 1))
+            )
+        )
+
         evaluated.sort(key=lambda e: e.nota_geral, reverse=True)
         excellent = [e for e in evaluated if e.veredito == "Excelente"]
         if len(excellent) >= 10:
@@ -1,19 +1,36 @@
+import asyncio
+import atexit
 import io
 import logging
+import os
 import random
-from dataclasses import dataclass
-from typing import Optional, List
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from typing import Deque, Optional, List
 
 import numpy as np
-from moviepy import CompositeVideoClip, VideoClip as MoviepyVideoClip
+from moviepy import VideoClip as MoviepyVideoClip
 from moviepy.video.fx import CrossFadeIn
 from PIL import Image, ImageFilter
 
 from ..proxies.interfaces import IYouTubeProxy
 from ..entities.configs.services.video import VideoConfig
 from ..entities.image_story import ImageStory
+from ..entities.youtube_video import YouTubeVideoMetadata
 
 from ..entities.editor import image_clip, audio_clip, video_clip, captions_clip
+from ..entities.editor.ffmpeg_render import FFmpegVideoRender
+from ..entities.editor.layer_compositor import LayerCompositeVideoClip
+from ..entities.editor.scratch import current_scratch
+from ..entities.editor.render_spec import (
+    BackgroundSource,
+    ImageStoryRenderSpec,
+    VideoRenderSpec,
+)
+from .background_library import BackgroundLibrary
+from .youtube_metadata_index import YouTubeMetadataIndex, select_covering_subset
+from .render_workers import RenderJob, create_render_pool, render_segmented, render_video
 
 
 logger = logging.getLogger(__name__)
@@ -21,8 +38,10 @@ logger = logging.getLogger(__name__)
 
 @dataclass
 class YouTubeCompilationResult:
-    clip: video_clip.VideoClip
+    # ``None`` when only the sources were requested.
+    clip: Optional[video_clip.VideoClip]
     downloaded_bytes: List[bytes]
+    sources: List[BackgroundSource] = field(default_factory=list)
 
 
 class VideoService:
@@ -32,9 +51,13 @@ class VideoService:
         self,
         youtube_proxy: IYouTubeProxy,
         video_config: VideoConfig,
+        background_library: Optional[BackgroundLibrary] = None,
+        metadata_index: Optional[YouTubeMetadataIndex] = None,
     ):
         self._youtube_proxy = youtube_proxy
         self._video_config = video_config
+        self._background_library = background_library
+        self._metadata_index = metadata_index
         self._watermark_bytes = None
         if self._video_config.watermark_path:
             with open(self._video_config.watermark_path, "rb") as f:
@@ -45,50 +68,281 @@ class VideoService:
             with open(self._video_config.call_to_action_path, "rb") as f:
                 self._call_to_action_bytes = f.read()
 
+        self._render_pool = None
+
     async def create_youtube_video_compilation(
-        self, min_duration: int, low_quality: bool = False
+        self,
+        min_duration: int,
+        low_quality: bool = False,
+        sources_only: bool = False,
     ) -> YouTubeCompilationResult:
-        """Create video compilation from YouTube content"""
+        """Create video compilation from YouTube content
+
+        With *sources_only* the background clips are probed and closed
+        instead of being concatenated, for callers that render from a
+        ``VideoRenderSpec`` and never need the live composition.
+        """
 
         video_ids = await self._list_youtube_compilation_video_ids()
         random.shuffle(video_ids)
+        video_ids = await self._fit_compilation_video_ids(video_ids, min_duration)
 
         video = video_clip.VideoClip()
         downloaded_bytes: List[bytes] = []
+        sources: List[BackgroundSource] = []
         total_duration = 0
 
-        for video_id in video_ids:
-            try:
-                video_bytes = await self._youtube_proxy.download_video(
-                    video_id, low_quality
+        # Keep up to ``youtube_download_concurrency`` downloads in flight but
+        # consume them in shuffle order, so the chosen clips do not depend on
+        # which download happens to finish first.
+        limit = max(1, self._video_config.youtube_download_concurrency)
+        remaining_ids = iter(video_ids)
+        in_flight: Deque[tuple[str, asyncio.Task]] = deque()
+
+        def fill() -> None:
+            while len(in_flight) < limit:
+                video_id = next(remaining_ids, None)
+                if video_id is None:
+                    return
+                task = asyncio.ensure_future(
+                    self._load_background(video_id, low_quality)
                 )
-                new_video = video_clip.VideoClip(bytes=video_bytes)
-                duration = float(new_video.clip.duration or 0)
-            except Exception:
-                logger.exception("Skipping unusable YouTube background %s", video_id)
-                continue
+                in_flight.append((video_id, task))
+
+        try:
+            fill()
+            while in_flight:
+                video_id, task = in_flight.popleft()
+                try:
+                    new_video, video_bytes = await task
+                    duration = (
+                        float(new_video.clip.duration or 0) if new_video else 0
+                    )
+                except Exception:
+                    logger.exception(
+                        "Skipping unusable YouTube background %s", video_id
+                    )
+                    fill()
+                    continue
+
+                if duration <= 0:
+                    logger.warning(
+                        "Skipping zero-duration YouTube background %s",
+                        video_id,
+                    )
+                    if new_video is not None:
+                        new_video.close()
+                    fill()
+                    continue
+
+                if video_bytes is not None:
+                    downloaded_bytes.append(video_bytes)
+                try:
+                    new_video.apply_anti_fingerprint(
+                        self._video_config.anti_fingerprint
+                    )
+                    source = BackgroundSource(
+                        path=new_video.file_path,
+                        duration=duration,
+                        fps=float(new_video.clip.fps or 0),
+                        anti_fingerprint=new_video.anti_fingerprint_params,
+                    )
+                except Exception:
+                    new_video.close()
+                    raise
+                sources.append(source)
+                if sources_only:
+                    # The file stays in scratch for the render spec.
+                    new_video.clip.close()
+                else:
+                    video.concat(new_video)
+                total_duration += duration
+
+                if total_duration >= min_duration:
+                    return YouTubeCompilationResult(
+                        clip=None if sources_only else video,
+                        downloaded_bytes=downloaded_bytes,
+                        sources=sources,
+                    )
+                fill()
+        finally:
+            await self._cancel_downloads([task for _, task in in_flight])
+
+        raise Exception(
+            f"Video compilation completed with {total_duration:.1f}s duration (all available videos used)"
+        )
+
+    async def _fit_compilation_video_ids(
+        self, video_ids: List[str], min_duration: float
+    ) -> List[str]:
+        """Move the clips that best cover *min_duration* to the front.
+
+        Uses indexed durations, looking up at most ``max_lookups_per_run``
+        unknown ones from the proxy (the first in shuffle order), and drops
+        candidates known to be empty. Only known durations are fitted; the
+        remaining ids keep their shuffled order after the selection, so a
+        clip that fails to load is replaced by the next candidate as before.
+        """
+        index = self._metadata_index
+        if index is None or not self._video_config.youtube_index.duration_fitting:
+            return video_ids
+
+        unknown = [video_id for video_id in video_ids if index.get(video_id) is None]
+        max_lookups = self._video_config.youtube_index.max_lookups_per_run
+        unknown = unknown[: max(0, max_lookups)]
+        if unknown:
+            limit = asyncio.Semaphore(
+                max(1, self._video_config.youtube_download_concurrency)
+            )
+
+            async def lookup(video_id: str) -> Optional[YouTubeVideoMetadata]:
+                async with limit:
+                    try:
+                        return await self._youtube_proxy.get_video_metadata(video_id)
+                    except Exception:
+                        logger.exception("Metadata lookup failed for %s", video_id)
+                        return None
+
+            for metadata in await asyncio.gather(*(lookup(v) for v in unknown)):
+                if metadata is not None:
+                    index.put(metadata)
+
+        window = self._video_config.youtube_clip_window_seconds
+        durations = {}
+        for video_id in video_ids:
+            metadata = index.get(video_id)
+            if metadata is not None:
+                durations[video_id] = metadata.duration
+                if window > 0:
+                    durations[video_id] = min(metadata.duration, window)
+        selected = select_covering_subset(
+            [(video_id, durations[video_id]) for video_id in durations], min_duration
+        )
+        if selected:
+            logger.info(
+                "Selected %d background clips totalling %.1fs for %.1fs",
+                len(selected),
+                sum(durations[video_id] for video_id in selected),
+                min_duration,
+            )
+        chosen = set(selected)
+        return selected + [
+            video_id
+            for video_id in video_ids
+            if video_id not in chosen and durations.get(video_id, 1) > 0
+        ]
 
-            if duration <= 0:
-                logger.warning(
-                    "Skipping zero-duration YouTube background %s",
+    def _record_probed_metadata(
+        self,
+        video_id: str,
+        duration: float,
+        size: Optional[tuple] = None,
+        fps: Optional[float] = None,
+    ) -> None:
+        if self._metadata_index is None:
+            return
+        width, height = size or (None, None)
+        self._metadata_index.put(
+            YouTubeVideoMetadata(
+                video_id=video_id,
+                duration=duration,
+                width=width or None,
+                height=height or None,
+                fps=fps or None,
+                source="probe",
+            )
+        )
+
+    @staticmethod
+    async def _cancel_downloads(tasks: List[asyncio.Task]) -> None:
+        """Cancel unconsumed prefetches and close the clips the finished ones opened."""
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            for result in results:
+                if isinstance(result, tuple) and result[0] is not None:
+                    result[0].close()
+
+    async def _load_background(
+        self, video_id: str, low_quality: bool
+    ) -> tuple[Optional[video_clip.VideoClip], Optional[bytes]]:
+        """Open a background clip, from the library when possible.
+
+        Returns the clip (``None`` when the library already knows it is
+        empty) and the downloaded bytes, which are only kept in memory when
+        no library is configured.
+        """
+        library = self._background_library
+        window = self._video_config.youtube_clip_window_seconds
+        if library is None:
+            video_bytes = await self._download_background(video_id, low_quality)
+            clip = video_clip.VideoClip(bytes=video_bytes)
+            if not window:
+                self._record_probed_metadata(
                     video_id,
+                    float(clip.clip.duration or 0),
+                    getattr(clip.clip, "size", None),
+                    clip.clip.fps,
                 )
-                continue
-
-            downloaded_bytes.append(video_bytes)
-            new_video.apply_anti_fingerprint(self._video_config.anti_fingerprint)
-            video.concat(new_video)
-            total_duration += duration
+            return clip, video_bytes
+
+        # Windowed downloads are stored apart from whole videos, using the
+        # media fragment notation for the window.
+        library_id = f"{video_id}#t=0,{window}" if window else video_id
+        entry = library.get(library_id, low_quality)
+        if entry is None:
+            video_bytes = await self._download_background(video_id, low_quality)
+            entry = await asyncio.to_thread(
+                library.put, library_id, low_quality, video_bytes
+            )
+            del video_bytes
+        else:
+            logger.info("Background %s served from the local library", video_id)
+        if not window:
+            self._record_probed_metadata(
+                video_id, entry.duration, (entry.width, entry.height), entry.fps
+            )
 
-            if total_duration >= min_duration:
-                return YouTubeCompilationResult(
-                    clip=video, downloaded_bytes=downloaded_bytes
+        if entry.duration <= 0:
+            return None, None
+        path = entry.path
+        library_config = self._video_config.background_library
+        zoom = 1.0
+        if library_config.mezzanine:
+            config, _ = self._scaled_config(low_quality)
+            # Bake the anti-fingerprint zoom into the copy so renders do not
+            # resize every frame for it.
+            anti_fingerprint = self._video_config.anti_fingerprint
+            mezzanine_zoom = (
+                anti_fingerprint.zoom if anti_fingerprint.enabled else 1.0
+            )
+            try:
+                path = await asyncio.to_thread(
+                    library.mezzanine,
+                    entry,
+                    config.width,
+                    config.height,
+                    library_config.mezzanine_fps,
+                    mezzanine_zoom,
+                )
+                zoom = mezzanine_zoom
+            except Exception:
+                logger.exception(
+                    "Mezzanine transcode failed for %s, using the original clip",
+                    video_id,
                 )
-        if total_duration < min_duration:
-            raise Exception(
-                f"Video compilation completed with {total_duration:.1f}s duration (all available videos used)"
+        clip = video_clip.VideoClip(file_path=path)
+        clip.baked_zoom = zoom
+        return clip, None
+
+    async def _download_background(self, video_id: str, low_quality: bool) -> bytes:
+        window = self._video_config.youtube_clip_window_seconds
+        if window > 0:
+            return await self._youtube_proxy.download_video(
+                video_id, low_quality, duration=window
             )
-        return YouTubeCompilationResult(clip=video, downloaded_bytes=downloaded_bytes)
+        return await self._youtube_proxy.download_video(video_id, low_quality)
 
     async def _list_youtube_compilation_video_ids(self) -> List[str]:
         channel_urls = self._youtube_channel_urls()
@@ -133,16 +387,53 @@ class VideoService:
         raise ValueError(f"Unknown YouTube channel strategy: {strategy}")
 
     async def _list_channel_video_ids(self, channel_url: str) -> List[str]:
-        video_ids = await self._youtube_proxy.list_video_ids(
-            channel_url,
-            surface=self._video_config.youtube_surface,
-        )
+        surface = self._video_config.youtube_surface
+        index = self._metadata_index
+        if index is None:
+            video_ids = await self._youtube_proxy.list_video_ids(
+                channel_url, surface=surface
+            )
+        else:
+            video_ids = await self._cached_channel_video_ids(index, channel_url)
 
         pool = self._video_config.youtube_pool_size
         if pool > 0:
             return video_ids[:pool]
         return video_ids
 
+    async def _cached_channel_video_ids(
+        self, index: YouTubeMetadataIndex, channel_url: str
+    ) -> List[str]:
+        """List a channel from the index, scraping only what is missing.
+
+        A cold start lists the whole channel. An expired listing is refreshed
+        from the channel's newest page and merged; if that fails the stale
+        listing is used.
+        """
+        surface = self._video_config.youtube_surface
+        listing = index.get_channel(channel_url, surface)
+        if listing is None:
+            video_ids = await self._youtube_proxy.list_video_ids(
+                channel_url, surface=surface
+            )
+            return index.put_channel(channel_url, surface, video_ids).video_ids
+
+        if index.is_fresh(listing):
+            return listing.video_ids
+
+        try:
+            newest = await self._youtube_proxy.list_video_ids(
+                channel_url, surface=surface, newest_only=True
+            )
+        except Exception:
+            logger.exception(
+                "Refreshing channel %s failed, using the cached listing", channel_url
+            )
+            return listing.video_ids
+        return index.put_channel(
+            channel_url, surface, newest, newest_only=True
+        ).video_ids
+
     def _youtube_channel_urls(self) -> List[str]:
         channel_urls = [
             url.strip()
@@ -155,6 +446,221 @@ class VideoService:
             raise ValueError("At least one YouTube channel URL must be configured")
         return channel_urls
 
+    def _scaled_config(self, low_quality: bool) -> tuple[VideoConfig, float]:
+        """Return the config to render with and the caption size rate."""
+        config = self._video_config
+        size_rate = 1.0
+        if low_quality:
+            size_rate = 400 / config.height
+            config = config.model_copy(
+                update=dict(
+                    width=int(round(config.width * size_rate)),
+                    height=int(round(config.height * size_rate)),
+                    padding=int(round(config.padding * size_rate)),
+                )
+            )
+        return config, size_rate
+
+    def build_video_render_spec(
+        self,
+        audio: audio_clip.AudioClip,
+        backgrounds: List[BackgroundSource],
+        low_quality: bool = False,
+        cover: Optional[image_clip.ImageClip] = None,
+        captions: Optional[captions_clip.CaptionsClip] = None,
+        intro_end: float = 0,
+        cta_start: float = 0,
+    ) -> VideoRenderSpec:
+        """Describe the same composition as ``generate_video`` with plain data.
+
+        Takes the inputs of ``generate_video`` but leaves them untouched, so
+        the spec can be handed to a render backend that reads from disk.
+        """
+        config, size_rate = self._scaled_config(low_quality)
+        fps = max((source.fps for source in backgrounds), default=0) or 30
+        subtitles_path = None
+        if captions is not None and captions.uses_ass:
+            subtitles_path = captions.write_ass(config.width, config.height, size_rate)
+
+        return VideoRenderSpec(
+            audio_path=audio.file_path,
+            audio_duration=float(audio.clip.duration),
+            backgrounds=list(backgrounds),
+            width=config.width,
+            height=config.height,
+            padding=config.padding,
+            end_silence=config.end_silece_seconds,
+            fps=fps,
+            cover_path=cover.file_path if cover is not None else None,
+            cover_duration=intro_end if intro_end > 0 else config.cover_duration,
+            intro_end=intro_end,
+            cta_path=(
+                self._video_config.call_to_action_path
+                if self._call_to_action_bytes is not None
+                else None
+            ),
+            cta_start=cta_start,
+            watermark_path=(
+                self._video_config.watermark_path
+                if self._watermark_bytes is not None
+                else None
+            ),
+            captions=captions.captions if captions is not None else None,
+            captions_config=captions.config if captions is not None else None,
+            font_path=captions.font_path if captions is not None else None,
+            subtitles_path=subtitles_path,
+            fonts_dir=captions.fonts_dir if subtitles_path else None,
+            size_rate=size_rate,
+            low_quality=low_quality,
+            crossfade=self.CROSSFADE_DURATION,
+            ffmpeg_params=list(config.ffmpeg_params),
+        )
+
+    def compose_video_from_spec(self, spec: VideoRenderSpec) -> video_clip.VideoClip:
+        """Rebuild the ``generate_video`` composition from a render spec.
+
+        Reloads every input from disk and replays the recorded
+        anti-fingerprint params, so a worker process renders the same frames
+        as the process that built the spec.
+        """
+        background = video_clip.VideoClip()
+        for source in spec.backgrounds:
+            clip = video_clip.VideoClip(file_path=source.path)
+            if source.anti_fingerprint is not None:
+                clip.apply_anti_fingerprint(
+                    self._video_config.anti_fingerprint.model_copy(
+                        update=dict(enabled=True)
+                    ),
+                    params=source.anti_fingerprint,
+                )
+            background.concat(clip)
+
+        return self.generate_video(
+            audio=audio_clip.AudioClip(spec.audio_path),
+            background_video=background,
+            low_quality=spec.low_quality,
+            cover=image_clip.ImageClip(spec.cover_path) if spec.cover_path else None,
+            captions=self._captions_from_spec(spec),
+            intro_end=spec.intro_end,
+            cta_start=spec.cta_start,
+        )
+
+    def build_image_story_render_spec(
+        self,
+        audio: audio_clip.AudioClip,
+        image_story: ImageStory,
+        generated_images: List[bytes],
+        cover: Optional[image_clip.ImageClip] = None,
+        captions: Optional[captions_clip.CaptionsClip] = None,
+        low_quality: bool = False,
+    ) -> ImageStoryRenderSpec:
+        """Describe ``generate_image_story_video`` inputs with plain data."""
+        scratch = current_scratch()
+        image_paths = [
+            scratch.write_bytes(img_bytes, ".png") for img_bytes in generated_images
+        ]
+
+        return ImageStoryRenderSpec(
+            audio_path=audio.file_path,
+            image_story=image_story,
+            image_paths=image_paths,
+            cover_path=cover.file_path if cover is not None else None,
+            captions=captions.captions if captions is not None else None,
+            captions_config=captions.config if captions is not None else None,
+            font_path=captions.font_path if captions is not None else None,
+            low_quality=low_quality,
+            ffmpeg_params=list(self._video_config.ffmpeg_params),
+        )
+
+    def compose_image_story_from_spec(
+        self, spec: ImageStoryRenderSpec
+    ) -> video_clip.VideoClip:
+        """Rebuild the ``generate_image_story_video`` composition from a spec."""
+        generated_images = []
+        for path in spec.image_paths:
+            with open(path, "rb") as f:
+                generated_images.append(f.read())
+
+        return self.generate_image_story_video(
+            audio=audio_clip.AudioClip(spec.audio_path),
+            image_story=spec.image_story,
+            generated_images=generated_images,
+            cover=image_clip.ImageClip(spec.cover_path) if spec.cover_path else None,
+            captions=self._captions_from_spec(spec),
+            low_quality=spec.low_quality,
+        )
+
+    @staticmethod
+    def _captions_from_spec(spec) -> Optional[captions_clip.CaptionsClip]:
+        if spec.captions is None:
+            return None
+        with open(spec.font_path, "rb") as f:
+            return captions_clip.CaptionsClip(
+                captions=spec.captions,
+                config=spec.captions_config,
+                font_bytes=f.read(),
+            )
+
+    def render_threads(self) -> int:
+        """Encoder threads per render so concurrent renders share the cores."""
+        concurrency = max(1, self._video_config.max_concurrent_renders)
+        return max(1, (os.cpu_count() or 1) // concurrency)
+
+    def render_in_worker(
+        self,
+        spec,
+        output_path: str,
+        threads: Optional[int] = None,
+    ) -> None:
+        """Render a video or image-story spec with moviepy in a worker process.
+
+        Blocks until the worker is done; call it from a thread.
+        """
+        job = RenderJob(
+            video_config=self._video_config,
+            spec=spec,
+            output_path=output_path,
+            threads=threads,
+        )
+        self._worker_pool().submit(render_video, job).result()
+
+    def _worker_pool(self) -> ProcessPoolExecutor:
+        """Lazily started render pool shared by whole and segmented renders.
+
+        It has a worker per segment of every render allowed to run at once.
+        """
+        if self._render_pool is None:
+            config = self._video_config
+            self._render_pool = create_render_pool(
+                max(1, config.max_concurrent_renders) * max(1, config.render_segments)
+            )
+            atexit.register(self._render_pool.shutdown)
+        return self._render_pool
+
+    @staticmethod
+    def render_video_ffmpeg(
+        spec: VideoRenderSpec, output_path: str, threads: Optional[int] = None
+    ) -> None:
+        """Render *spec* with the native ffmpeg filtergraph backend."""
+        FFmpegVideoRender(spec).write_videofile(output_path, threads=threads)
+
+    def render_video_segmented(
+        self,
+        spec: VideoRenderSpec,
+        output_path: str,
+        segments: int,
+        threads: Optional[int] = None,
+    ) -> None:
+        """Render *spec* with moviepy in parallel GOP-aligned segments."""
+        render_segmented(
+            self._video_config,
+            spec,
+            output_path,
+            segments,
+            threads,
+            pool=self._worker_pool(),
+        )
+
     def generate_video(
         self,
         audio: audio_clip.AudioClip,
@@ -171,17 +677,7 @@ class VideoService:
         When *cta_start* is positive the configured CTA image is composited
         at that time.
         """
-        config = self._video_config
-        size_rate = 1.0
-        if low_quality:
-            size_rate = 400 / config.height
-            config = config.model_copy(
-                update=dict(
-                    width=int(round(config.width * size_rate)),
-                    height=int(round(config.height * size_rate)),
-                    padding=int(round(config.padding * size_rate)),
-                )
-            )
+        config, size_rate = self._scaled_config(low_quality)
 
         audio.add_end_silence(config.end_silece_seconds)
         background_video.resize(config.width, config.height)
@@ -191,6 +687,7 @@ class VideoService:
         width, height = background_video.clip.size
         total_duration = audio.clip.duration
         fade = self.CROSSFADE_DURATION
+        layers = []
 
         # --- cover ---
         if cover is not None:
@@ -199,7 +696,7 @@ class VideoService:
             cover_dur = intro_end if intro_end > 0 else config.cover_duration
             cover.set_duration(cover_dur)
             cover.apply_fadeout(1)
-            background_video.merge(cover)
+            layers.append(cover.clip)
 
         # --- CTA image overlay ---
         if self._call_to_action_bytes is not None and cta_start > 0 and cta_start < total_duration:
@@ -209,7 +706,7 @@ class VideoService:
             cta_clip.set_start(cta_start)
             cta_clip.set_duration(total_duration - cta_start)
             cta_clip.apply_fadein(fade)
-            background_video.merge(cta_clip)
+            layers.append(cta_clip.clip)
 
         # --- watermark ---
         if self._watermark_bytes is not None:
@@ -217,11 +714,18 @@ class VideoService:
             water_mark.fit_width(width, config.padding)
             water_mark.center(width, height)
             water_mark.set_duration(total_duration)
-            background_video.merge(water_mark)
+            layers.append(water_mark.clip)
 
         # --- captions ---
-        if captions is not None:
-            background_video.insert_captions(captions, size_rate=size_rate)
+        if captions is not None and captions.uses_ass:
+            background_video.burn_subtitles(
+                captions.write_ass(width, height, size_rate), captions.fonts_dir
+            )
+        elif captions is not None:
+            layers.extend(captions.get_clips(size_rate))
+
+        if layers:
+            background_video.add_layers(layers)
         return background_video
 
     CROSSFADE_DURATION = 0.5
@@ -245,17 +749,7 @@ class VideoService:
            Ken Burns zoom + crossfade transitions between images.
         3. Call-to-action: the active image blurs and a CTA overlay appears.
         """
-        config = self._video_config
-        size_rate = 1.0
-        if low_quality:
-            size_rate = 400 / config.height
-            config = config.model_copy(
-                update=dict(
-                    width=int(round(config.width * size_rate)),
-                    height=int(round(config.height * size_rate)),
-                    padding=int(round(config.padding * size_rate)),
-                )
-            )
+        config, size_rate = self._scaled_config(low_quality)
 
         width, height = config.width, config.height
         audio.add_end_silence(config.end_silece_seconds)
@@ -320,20 +814,26 @@ class VideoService:
             cta_clip.apply_fadein(fade)
             moviepy_clips.append(cta_clip.clip)
 
-        result = video_clip.VideoClip()
-        result.clip = CompositeVideoClip(moviepy_clips, size=(width, height))
-        result.clip = result.clip.with_duration(total_duration)
-        result.clip = result.clip.with_audio(audio.clip)
-
         if self._watermark_bytes is not None:
             water_mark = image_clip.ImageClip(bytes=self._watermark_bytes)
             water_mark.fit_width(width, config.padding)
             water_mark.center(width, height)
             water_mark.set_duration(total_duration)
-            result.merge(water_mark)
+            moviepy_clips.append(water_mark.clip)
+
+        if captions is not None and not captions.uses_ass:
+            moviepy_clips.extend(captions.get_clips(size_rate))
 
-        if captions is not None:
-            result.insert_captions(captions, size_rate=size_rate)
+        result = video_clip.VideoClip()
+        result.clip = LayerCompositeVideoClip(
+            moviepy_clips, size=(width, height), bg_color=(0, 0, 0)
+        )
+        result.clip = result.clip.with_duration(total_duration)
+        result.clip = result.clip.with_audio(audio.clip)
+        if captions is not None and captions.uses_ass:
+            result.burn_subtitles(
+                captions.write_ass(width, height, size_rate), captions.fonts_dir
+            )
 
         return result
 
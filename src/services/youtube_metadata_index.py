@@ -0,0 +1,182 @@
+"""Persistent index of YouTube background candidates and their durations.
+
+Channel listings are cached here as well, so only a cold start pays for a
+full channel scrape; expired listings are refreshed from the newest page.
+
+Compilations look durations up here before downloading anything, so they
+can pick the subset of clips that covers the narration with the least
+footage to spare. Entries come from channel listings or watch pages
+(``source="listing"``) and are replaced by the probed values of the file
+once a clip has been opened (``source="probe"``).
+
+Layout under ``YouTubeIndexConfig.path``::
+
+    videos.json     video_id -> YouTubeVideoMetadata
+    channels.json   "<surface>:<channel url>" -> video ids, newest first
+"""
+
+import json
+import math
+import os
+import tempfile
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..core.logging_config import get_logger
+from ..entities.configs.services.video import YouTubeIndexConfig
+from ..entities.youtube_video import YouTubeVideoMetadata
+
+logger = get_logger(__name__)
+
+
+def select_covering_subset(
+    candidates: Sequence[Tuple[str, float]], min_duration: float
+) -> List[str]:
+    """Return the ids whose durations cover *min_duration* with least waste.
+
+    A 0/1 knapsack over whole seconds: durations are rounded down and the
+    target up, so the chosen clips always cover *min_duration*. Among sets
+    with the same total, the one with fewer clips wins, then the one found
+    first in *candidates* order. Returns an empty list when all candidates
+    together are too short.
+    """
+    target = math.ceil(min_duration)
+    items = [(video_id, int(duration)) for video_id, duration in candidates]
+    items = [(video_id, seconds) for video_id, seconds in items if seconds > 0]
+    if target <= 0 or not items:
+        return []
+
+    # A clip covering the target alone beats any set that contains it, so
+    # only the shortest such clip matters and the table stays small.
+    long_items = [item for item in items if item[1] >= target]
+    best_single = min(long_items, key=lambda item: item[1]) if long_items else None
+    short_items = [item for item in items if item[1] < target]
+    cap = target + max((seconds for _, seconds in short_items), default=0)
+    if best_single is not None:
+        cap = min(cap, best_single[1] - 1)
+
+    reach: List[Optional[Tuple[int, ...]]] = [None] * (cap + 1)
+    reach[0] = ()
+    for index, (_, seconds) in enumerate(short_items):
+        for total in range(cap, seconds - 1, -1):
+            previous = reach[total - seconds]
+            if previous is None:
+                continue
+            current = reach[total]
+            if current is None or len(previous) + 1 < len(current):
+                reach[total] = previous + (index,)
+
+    for total in range(target, cap + 1):
+        if reach[total] is not None:
+            return [short_items[index][0] for index in reach[total]]
+    return [best_single[0]] if best_single is not None else []
+
+
+@dataclass
+class ChannelListing:
+    video_ids: List[str]
+    fetched_at: float
+
+
+class YouTubeMetadataIndex:
+    """JSON-backed map of video id to duration, resolution and fps."""
+
+    VIDEOS_FILE = "videos.json"
+    CHANNELS_FILE = "channels.json"
+
+    def __init__(self, config: YouTubeIndexConfig):
+        self._config = config
+        self._root = config.path
+        self._lock = threading.Lock()
+        os.makedirs(self._root, exist_ok=True)
+        self._videos: Dict[str, YouTubeVideoMetadata] = {
+            video_id: YouTubeVideoMetadata(**value)
+            for video_id, value in self._load(self.VIDEOS_FILE).items()
+        }
+        self._channels: Dict[str, ChannelListing] = {
+            key: ChannelListing(**value)
+            for key, value in self._load(self.CHANNELS_FILE).items()
+        }
+
+    @staticmethod
+    def create_optional(
+        config: YouTubeIndexConfig | None,
+    ) -> "YouTubeMetadataIndex | None":
+        if config is None or not config.enabled:
+            return None
+        return YouTubeMetadataIndex(config)
+
+    def get(self, video_id: str) -> Optional[YouTubeVideoMetadata]:
+        return self._videos.get(video_id)
+
+    def put(self, metadata: YouTubeVideoMetadata) -> None:
+        with self._lock:
+            known = self._videos.get(metadata.video_id)
+            if known is not None:
+                if known.source == "probe" and metadata.source != "probe":
+                    return
+                unchanged = known.model_dump(exclude={"updated_at"})
+                if unchanged == metadata.model_dump(exclude={"updated_at"}):
+                    return
+            if not metadata.updated_at:
+                metadata = metadata.model_copy(update=dict(updated_at=time.time()))
+            self._videos[metadata.video_id] = metadata
+            self._save(
+                self.VIDEOS_FILE,
+                {
+                    video_id: metadata.model_dump()
+                    for video_id, metadata in self._videos.items()
+                },
+            )
+
+    @staticmethod
+    def channel_key(url: str, surface: str) -> str:
+        return f"{surface}:{url}"
+
+    def get_channel(self, url: str, surface: str) -> Optional[ChannelListing]:
+        return self._channels.get(self.channel_key(url, surface))
+
+    def is_fresh(self, listing: ChannelListing) -> bool:
+        return time.time() - listing.fetched_at < self._config.channel_ttl_seconds
+
+    def put_channel(
+        self, url: str, surface: str, video_ids: List[str], newest_only: bool = False
+    ) -> ChannelListing:
+        """Store a channel listing and return it.
+
+        With *newest_only* the ids are the channel's first page: they are
+        put in front of the cached listing instead of replacing it.
+        """
+        with self._lock:
+            key = self.channel_key(url, surface)
+            known = self._channels.get(key)
+            if newest_only and known is not None:
+                newest = set(video_ids)
+                video_ids = list(video_ids) + [
+                    video_id for video_id in known.video_ids if video_id not in newest
+                ]
+            listing = ChannelListing(video_ids=list(video_ids), fetched_at=time.time())
+            self._channels[key] = listing
+            self._save(
+                self.CHANNELS_FILE,
+                {key: asdict(value) for key, value in self._channels.items()},
+            )
+            return listing
+
+    def _load(self, name: str) -> Dict[str, dict]:
+        try:
+            with open(os.path.join(self._root, name), "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError):
+            logger.exception("Ignoring unreadable YouTube index file %s", name)
+            return {}
+
+    def _save(self, name: str, data: Dict[str, dict]) -> None:
+        fd, tmp_path = tempfile.mkstemp(dir=self._root, suffix=".json")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, os.path.join(self._root, name))
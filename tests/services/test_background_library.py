@@ -0,0 +1,233 @@
+import json
+import os
+
+import numpy as np
+import pytest
+from moviepy import VideoClip as MoviepyVideoClip
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+
+from src.entities.configs.services.video import (
+    AntiFingerprintConfig,
+    BackgroundLibraryConfig,
+    VideoConfig,
+)
+from src.services import background_library, video_service
+from src.services.background_library import BackgroundLibrary
+from src.services.video_service import VideoService
+
+
+def _mp4_bytes(tmp_path, name, duration=1, shade=0):
+    path = str(tmp_path / f"{name}.mp4")
+    MoviepyVideoClip(
+        lambda t: np.full((32, 24, 3), shade, dtype="uint8"), duration=duration
+    ).write_videofile(path, fps=10, logger=None)
+    with open(path, "rb") as f:
+        return f.read()
+
+
+def _library(tmp_path, **kwargs):
+    config = BackgroundLibraryConfig(
+        path=str(tmp_path / "library"), eviction_grace_seconds=0, **kwargs
+    )
+    return BackgroundLibrary(config)
+
+
+def test_put_stores_content_addressed_clip_with_metadata(tmp_path):
+    library = _library(tmp_path)
+    data = _mp4_bytes(tmp_path, "a", duration=2)
+
+    entry = library.put("vid1", False, data)
+    library.put("vid1", True, data)
+
+    assert os.path.basename(entry.path).startswith(entry.digest)
+    assert (entry.width, entry.height, entry.fps) == (24, 32, 10)
+    assert entry.duration == pytest.approx(2, abs=0.1)
+    assert library.total_size == len(data)
+    assert library.get("vid1", True).path == entry.path
+    assert library.get("missing") is None
+    assert (library.hits, library.misses) == (1, 1)
+
+
+def test_index_survives_restart(tmp_path):
+    library = _library(tmp_path)
+    library.put("vid1", False, _mp4_bytes(tmp_path, "a"))
+
+    reopened = _library(tmp_path)
+
+    assert reopened.get("vid1").video_id == "vid1"
+
+
+def test_least_recently_used_clip_is_evicted_over_budget(tmp_path):
+    clips = [_mp4_bytes(tmp_path, str(i), shade=i * 60) for i in range(3)]
+    library = _library(tmp_path, max_size_mb=1)
+    library._config.max_size_mb = (len(clips[0]) + len(clips[1]) + 10) / (1024 * 1024)
+
+    first = library.put("first", False, clips[0])
+    library.put("second", False, clips[1])
+    library.get("first")
+    library.put("third", False, clips[2])
+
+    assert library.get("second") is None
+    assert library.get("first") is not None
+    assert library.get("third") is not None
+    assert os.path.exists(first.path)
+
+
+def test_mezzanine_is_transcoded_once_to_the_render_geometry(tmp_path, monkeypatch):
+    library = _library(tmp_path)
+    entry = library.put("vid1", False, _mp4_bytes(tmp_path, "a", duration=2))
+    calls = []
+    transcode = background_library.transcode_mezzanine
+
+    def counting_transcode(*args, **kwargs):
+        calls.append(args)
+        transcode(*args, **kwargs)
+
+    monkeypatch.setattr(background_library, "transcode_mezzanine", counting_transcode)
+
+    path = library.mezzanine(entry, 16, 16, 25)
+    again = library.mezzanine(library.get("vid1"), 16, 16, 25)
+
+    infos = ffmpeg_parse_infos(path)
+    assert again == path
+    assert len(calls) == 1
+    assert infos["video_size"] == [16, 16]
+    assert infos["video_fps"] == 25
+    assert library.total_size == entry.size + os.path.getsize(path)
+    assert _library(tmp_path).get("vid1").mezzanines == {"16x16@25": os.path.getsize(path)}
+
+
+def test_evicting_a_clip_removes_its_mezzanines(tmp_path):
+    clips = [_mp4_bytes(tmp_path, str(i), shade=i * 60) for i in range(2)]
+    library = _library(tmp_path)
+    first = library.put("first", False, clips[0])
+    path = library.mezzanine(first, 16, 16, 10)
+    library._config.max_size_mb = (len(clips[1]) + 10) / (1024 * 1024)
+
+    library.put("second", False, clips[1])
+
+    assert library.get("first") is None
+    assert not os.path.exists(path)
+
+
+def test_libraries_sharing_a_path_merge_their_index_entries(tmp_path):
+    clips = [_mp4_bytes(tmp_path, str(i), shade=i * 60) for i in range(3)]
+    first_process = _library(tmp_path)
+    second_process = _library(tmp_path)
+
+    oldest = first_process.put("oldest", False, clips[0])
+    second_process.put("middle", False, clips[1])
+
+    assert {"oldest:high", "middle:high"} <= set(_library(tmp_path)._entries)
+
+    second_process._config.max_size_mb = (len(clips[1]) + len(clips[2]) + 10) / (
+        1024 * 1024
+    )
+    second_process.put("newest", False, clips[2])
+
+    assert not os.path.exists(oldest.path)
+    assert set(_library(tmp_path)._entries) == {"middle:high", "newest:high"}
+    assert first_process.get("oldest") is None
+    assert second_process.total_size <= second_process._config.max_size_mb * 1024 * 1024
+
+
+class CountingYouTubeProxy:
+    def __init__(self, data):
+        self.data = data
+        self.downloaded = []
+
+    async def list_video_ids(self, url, surface="videos"):
+        return ["clip"]
+
+    async def download_video(self, video_id, low_quality=False):
+        self.downloaded.append(video_id)
+        return self.data
+
+
+@pytest.mark.asyncio
+async def test_compilation_downloads_only_on_library_miss(tmp_path):
+    proxy = CountingYouTubeProxy(_mp4_bytes(tmp_path, "bg", duration=2))
+    config = VideoConfig(
+        youtube_pool_size=1, anti_fingerprint=AntiFingerprintConfig(enabled=False)
+    )
+    service = VideoService(proxy, config, background_library=_library(tmp_path))
+
+    first = await service.create_youtube_video_compilation(min_duration=1)
+    second = await service.create_youtube_video_compilation(min_duration=1)
+
+    assert proxy.downloaded == ["clip"]
+    assert first.downloaded_bytes == second.downloaded_bytes == []
+    assert second.sources[0].path == first.sources[0].path
+    assert second.clip.clip.duration == pytest.approx(2, abs=0.1)
+    assert second.sources[0].path.endswith("_1080x1920@30.mp4")
+    assert tuple(second.clip.clip.size) == (1080, 1920)
+
+
+@pytest.mark.asyncio
+async def test_compilation_bakes_the_anti_fingerprint_zoom_into_the_mezzanine(
+    tmp_path,
+):
+    proxy = CountingYouTubeProxy(_mp4_bytes(tmp_path, "bg", duration=2))
+    config = VideoConfig(
+        youtube_pool_size=1,
+        anti_fingerprint=AntiFingerprintConfig(
+            zoom=1.04, mirror=False, brightness_delta=0, speed_delta=0
+        ),
+    )
+    service = VideoService(proxy, config, background_library=_library(tmp_path))
+
+    result = await service.create_youtube_video_compilation(min_duration=1)
+
+    source = result.sources[0]
+    assert source.path.endswith("_1080x1920@30z1.04.mp4")
+    assert source.anti_fingerprint.zoom == 1.0
+    assert tuple(result.clip.clip.size) == (1080, 1920)
+
+
+@pytest.mark.asyncio
+async def test_sources_only_compilation_closes_the_background_readers(
+    tmp_path, monkeypatch
+):
+    proxy = CountingYouTubeProxy(_mp4_bytes(tmp_path, "bg", duration=2))
+    config = VideoConfig(
+        youtube_pool_size=1, anti_fingerprint=AntiFingerprintConfig(enabled=False)
+    )
+    service = VideoService(proxy, config, background_library=_library(tmp_path))
+    opened = []
+    real_clip = video_service.video_clip.VideoClip
+
+    def recording_clip(*args, **kwargs):
+        opened.append(real_clip(*args, **kwargs))
+        return opened[-1]
+
+    monkeypatch.setattr(video_service.video_clip, "VideoClip", recording_clip)
+
+    result = await service.create_youtube_video_compilation(
+        min_duration=1, sources_only=True
+    )
+
+    assert result.clip is None
+    assert len(result.sources) == 1
+    assert os.path.exists(result.sources[0].path)
+    assert opened[-1].file_path == result.sources[0].path
+    assert opened[-1].clip.reader is None
+
+
+def test_hits_do_not_rewrite_the_index_until_flushed(tmp_path):
+    library = _library(tmp_path)
+    library.put("vid1", False, _mp4_bytes(tmp_path, "a"))
+    index_path = os.path.join(str(tmp_path / "library"), BackgroundLibrary.INDEX_FILE)
+
+    def stored_access():
+        with open(index_path) as f:
+            return json.load(f)["vid1:high"]["last_access"]
+
+    written = os.stat(index_path).st_mtime_ns
+    before = stored_access()
+
+    hit = library.get("vid1")
+
+    assert os.stat(index_path).st_mtime_ns == written
+    assert hit.last_access > before
+    library.flush()
+    assert stored_access() == hit.last_access
@@ -0,0 +1,213 @@
+import pytest
+
+from src.entities.configs.services.captions import CaptionsCacheConfig, CaptionsConfig
+from src.entities.language import Language
+from src.entities.transcription import TranscriptionResult, TranscriptionWord
+from src.proxies.cached_transcription_proxy import (
+    decode_transcription,
+    encode_transcription,
+)
+from src.services import captions_service
+from src.services.captions_service import CaptionsService
+from src.services.script_aligner import align_script
+
+
+class FailingTranscriptionProxy:
+    def transcribe(self, audio_bytes, language=None):
+        raise AssertionError("audio should not be transcribed")
+
+
+class FailingLLMProxy:
+    async def enhance_transcription(self, base_text, raw_transcription):
+        raise AssertionError("transcription should not be enhanced")
+
+
+def _words(*items):
+    return [
+        TranscriptionWord(word=word, start=start, end=start + 0.3)
+        for word, start in items
+    ]
+
+
+@pytest.mark.asyncio
+async def test_speech_word_timings_skip_transcription_and_keep_script_punctuation():
+    service = CaptionsService(
+        llm_proxy=FailingLLMProxy(),
+        transcription_proxy=FailingTranscriptionProxy(),
+        captions_config=CaptionsConfig(cache=CaptionsCacheConfig(enabled=False)),
+    )
+    words = _words(("Ela", 0.0), ("voltou", 0.3), ("Mentira", 0.9), ("né", 1.2))
+
+    result = await service.generate_captions(
+        audio_bytes=b"",
+        enhance_captions=True,
+        base_text="Ela voltou... — Mentira, né?",
+        words=words,
+    )
+
+    assert [s.text for s in result.captions.segments] == [
+        "Ela",
+        "voltou...",
+        "—",
+        "Mentira,",
+        "né?",
+    ]
+    assert [s.start for s in result.captions.segments] == [0.0, 0.3, 0.6, 0.9, 1.2]
+
+
+@pytest.mark.asyncio
+async def test_speech_timings_and_transcription_give_the_same_segments():
+    base_text = "Ela voltou... — Mentira, né?"
+    words = _words(("Ela", 0.0), ("voltou", 0.3), ("Mentira", 0.9), ("né", 1.2))
+    config = CaptionsConfig(cache=CaptionsCacheConfig(enabled=False))
+    from_speech = await CaptionsService(
+        llm_proxy=FailingLLMProxy(),
+        transcription_proxy=FailingTranscriptionProxy(),
+        captions_config=config,
+    ).generate_captions(
+        audio_bytes=b"", enhance_captions=True, base_text=base_text, words=words
+    )
+    transcribed = await CaptionsService(
+        llm_proxy=FailingLLMProxy(),
+        transcription_proxy=CountingTranscriptionProxy(words),
+        captions_config=config,
+    ).generate_captions(audio_bytes=b"", enhance_captions=True, base_text=base_text)
+
+    assert from_speech.captions == transcribed.captions
+
+
+class CountingTranscriptionProxy:
+    def __init__(self, words):
+        self.words = words
+        self.calls = 0
+
+    @property
+    def model_identity(self):
+        return "counting:base"
+
+    async def transcribe_async(self, audio_bytes, language=None):
+        self.calls += 1
+        return TranscriptionResult(text="", words=self.words, language="pt")
+
+
+class CountingLLMProxy:
+    def __init__(self):
+        self.calls = 0
+
+    async def enhance_transcription(self, base_text, raw_transcription):
+        self.calls += 1
+        return [{"word": base_text, "start": 0.0, "end": 1.0}]
+
+
+def _cached_service(tmp_path, transcription, llm, **config):
+    return CaptionsService(
+        llm_proxy=llm,
+        transcription_proxy=transcription,
+        captions_config=CaptionsConfig(
+            cache=CaptionsCacheConfig(path=str(tmp_path)), **config
+        ),
+    )
+
+
+def test_transcriptions_round_trip_through_the_compact_encoding():
+    result = TranscriptionResult(
+        text=" Oi, mãe",
+        words=[
+            TranscriptionWord(word=" Oi,", start=0.0, end=0.31234, probability=0.9),
+            TranscriptionWord(word=" mãe", start=0.4, end=0.8),
+        ],
+        language="pt",
+    )
+
+    decoded = decode_transcription(encode_transcription(result))
+
+    assert decoded.text == result.text
+    assert decoded.language == "pt"
+    assert [w.word for w in decoded.words] == [" Oi,", " mãe"]
+    assert decoded.words[0].end == 0.312
+    assert decoded.words[1].probability is None
+
+
+@pytest.mark.asyncio
+async def test_identical_audio_is_transcribed_once_across_services(tmp_path):
+    transcription = CountingTranscriptionProxy(_words(("oi", 0.0), ("gente", 0.3)))
+    llm = CountingLLMProxy()
+
+    for _ in range(2):
+        service = _cached_service(tmp_path, transcription, llm)
+        result = await service.generate_captions(
+            audio_bytes=b"narration", language=Language.PORTUGUESE
+        )
+    await _cached_service(tmp_path, transcription, llm).generate_captions(
+        audio_bytes=b"narration", language=Language.ENGLISH
+    )
+
+    assert [s.text for s in result.captions.segments] == ["oi", "gente"]
+    assert transcription.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_aligned_captions_are_cached_per_script(tmp_path, monkeypatch):
+    transcription = CountingTranscriptionProxy(_words(("oi", 0.0), ("gente", 0.3)))
+    service = _cached_service(tmp_path, transcription, FailingLLMProxy())
+    alignments = []
+
+    def counting_align(base_text, words):
+        alignments.append(base_text)
+        return align_script(base_text, words)
+
+    monkeypatch.setattr(captions_service, "align_script", counting_align)
+
+    first = await service.generate_captions(
+        audio_bytes=b"narration", enhance_captions=True, base_text="Oi, gente!"
+    )
+    again = await service.generate_captions(
+        audio_bytes=b"narration", enhance_captions=True, base_text="Oi, gente!"
+    )
+    revised = await service.generate_captions(
+        audio_bytes=b"narration", enhance_captions=True, base_text="Oi gente..."
+    )
+
+    assert [s.text for s in again.captions.segments] == ["Oi,", "gente!"]
+    assert again.captions == first.captions
+    assert [s.text for s in revised.captions.segments] == ["Oi", "gente..."]
+    assert alignments == ["Oi, gente!", "Oi gente..."]
+    assert transcription.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_llm_enhancements_are_left_to_the_llm_cache(tmp_path):
+    transcription = CountingTranscriptionProxy(_words(("oi", 0.0), ("gente", 0.3)))
+    llm = CountingLLMProxy()
+    service = _cached_service(tmp_path, transcription, llm, alignment="llm")
+
+    for _ in range(2):
+        result = await service.generate_captions(
+            audio_bytes=b"narration", enhance_captions=True, base_text="Oi, gente!"
+        )
+
+    assert [s.text for s in result.captions.segments] == ["Oi, gente!"]
+    assert llm.calls == 2
+    assert transcription.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_speech_word_timings_are_aligned_onto_the_script():
+    service = CaptionsService(
+        llm_proxy=FailingLLMProxy(),
+        transcription_proxy=FailingTranscriptionProxy(),
+        captions_config=CaptionsConfig(cache=CaptionsCacheConfig(enabled=False)),
+    )
+    # The provider reports "3" for the script's "três" and skips "de".
+    words = _words(("São", 0.0), ("3", 0.3), ("horas", 0.6), ("manhã", 1.2))
+
+    result = await service.generate_captions(
+        audio_bytes=b"",
+        base_text="São três horas de manhã.",
+        words=words,
+    )
+
+    segments = result.captions.segments
+    assert [s.text for s in segments] == ["São", "três", "horas", "de", "manhã."]
+    assert (segments[1].start, segments[1].end) == (0.3, 0.6)
+    assert segments[2].end <= segments[3].start <= segments[3].end <= 1.2
@@ -0,0 +1,203 @@
+import random
+from pathlib import Path
+
+import numpy as np
+import pytest
+from moviepy import AudioArrayClip, VideoClip as MoviepyVideoClip, VideoFileClip
+from PIL import Image
+
+from src.entities.captions import CaptionSegment, Captions
+from src.entities.configs.services.captions import CaptionsConfig
+from src.entities.configs.services.video import AntiFingerprintConfig, VideoConfig
+from src.entities.editor.audio_clip import AudioClip
+from src.entities.editor.captions_clip import CaptionsClip
+from src.entities.editor.ffmpeg_render import FFmpegVideoRender, escape_filter_value
+from src.entities.editor.image_clip import ImageClip
+from src.entities.editor.render_spec import BackgroundSource
+from src.entities.editor.video_clip import AntiFingerprintParams, VideoClip
+from src.services.video_service import VideoService
+
+
+FONT_BYTES = (Path(__file__).parent.parent.parent / "default_font.ttf").read_bytes()
+
+WIDTH, HEIGHT = 180, 320
+COVER_BOX = (slice(130, 190), slice(15, 165))
+CTA_BOX = (slice(130, 190), slice(15, 165))
+WATERMARK_BOX = (slice(282, 290), slice(15, 165))
+
+
+def _gradient_frame(t, width=200, height=360):
+    xs = np.linspace(0, 255, width)
+    ys = np.linspace(0, 255, height)
+    red = np.tile(xs, (height, 1))
+    green = np.tile(ys[:, None], (1, width))
+    blue = np.full((height, width), 80 + 40 * t)
+    return np.dstack([red, green, blue]).astype("uint8")
+
+
+@pytest.fixture
+def media(tmp_path):
+    background_path = str(tmp_path / "background.mp4")
+    MoviepyVideoClip(_gradient_frame, duration=4).write_videofile(
+        background_path, fps=10, logger=None
+    )
+
+    audio_path = str(tmp_path / "speech.mp3")
+    samples = np.zeros((int(44100 * 3), 2))
+    AudioArrayClip(samples, fps=44100).write_audiofile(audio_path, logger=None)
+
+    cover_path = str(tmp_path / "cover.png")
+    Image.new("RGB", (40, 20), (250, 20, 20)).save(cover_path)
+
+    cta_path = str(tmp_path / "cta.png")
+    Image.new("RGB", (40, 20), (20, 20, 250)).save(cta_path)
+
+    # Transparent except for an opaque bar near the bottom edge.
+    watermark_path = str(tmp_path / "watermark.png")
+    watermark = Image.new("RGBA", (40, 72), (0, 0, 0, 0))
+    watermark.paste((20, 250, 20, 255), (0, 66, 40, 69))
+    watermark.save(watermark_path)
+    return background_path, audio_path, cover_path, cta_path, watermark_path
+
+
+def _config(cta_path, watermark_path, anti_fingerprint):
+    return VideoConfig(
+        width=WIDTH,
+        height=HEIGHT,
+        padding=20,
+        end_silece_seconds=1,
+        cover_duration=2,
+        call_to_action_path=cta_path,
+        watermark_path=watermark_path,
+        anti_fingerprint=anti_fingerprint,
+    )
+
+
+def _captions():
+    return CaptionsClip(
+        Captions(segments=[CaptionSegment(start=2.1, end=2.9, text="hello")]),
+        CaptionsConfig(font_size=40, stroke_width=2, marging=4, fade_duration=0.1),
+        FONT_BYTES,
+    )
+
+
+def _caption_bbox(frame):
+    ys, xs = np.nonzero(frame[:130].min(axis=2) > 200)
+    return xs.min(), ys.min(), xs.max(), ys.max()
+
+
+def _region_diff(rendered, reference, box):
+    return np.abs(rendered[box].astype(int) - reference[box].astype(int)).mean()
+
+
+def _render_both(media, tmp_path, anti_fingerprint, params=None):
+    background_path, audio_path, cover_path, cta_path, watermark_path = media
+    service = VideoService(
+        youtube_proxy=None,
+        video_config=_config(cta_path, watermark_path, anti_fingerprint),
+    )
+
+    background = VideoClip(file_path=background_path)
+    source = BackgroundSource(
+        path=background_path,
+        duration=background.clip.duration,
+        fps=background.clip.fps,
+        anti_fingerprint=params,
+    )
+    if params is not None:
+        background.apply_anti_fingerprint(anti_fingerprint, params=params)
+    spec = service.build_video_render_spec(
+        audio=AudioClip(audio_path),
+        backgrounds=[source],
+        cover=ImageClip(cover_path),
+        captions=_captions(),
+        cta_start=3.0,
+    )
+
+    moviepy_out = str(tmp_path / "moviepy.mp4")
+    final = service.generate_video(
+        audio=AudioClip(audio_path),
+        background_video=background,
+        cover=ImageClip(cover_path),
+        captions=_captions(),
+        cta_start=3.0,
+    )
+    final.clip.write_videofile(moviepy_out, logger=None)
+
+    ffmpeg_out = str(tmp_path / "ffmpeg.mp4")
+    service.render_video_ffmpeg(spec, ffmpeg_out)
+    return VideoFileClip(ffmpeg_out), VideoFileClip(moviepy_out)
+
+
+def _assert_parity(rendered, reference):
+    assert rendered.size == reference.size == [WIDTH, HEIGHT]
+    assert rendered.duration == pytest.approx(reference.duration, abs=0.15)
+
+    cover_frame = (rendered.get_frame(0.5), reference.get_frame(0.5))
+    caption_frame = (rendered.get_frame(2.5), reference.get_frame(2.5))
+    cta_frame = (rendered.get_frame(3.7), reference.get_frame(3.7))
+
+    assert _region_diff(*cover_frame, COVER_BOX) < 3
+    assert cover_frame[0][COVER_BOX][..., 0].mean() > 200
+    assert _region_diff(*cta_frame, CTA_BOX) < 3
+    assert cta_frame[0][CTA_BOX][..., 2].mean() > 200
+    for frame in (cover_frame, caption_frame, cta_frame):
+        assert _region_diff(*frame, WATERMARK_BOX) < 3
+        assert frame[0][WATERMARK_BOX][..., 1].mean() > 200
+
+    rendered_caption = _caption_bbox(caption_frame[0])
+    reference_caption = _caption_bbox(caption_frame[1])
+    assert np.abs(np.subtract(rendered_caption, reference_caption)).max() <= 4
+    for frame in (cover_frame, caption_frame, cta_frame):
+        assert _region_diff(*frame, (slice(None), slice(None))) < 6
+
+
+def test_ffmpeg_backend_matches_moviepy_render(media, tmp_path):
+    rendered, reference = _render_both(
+        media, tmp_path, AntiFingerprintConfig(enabled=False)
+    )
+
+    _assert_parity(rendered, reference)
+
+
+def test_ffmpeg_backend_matches_moviepy_with_anti_fingerprint(media, tmp_path):
+    config = AntiFingerprintConfig(
+        enabled=True,
+        zoom=1.05,
+        mirror=True,
+        brightness_delta=0.02,
+        speed_delta=0.02,
+    )
+    random.seed(7)
+    params = AntiFingerprintParams.sample(config)
+    assert params.mirror and params.zoom == 1.05
+    assert params.brightness != 1.0 and params.speed != 1.0
+
+    rendered, reference = _render_both(media, tmp_path, config, params)
+
+    _assert_parity(rendered, reference)
+
+
+def test_anti_fingerprint_filters_follow_sampled_params():
+    source = BackgroundSource(
+        path="bg.mp4",
+        duration=10,
+        fps=30,
+        anti_fingerprint=AntiFingerprintParams(
+            zoom=1.05, mirror=True, brightness=1.02, speed=1.02, hue_shift=3
+        ),
+    )
+
+    filters = FFmpegVideoRender._anti_fingerprint_filters(source)
+
+    assert filters[0].startswith("crop=")
+    assert "hflip" in filters
+    assert "colorchannelmixer=rr=1.020000:gg=1.020000:bb=1.020000" in filters
+    assert "setpts=PTS/1.020000" in filters
+    assert source.effective_duration == pytest.approx(10 / 1.02)
+
+
+def test_escape_filter_value_handles_both_levels():
+    assert escape_filter_value("it's") == "it\\\\\\'s"
+    assert escape_filter_value("a:b") == "a\\\\:b"
+    assert escape_filter_value("[x]") == "\\[x\\]"
@@ -0,0 +1,135 @@
+import pytest
+
+from src.entities.configs.services.captions import CaptionsCacheConfig, CaptionsConfig
+from src.entities.transcription import TranscriptionResult, TranscriptionWord
+from src.services.captions_service import CaptionsService
+from src.services.script_aligner import align_script
+
+
+def _words(*items):
+    return [
+        TranscriptionWord(word=word, start=start, end=start + 0.3)
+        for word, start in items
+    ]
+
+
+def test_script_tokens_take_timings_despite_case_accents_and_punctuation():
+    words = _words((" ela", 0.0), (" nao", 0.4), (" voltou", 0.8), (" Mae", 1.2))
+
+    alignment = align_script("Ela não voltou, mãe!", words)
+
+    assert [s.text for s in alignment.segments] == ["Ela", "não", "voltou,", "mãe!"]
+    assert [s.start for s in alignment.segments] == [0.0, 0.4, 0.8, 1.2]
+    assert alignment.confidence == 1.0
+
+
+def test_numbers_said_as_words_share_the_spoken_span():
+    words = _words(("Eu", 0.0), ("tinha", 0.3), ("vinte", 0.6), ("e", 0.9))
+    words += _words(("cinco", 1.2), ("anos", 1.5))
+
+    alignment = align_script("Eu tinha 25 anos", words)
+
+    assert [s.text for s in alignment.segments] == ["Eu", "tinha", "25", "anos"]
+    number = alignment.segments[2]
+    assert number.start == 0.6
+    assert number.end == pytest.approx(1.5)
+    assert alignment.segments[3].start == 1.5
+    assert alignment.confidence == 1.0
+
+
+def test_merged_words_count_as_matched():
+    words = _words(("guarda", 0.0), ("chuva", 0.3), ("molhado", 0.6))
+
+    alignment = align_script("guarda-chuva molhado", words)
+
+    assert [s.text for s in alignment.segments] == ["guarda-chuva", "molhado"]
+    assert alignment.segments[0].end == pytest.approx(0.6)
+    assert alignment.confidence == 1.0
+
+
+def test_unanchored_misheard_run_is_not_matched():
+    words = _words(("something", 0.0), ("else", 0.3), ("entirely", 0.6))
+
+    alignment = align_script("Oi, gente!", words)
+
+    assert alignment.confidence == 0.0
+
+
+def test_missed_words_are_interpolated_between_neighbours():
+    words = [
+        TranscriptionWord(word="ela", start=0.0, end=0.4),
+        TranscriptionWord(word="casa", start=1.0, end=1.4),
+    ]
+
+    alignment = align_script("ela foi para casa", words)
+
+    segments = alignment.segments
+    assert [s.text for s in segments] == ["ela", "foi", "para", "casa"]
+    assert segments[1].start == pytest.approx(0.4)
+    assert segments[1].end == pytest.approx(segments[2].start)
+    assert segments[2].end == pytest.approx(1.0)
+    assert alignment.confidence == pytest.approx(0.5)
+
+
+def test_alignment_is_deterministic():
+    words = _words(("um", 0.0), ("dois", 0.3), ("tres", 0.6))
+
+    first = align_script("um, dois... três!", words)
+    second = align_script("um, dois... três!", words)
+
+    assert first == second
+
+
+class StubTranscriptionProxy:
+    def __init__(self, words):
+        self.words = words
+
+    async def transcribe_async(self, audio_bytes, language=None):
+        return TranscriptionResult(text="", words=self.words)
+
+
+class RecordingLLMProxy:
+    def __init__(self):
+        self.calls = 0
+
+    async def enhance_transcription(self, base_text, raw_transcription):
+        self.calls += 1
+        return [{"word": "llm", "start": 0.0, "end": 1.0}]
+
+
+def _service(words, llm, **config):
+    return CaptionsService(
+        llm_proxy=llm,
+        transcription_proxy=StubTranscriptionProxy(words),
+        captions_config=CaptionsConfig(
+            use_speech_timings=False,
+            cache=CaptionsCacheConfig(enabled=False),
+            **config,
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_confident_local_alignment_skips_the_llm():
+    llm = RecordingLLMProxy()
+    service = _service(_words(("oi", 0.0), ("gente", 0.3)), llm)
+
+    result = await service.generate_captions(
+        audio_bytes=b"", enhance_captions=True, base_text="Oi, gente!"
+    )
+
+    assert [s.text for s in result.captions.segments] == ["Oi,", "gente!"]
+    assert llm.calls == 0
+
+
+@pytest.mark.asyncio
+async def test_poor_alignment_falls_back_to_the_llm():
+    llm = RecordingLLMProxy()
+    service = _service(_words(("something", 0.0), ("else", 0.3)), llm)
+
+    result = await service.generate_captions(
+        audio_bytes=b"", enhance_captions=True, base_text="Oi, gente!"
+    )
+
+    assert [s.text for s in result.captions.segments] == ["llm"]
+    assert llm.calls == 1
@@ -0,0 +1,98 @@
+import numpy as np
+import pytest
+from moviepy import AudioArrayClip, VideoClip as MoviepyVideoClip
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+
+from src.entities.configs.services.video import AntiFingerprintConfig, VideoConfig
+from src.entities.editor.audio_clip import AudioClip
+from src.entities.editor.render_spec import BackgroundSource
+from src.entities.editor.segmented_render import plan_segments
+from src.entities.editor.video_clip import AntiFingerprintParams
+from src.services import video_service
+from src.services.video_service import VideoService
+
+
+def _frame(t):
+    frame = np.zeros((64, 48, 3), dtype="uint8")
+    frame[:, :, 0] = int(40 * t) % 255
+    frame[int(10 * t) % 64, :, 1] = 255
+    return frame
+
+
+@pytest.fixture
+def spec_inputs(tmp_path):
+    background_path = str(tmp_path / "background.mp4")
+    MoviepyVideoClip(_frame, duration=2).write_videofile(
+        background_path, fps=10, logger=None
+    )
+    audio_path = str(tmp_path / "speech.mp3")
+    AudioArrayClip(np.zeros((44100 * 3, 2)), fps=44100).write_audiofile(
+        audio_path, logger=None
+    )
+    return background_path, audio_path
+
+
+def _frame_count(path):
+    return ffmpeg_parse_infos(path, decode_file=True)["video_n_frames"]
+
+
+def test_plan_segments_is_gop_aligned_and_covers_every_frame():
+    ranges = plan_segments(total_frames=95, segments=3, gop=20)
+
+    assert ranges == [(0, 40), (40, 80), (80, 95)]
+    assert all(start % 20 == 0 for start, _ in ranges)
+
+
+def test_segmented_render_matches_single_pass(spec_inputs, tmp_path):
+    background_path, audio_path = spec_inputs
+    config = VideoConfig(
+        width=32,
+        height=48,
+        padding=4,
+        end_silece_seconds=1,
+        anti_fingerprint=AntiFingerprintConfig(enabled=True, zoom=1.1),
+    )
+    service = VideoService(youtube_proxy=None, video_config=config)
+    sources = [
+        BackgroundSource(
+            path=background_path,
+            duration=2,
+            fps=10,
+            anti_fingerprint=AntiFingerprintParams(zoom=1.1, mirror=True),
+        )
+        for _ in range(2)
+    ]
+    spec = service.build_video_render_spec(
+        audio=AudioClip(audio_path), backgrounds=sources
+    )
+
+    single_path = str(tmp_path / "single.mp4")
+    service.compose_video_from_spec(spec).write_videofile(
+        single_path, fps=spec.fps, logger=None
+    )
+    segmented_path = str(tmp_path / "segmented.mp4")
+    service.render_video_segmented(spec, segmented_path, segments=3)
+
+    single = ffmpeg_parse_infos(single_path)
+    segmented = ffmpeg_parse_infos(segmented_path)
+    assert _frame_count(segmented_path) == _frame_count(single_path) == 40
+    assert segmented["duration"] == pytest.approx(single["duration"], abs=0.05)
+    assert segmented["audio_found"]
+
+
+def test_segmented_renders_share_the_service_render_pool(monkeypatch):
+    config = VideoConfig(max_concurrent_renders=2, render_segments=3)
+    service = VideoService(youtube_proxy=None, video_config=config)
+    pools = []
+    monkeypatch.setattr(
+        video_service,
+        "render_segmented",
+        lambda *args, pool=None, **kwargs: pools.append(pool),
+    )
+
+    service.render_video_segmented(None, "first.mp4", segments=3)
+    service.render_video_segmented(None, "second.mp4", segments=3)
+
+    assert pools[0] is pools[1] is service._render_pool
+    assert service._render_pool._max_workers == 6
+    service._render_pool.shutdown()
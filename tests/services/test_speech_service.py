@@ -0,0 +1,244 @@
+import asyncio
+import subprocess
+
+import pytest
+from moviepy.config import FFMPEG_BINARY
+
+from src.entities.configs.services.speech import SpeechCacheConfig, SpeechServiceConfig
+from src.entities.editor.audio_join import decoded_duration
+from src.entities.editor.scratch import ScratchSpace
+from src.entities.synthesized_speech import SynthesizedSpeech
+from src.entities.transcription import TranscriptionWord
+from src.proxies.interfaces import ISpeechProxy
+from src.services import speech_service
+from src.services.speech_service import SpeechService, split_sentences
+
+
+def _tone(seconds: float) -> bytes:
+    return subprocess.run(
+        [
+            FFMPEG_BINARY,
+            "-loglevel",
+            "error",
+            "-f",
+            "lavfi",
+            "-i",
+            f"sine=frequency=440:sample_rate=24000:duration={seconds}",
+            "-ac",
+            "1",
+            "-c:a",
+            "libmp3lame",
+            "-f",
+            "mp3",
+            "pipe:1",
+        ],
+        check=True,
+        capture_output=True,
+    ).stdout
+
+
+def _decoded_duration(tmp_path, parts) -> float:
+    """Total duration of *parts* decoded one by one, as the join should keep it."""
+    total = 0.0
+    for index, data in enumerate(parts):
+        path = tmp_path / f"part{index}.mp3"
+        path.write_bytes(data)
+        pcm = subprocess.run(
+            [
+                FFMPEG_BINARY,
+                "-loglevel",
+                "error",
+                "-i",
+                str(path),
+                "-f",
+                "s16le",
+                "pipe:1",
+            ],
+            check=True,
+            capture_output=True,
+        ).stdout
+        total += len(pcm) / 2 / 24000
+    return total
+
+
+class FakeSpeechProxy(ISpeechProxy):
+    def __init__(self):
+        self.requests = []
+        self.outputs = []
+
+    async def generate_speech(
+        self, text, gender="male", rate=1.0, language=None, override_voice_id=None
+    ):
+        self.requests.append((text, rate))
+        self.outputs.append(_tone(0.1 * len(text.split())))
+        return self.outputs[-1]
+
+    def list_voices(self):
+        return []
+
+
+class SlowSpeechProxy(FakeSpeechProxy):
+    max_concurrent_requests = 3
+
+    def __init__(self):
+        super().__init__()
+        self.active = 0
+        self.max_active = 0
+
+    async def generate_speech(self, text, **kwargs):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        await asyncio.sleep(0.05)
+        self.active -= 1
+        return await super().generate_speech(text, **kwargs)
+
+
+class TimedSpeechProxy(FakeSpeechProxy):
+    """Reports every word as 0.1s long, like Edge TTS word boundaries."""
+
+    async def generate_speech_with_words(self, text, **kwargs):
+        audio = await self.generate_speech(text, **kwargs)
+        words = [
+            TranscriptionWord(word=word.strip(".,!?"), start=0.1 * i, end=0.1 * (i + 1))
+            for i, word in enumerate(text.split())
+        ]
+        return SynthesizedSpeech(audio=audio, words=words)
+
+
+def _service(tmp_path, proxy, cache=True):
+    config = SpeechServiceConfig(
+        cache=SpeechCacheConfig(enabled=cache, path=str(tmp_path / "tts"))
+    )
+    return SpeechService(proxy, config)
+
+
+def test_split_sentences_keeps_punctuation_with_its_sentence():
+    text = "Eu  voltei pra casa. Ela   sumiu!\n\nE agora? ..."
+
+    assert split_sentences(text) == [
+        "Eu voltei pra casa.",
+        "Ela sumiu!",
+        "E agora? ...",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_revision_only_synthesizes_changed_sentences(tmp_path):
+    proxy = FakeSpeechProxy()
+    service = _service(tmp_path, proxy)
+
+    with ScratchSpace(root=str(tmp_path)):
+        first = await service.generate_speech(
+            "Um dois três. Quatro cinco. Seis sete oito nove."
+        )
+        revised = await service.generate_speech(
+            "Um dois três. Quatro cinco seis. Seis sete oito nove."
+        )
+
+        assert [text for text, _ in proxy.requests] == [
+            "Um dois três.",
+            "Quatro cinco.",
+            "Seis sete oito nove.",
+            "Quatro cinco seis.",
+        ]
+        assert service.cache_stats.hits == 2
+        assert service.cache_stats.misses == 4
+        # Joined output = decoded sentences back to back, plus the padding of
+        # the single final MP3 encode (under two frames).
+        frame = 1152 / 24000
+        joined = _decoded_duration(tmp_path, [first.bytes])
+        expected = _decoded_duration(tmp_path, proxy.outputs[:3])
+        assert expected <= joined <= expected + 2 * frame
+        joined = _decoded_duration(tmp_path, [revised.bytes])
+        expected = _decoded_duration(tmp_path, [proxy.outputs[i] for i in (0, 3, 2)])
+        assert expected <= joined <= expected + 2 * frame
+
+
+@pytest.mark.asyncio
+async def test_rate_change_is_a_cache_miss(tmp_path):
+    proxy = FakeSpeechProxy()
+    service = _service(tmp_path, proxy)
+
+    with ScratchSpace(root=str(tmp_path)):
+        await service.generate_speech("Uma frase só.", rate=1.0)
+        await service.generate_speech("Uma frase só.", rate=1.2)
+        await service.generate_speech("Uma frase só.", rate=1.2)
+
+    assert proxy.requests == [("Uma frase só.", 1.0), ("Uma frase só.", 1.2)]
+    assert service.cache_stats.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_sentences_are_synthesized_concurrently_and_joined_in_order(
+    tmp_path, monkeypatch
+):
+    proxy = SlowSpeechProxy()
+    service = _service(tmp_path, proxy, cache=False)
+    text = " ".join(f"Frase número {'um ' * n}fim." for n in range(1, 8))
+    joined_inputs = []
+    join_audio = speech_service.join_audio
+
+    def recording_join(paths, output_path):
+        joined_inputs.extend(open(path, "rb").read() for path in paths)
+        join_audio(paths, output_path)
+
+    monkeypatch.setattr(speech_service, "join_audio", recording_join)
+
+    with ScratchSpace(root=str(tmp_path)):
+        result = await service.generate_speech(text)
+
+    assert proxy.max_active == 3
+    outputs = {text: data for (text, _), data in zip(proxy.requests, proxy.outputs)}
+    assert joined_inputs == [outputs[sentence] for sentence in split_sentences(text)]
+    frame = 1152 / 24000
+    expected = _decoded_duration(tmp_path, joined_inputs)
+    joined = _decoded_duration(tmp_path, [result.bytes])
+    assert expected <= joined <= expected + 2 * frame
+
+
+@pytest.mark.asyncio
+async def test_word_timings_are_shifted_by_the_sentences_before_them(tmp_path):
+    proxy = TimedSpeechProxy()
+    service = _service(tmp_path, proxy)
+    text = "Um dois. Três quatro cinco."
+
+    with ScratchSpace(root=str(tmp_path)):
+        result = await service.generate_speech(text)
+        cached = await service.generate_speech(text)
+
+    first = tmp_path / "first.mp3"
+    first.write_bytes(proxy.outputs[0])
+    offset = decoded_duration(str(first))
+    assert [w.word for w in result.words] == ["Um", "dois", "Três", "quatro", "cinco"]
+    assert result.words[1].end == pytest.approx(0.2)
+    assert result.words[2].start == pytest.approx(offset)
+    assert result.words[4].end == pytest.approx(offset + 0.3)
+    assert len(proxy.requests) == 2
+    assert cached.words == result.words
+
+
+@pytest.mark.asyncio
+async def test_providers_without_timings_leave_words_empty(tmp_path):
+    service = _service(tmp_path, FakeSpeechProxy())
+
+    with ScratchSpace(root=str(tmp_path)):
+        result = await service.generate_speech("Um dois. Três.")
+
+    assert result.words is None
+
+
+@pytest.mark.asyncio
+async def test_audio_without_its_timings_entry_is_a_miss(tmp_path):
+    proxy = TimedSpeechProxy()
+    service = _service(tmp_path, proxy)
+
+    with ScratchSpace(root=str(tmp_path)):
+        await service.generate_speech("Um dois.")
+        timings = list((tmp_path / "tts" / "timings").rglob("*.json"))
+        assert len(timings) == 1
+        assert list((tmp_path / "tts").glob("*/*.json")) == []
+        timings[0].unlink()
+        await service.generate_speech("Um dois.")
+
+    assert len(proxy.requests) == 2
+    assert (service.cache_stats.hits, service.cache_stats.misses) == (0, 2)
@@ -1,6 +1,9 @@
+import asyncio
+
 import pytest
 
 from src.entities.config import EvaluationConfig
+from src.entities.reddit_post import RedditPost
 from src.services.story_finder_service import StoryFinderService
 
 
@@ -13,6 +16,44 @@ class UnusedLLMProxy:
     pass
 
 
+class StaticRedditProxy:
+    def list_subreddit_posts(self, *, subreddit, **kwargs):
+        return [
+            RedditPost(
+                title=f"{subreddit} {n}",
+                content="word " * (400 + n),
+                community=f"r/{subreddit}",
+                score=100 * (n + 1),
+                num_comments=10,
+            )
+            for n in range(4)
+        ]
+
+
+class SlowLLMProxy:
+    """Grades depend only on the title; ties and failures are deliberate."""
+
+    def __init__(self):
+        self.running = 0
+        self.peak = 0
+
+    async def evaluate_story(self, title, content, target_language):
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        # Later finalists finish first.
+        await asyncio.sleep(0.01 * (len(content) % 7))
+        self.running -= 1
+        if title.endswith("3"):
+            raise RuntimeError("provider down")
+        grade = 85.0 if title.endswith(("0", "1")) else 65.0
+        return {
+            "nota_geral": grade,
+            "veredito": "Excelente" if grade >= 80 else "Boa",
+            "resumo": title,
+            "notas": {},
+        }
+
+
 @pytest.mark.asyncio
 async def test_find_best_stories_raises_when_all_subreddits_fail():
     service = StoryFinderService(
@@ -29,3 +70,47 @@ async def test_find_best_stories_raises_when_all_subreddits_fail():
     assert "nenhum subreddit" in str(exc.value)
     assert "r/pettyrevenge" in str(exc.value)
     assert "r/relacionamentos" in str(exc.value)
+
+
+async def _find(max_concurrent, on_progress=None):
+    llm = SlowLLMProxy()
+    service = StoryFinderService(
+        reddit_proxy=StaticRedditProxy(),
+        llm_proxy=llm,
+        evaluation_config=EvaluationConfig(
+            subreddits=["a", "b", "c"],
+            min_chars=0,
+            max_concurrent_evaluations=max_concurrent,
+        ),
+    )
+    results = await service.find_best_stories(top_per_sub=4, on_progress=on_progress)
+    return results, llm
+
+
+@pytest.mark.asyncio
+async def test_concurrent_evaluation_ranks_like_a_sequential_run():
+    progress = []
+
+    async def on_progress(completed, total):
+        progress.append((completed, total))
+
+    sequential, sequential_llm = await _find(1)
+    concurrent, concurrent_llm = await _find(4, on_progress)
+
+    assert [r.post.title for r in concurrent] == [r.post.title for r in sequential]
+    assert [r.nota_geral for r in concurrent] == [r.nota_geral for r in sequential]
+    assert all(not r.post.title.endswith("3") for r in concurrent)
+    assert sequential_llm.peak == 1
+    assert concurrent_llm.peak == 4
+    assert progress == [(n, 12) for n in range(1, 13)]
+
+
+@pytest.mark.asyncio
+async def test_failing_progress_callback_does_not_abort_evaluation():
+    async def on_progress(completed, total):
+        raise RuntimeError("message edit failed")
+
+    results, llm = await _find(4, on_progress)
+
+    assert results
+    assert llm.peak == 4
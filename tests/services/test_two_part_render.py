@@ -0,0 +1,95 @@
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from src.entities.configs.services.video import VideoConfig
+from src.services.reddit_video_service import RedditVideoService
+
+
+class FakeVideoService:
+    def __init__(self, max_concurrent_renders):
+        self._video_config = VideoConfig(max_concurrent_renders=max_concurrent_renders)
+        self.active = 0
+        self.max_active = 0
+        self.threads = []
+        self._lock = threading.Lock()
+
+    async def create_youtube_video_compilation(
+        self, min_duration, low_quality=False, sources_only=False
+    ):
+        return SimpleNamespace(clip=None, sources=[object()])
+
+    def build_video_render_spec(self, **kwargs):
+        return SimpleNamespace(**kwargs)
+
+    def render_threads(self):
+        return 4
+
+    def render_in_worker(self, spec, output_path, threads=None):
+        with self._lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+            self.threads.append(threads)
+        time.sleep(0.2)
+        with open(output_path, "wb") as f:
+            f.write(spec.cover.encode())
+        with self._lock:
+            self.active -= 1
+
+
+def _service(video_service):
+    return RedditVideoService(
+        reddit_proxy=None,
+        llm_proxy=None,
+        image_generation_proxy=None,
+        speech_service=None,
+        captions_service=None,
+        cover_service=None,
+        video_service=video_service,
+    )
+
+
+def _part():
+    speech = SimpleNamespace(clip=SimpleNamespace(duration=1.0))
+    return SimpleNamespace(clip=speech)
+
+
+async def _compose(service):
+    audio = SimpleNamespace(part1=_part(), part2=_part())
+    captions = SimpleNamespace(
+        part1=SimpleNamespace(clip=None), part2=SimpleNamespace(clip=None)
+    )
+    return await service.compose_two_part_video(
+        audio,
+        captions,
+        SimpleNamespace(clip="part1"),
+        SimpleNamespace(clip="part2"),
+    )
+
+
+@pytest.mark.asyncio
+async def test_two_parts_render_concurrently():
+    video_service = FakeVideoService(max_concurrent_renders=2)
+
+    result = await _compose(_service(video_service))
+
+    assert result.part1_video.read_bytes() == b"part1"
+    assert result.part2_video.read_bytes() == b"part2"
+    assert video_service.max_active == 2
+    assert video_service.threads == [4, 4]
+
+
+@pytest.mark.asyncio
+async def test_render_slots_limit_concurrent_renders():
+    video_service = FakeVideoService(max_concurrent_renders=1)
+
+    result = await _compose(_service(video_service))
+
+    assert result.part1_video.read_bytes() == b"part1"
+    assert result.part2_video.read_bytes() == b"part2"
+    assert video_service.max_active == 1
+
+    result.release()
+    assert result.part1_video.released and result.part2_video.released
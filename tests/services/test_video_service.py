@@ -1,3 +1,4 @@
+import asyncio
 from types import SimpleNamespace
 
 import pytest
@@ -24,11 +25,19 @@ class FakeYouTubeProxy:
 
 
 class FakeVideoClip:
+    file_path = None
+    anti_fingerprint_params = None
+    closed = []
+
     def __init__(self, file_path=None, audio_clip=None, bytes=None):
         duration = 0
         if bytes and bytes.startswith(b"good"):
             duration = 45
-        self.clip = SimpleNamespace(duration=duration)
+        self.name = bytes.decode() if bytes else None
+        self.clip = SimpleNamespace(duration=duration, fps=30)
+
+    def close(self):
+        FakeVideoClip.closed.append(self.name)
 
     def apply_anti_fingerprint(self, config):
         return None
@@ -192,3 +201,106 @@ def test_adjust_duration_trims_from_beginning():
     wrapped.ajust_duration(30)
 
     assert wrapped.clip.subclip_args == (0, 30)
+
+
+class SlowYouTubeProxy:
+    def __init__(self, video_ids, latency):
+        self.video_ids = video_ids
+        self.latency = latency
+        self.started = []
+        self.finished = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def list_video_ids(self, url, surface="videos"):
+        return list(self.video_ids)
+
+    async def download_video(self, video_id, low_quality=False):
+        self.started.append(video_id)
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            await asyncio.sleep(self.latency[video_id])
+        finally:
+            self.in_flight -= 1
+        self.finished.append(video_id)
+        return video_id.encode()
+
+
+@pytest.mark.asyncio
+async def test_youtube_compilation_prefetches_with_bounded_concurrency(monkeypatch):
+    ids = ["zero", "good1", "good2", "good3", "good4", "good5"]
+    proxy = SlowYouTubeProxy(ids, latency={video_id: 0.05 for video_id in ids})
+    config = VideoConfig(youtube_pool_size=0, youtube_download_concurrency=3)
+    service = VideoService(proxy, config)
+
+    monkeypatch.setattr(video_service.video_clip, "VideoClip", FakeVideoClip)
+    monkeypatch.setattr(video_service.random, "shuffle", lambda items: None)
+
+    result = await service.create_youtube_video_compilation(min_duration=80)
+
+    assert result.downloaded_bytes == [b"good1", b"good2"]
+    assert proxy.max_in_flight == 3
+    assert proxy.finished == ["zero", "good1", "good2"]
+    assert proxy.in_flight == 0
+    assert "good5" not in proxy.started
+
+
+@pytest.mark.asyncio
+async def test_youtube_compilation_keeps_shuffle_order_when_later_finishes_first(
+    monkeypatch,
+):
+    proxy = SlowYouTubeProxy(
+        ["good1", "good2", "good3"],
+        latency={"good1": 0.1, "good2": 0.0, "good3": 0.0},
+    )
+    config = VideoConfig(youtube_pool_size=0, youtube_download_concurrency=3)
+    service = VideoService(proxy, config)
+
+    monkeypatch.setattr(video_service.video_clip, "VideoClip", FakeVideoClip)
+    monkeypatch.setattr(video_service.random, "shuffle", lambda items: None)
+
+    result = await service.create_youtube_video_compilation(min_duration=30)
+
+    assert proxy.finished[0] != "good1"
+    assert result.downloaded_bytes == [b"good1"]
+
+
+@pytest.mark.asyncio
+async def test_youtube_compilation_closes_skipped_and_unused_clips(monkeypatch):
+    proxy = SlowYouTubeProxy(
+        ["zero", "good1", "good2", "good3"],
+        latency={"zero": 0.0, "good1": 0.05, "good2": 0.0, "good3": 0.0},
+    )
+    config = VideoConfig(youtube_pool_size=0, youtube_download_concurrency=4)
+    service = VideoService(proxy, config)
+
+    monkeypatch.setattr(video_service.video_clip, "VideoClip", FakeVideoClip)
+    monkeypatch.setattr(video_service.random, "shuffle", lambda items: None)
+    monkeypatch.setattr(FakeVideoClip, "closed", [])
+
+    result = await service.create_youtube_video_compilation(min_duration=30)
+
+    assert result.downloaded_bytes == [b"good1"]
+    assert sorted(FakeVideoClip.closed) == ["good2", "good3", "zero"]
+
+
+class FailingFingerprintClip(FakeVideoClip):
+    def apply_anti_fingerprint(self, config):
+        raise RuntimeError("fingerprint failed")
+
+
+@pytest.mark.asyncio
+async def test_youtube_compilation_closes_clip_when_post_load_fails(monkeypatch):
+    proxy = SlowYouTubeProxy(["good1"], latency={"good1": 0.0})
+    config = VideoConfig(youtube_pool_size=0, youtube_download_concurrency=1)
+    service = VideoService(proxy, config)
+
+    monkeypatch.setattr(video_service.video_clip, "VideoClip", FailingFingerprintClip)
+    monkeypatch.setattr(video_service.random, "shuffle", lambda items: None)
+    monkeypatch.setattr(FakeVideoClip, "closed", [])
+
+    with pytest.raises(RuntimeError, match="fingerprint failed"):
+        await service.create_youtube_video_compilation(min_duration=30)
+
+    assert FakeVideoClip.closed == ["good1"]
@@ -0,0 +1,167 @@
+import pytest
+
+from src.entities.configs.services.video import VideoConfig, YouTubeIndexConfig
+from src.entities.youtube_video import YouTubeVideoMetadata
+from src.services import video_service
+from src.services.video_service import VideoService
+from src.services.youtube_metadata_index import (
+    YouTubeMetadataIndex,
+    select_covering_subset,
+)
+
+
+def test_selection_covers_target_with_least_waste():
+    candidates = [("a", 50), ("b", 40), ("c", 35), ("d", 26), ("e", 100)]
+
+    assert sorted(select_covering_subset(candidates, 60)) == ["c", "d"]
+
+
+def test_selection_prefers_single_long_clip_and_fewer_clips():
+    assert select_covering_subset([("a", 30), ("b", 31), ("c", 61)], 60) == ["c"]
+    assert select_covering_subset([("a", 20), ("b", 20), ("c", 20), ("d", 40)], 60) == [
+        "a",
+        "d",
+    ]
+
+
+def test_selection_rounds_so_the_target_is_always_covered():
+    assert select_covering_subset([("a", 29.9), ("b", 30.5), ("c", 31)], 60.2) == [
+        "b",
+        "c",
+    ]
+    assert select_covering_subset([("a", 10), ("b", 0)], 60) == []
+
+
+def test_probed_metadata_wins_over_listing_and_persists(tmp_path):
+    config = YouTubeIndexConfig(path=str(tmp_path))
+    index = YouTubeMetadataIndex(config)
+
+    index.put(YouTubeVideoMetadata(video_id="a", duration=30, source="probe"))
+    index.put(YouTubeVideoMetadata(video_id="a", duration=31))
+
+    assert YouTubeMetadataIndex(config).get("a").duration == 30
+
+
+class MetadataYouTubeProxy:
+    def __init__(self, durations):
+        self.durations = durations
+        self.downloaded = []
+
+    async def list_video_ids(self, url, surface="videos"):
+        return list(self.durations)
+
+    async def get_video_metadata(self, video_id):
+        return YouTubeVideoMetadata(video_id=video_id, duration=self.durations[video_id])
+
+    async def download_video(self, video_id, low_quality=False):
+        self.downloaded.append(video_id)
+        return video_id.encode()
+
+
+class DurationVideoClip:
+    file_path = None
+    anti_fingerprint_params = None
+    durations = {}
+
+    def __init__(self, file_path=None, audio_clip=None, bytes=None):
+        duration = self.durations.get(bytes.decode(), 0) if bytes else 0
+        self.clip = type("Clip", (), dict(duration=duration, fps=30, size=(8, 8)))()
+
+    def apply_anti_fingerprint(self, config):
+        return None
+
+    def concat(self, other):
+        self.clip.duration = (self.clip.duration or 0) + other.clip.duration
+
+
+@pytest.mark.asyncio
+async def test_compilation_downloads_only_the_fitting_clips(tmp_path, monkeypatch):
+    durations = {"long": 200, "mid": 70, "short": 25, "empty": 0, "tiny": 10}
+    proxy = MetadataYouTubeProxy(durations)
+    config = VideoConfig(youtube_pool_size=0, youtube_download_concurrency=1)
+    index = YouTubeMetadataIndex(YouTubeIndexConfig(path=str(tmp_path)))
+    service = VideoService(proxy, config, metadata_index=index)
+
+    DurationVideoClip.durations = durations
+    monkeypatch.setattr(video_service.video_clip, "VideoClip", DurationVideoClip)
+    monkeypatch.setattr(video_service.random, "shuffle", lambda items: None)
+
+    result = await service.create_youtube_video_compilation(min_duration=90)
+
+    assert proxy.downloaded == ["mid", "short"]
+    assert result.clip.clip.duration == 95
+    assert index.get("mid").source == "probe"
+
+
+class ListingYouTubeProxy:
+    def __init__(self):
+        self.calls = []
+        self.pages = {False: ["b", "c", "d"], True: ["a", "b"]}
+        self.fail = False
+
+    async def list_video_ids(self, url, surface="videos", newest_only=False):
+        self.calls.append(newest_only)
+        if self.fail:
+            raise RuntimeError("scrape failed")
+        return list(self.pages[newest_only])
+
+    async def download_video(self, video_id, low_quality=False):
+        return video_id.encode()
+
+
+@pytest.mark.asyncio
+async def test_channel_listing_is_cached_and_refreshed_from_newest_page(tmp_path):
+    proxy = ListingYouTubeProxy()
+    index_config = YouTubeIndexConfig(path=str(tmp_path), channel_ttl_seconds=3600)
+    config = VideoConfig(youtube_pool_size=3, youtube_index=index_config)
+    service = VideoService(
+        proxy, config, metadata_index=YouTubeMetadataIndex(index_config)
+    )
+    url = "https://www.youtube.com/@channel"
+
+    assert await service._list_channel_video_ids(url) == ["b", "c", "d"]
+    assert await service._list_channel_video_ids(url) == ["b", "c", "d"]
+    assert proxy.calls == [False]
+
+    index_config.channel_ttl_seconds = 0
+    reopened = VideoService(
+        proxy, config, metadata_index=YouTubeMetadataIndex(index_config)
+    )
+
+    assert await reopened._list_channel_video_ids(url) == ["a", "b", "c"]
+    assert proxy.calls == [False, True]
+
+    proxy.fail = True
+    assert await reopened._list_channel_video_ids(url) == ["a", "b", "c"]
+    assert reopened._metadata_index.get_channel(url, "videos").video_ids == [
+        "a",
+        "b",
+        "c",
+        "d",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_cold_index_looks_up_only_a_few_candidates(tmp_path):
+    durations = {f"v{n}": 30 for n in range(10)}
+    proxy = MetadataYouTubeProxy(durations)
+    looked_up = []
+    lookup = proxy.get_video_metadata
+
+    async def counting_lookup(video_id):
+        looked_up.append(video_id)
+        return await lookup(video_id)
+
+    proxy.get_video_metadata = counting_lookup
+    index_config = YouTubeIndexConfig(path=str(tmp_path), max_lookups_per_run=3)
+    index = YouTubeMetadataIndex(index_config)
+    index.put(YouTubeVideoMetadata(video_id="v9", duration=40))
+    service = VideoService(
+        proxy, VideoConfig(youtube_index=index_config), metadata_index=index
+    )
+
+    order = await service._fit_compilation_video_ids(list(durations), 100)
+
+    assert looked_up == ["v0", "v1", "v2"]
+    assert sorted(order[:3]) == ["v0", "v1", "v9"]
+    assert order[3:] == ["v2", "v3", "v4", "v5", "v6", "v7", "v8"]
@@ -0,0 +1,49 @@
+import pytest
+
+from src.core.artifacts import ArtifactStore
+from src.services.reddit_video_service import VideoPair
+
+
+def test_artifact_reads_lazily_and_is_released(tmp_path):
+    store = ArtifactStore(str(tmp_path / "store"))
+
+    with store.put_bytes(b"video data", ".mp4") as artifact:
+        with artifact.mmap() as view:
+            assert bytes(view[:5]) == b"video"
+        with artifact.open() as f:
+            assert f.read() == b"video data"
+        assert artifact.size == 10
+        assert artifact.path.endswith(".mp4")
+        copy = artifact.copy_to(str(tmp_path / "copy.mp4"))
+
+    assert artifact.released
+    assert open(copy, "rb").read() == b"video data"
+
+
+def test_empty_artifact_maps_to_empty_view(tmp_path):
+    store = ArtifactStore(str(tmp_path))
+    artifact = store.create(".mp4")
+
+    with artifact.mmap() as view:
+        assert len(view) == 0
+
+
+def test_temporary_store_is_removed_on_cleanup():
+    store = ArtifactStore()
+    artifact = store.put_bytes(b"x")
+
+    store.cleanup()
+
+    assert artifact.released
+
+
+def test_result_releases_its_artifacts_when_the_block_fails(tmp_path):
+    store = ArtifactStore(str(tmp_path))
+    result = VideoPair(part1_video=store.put_bytes(b"1"), part2_video=store.put_bytes(b"2"))
+
+    with pytest.raises(TimeoutError):
+        with result:
+            raise TimeoutError("upload timed out")
+
+    assert result.part1_video.released
+    assert result.part2_video.released
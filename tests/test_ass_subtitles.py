@@ -0,0 +1,100 @@
+from pathlib import Path
+
+import numpy as np
+from moviepy import ColorClip, VideoFileClip
+
+from src.entities.captions import CaptionSegment, Captions
+from src.entities.configs.services.captions import CaptionsConfig
+from src.entities.editor.ass_subtitles import (
+    ass_color,
+    ass_font_size,
+    ass_timestamp,
+    font_line_metrics,
+)
+from src.entities.editor.captions_clip import CaptionsClip
+from src.entities.editor.video_clip import VideoClip
+
+FONT_BYTES = (Path(__file__).parent.parent / "default_font.ttf").read_bytes()
+
+
+def _captions():
+    return Captions(
+        segments=[
+            CaptionSegment(start=0.0, end=0.8, text="hello,"),
+            CaptionSegment(start=0.8, end=1.5, text="{world}."),
+            CaptionSegment(start=1.5, end=1.9, text=" . "),
+        ]
+    )
+
+
+def test_ass_track_mirrors_word_clip_styling():
+    config = CaptionsConfig(
+        upper_text=True, font_size=100, stroke_width=8, marging=50, fade_duration=0.1
+    )
+    clip = CaptionsClip(_captions(), config, FONT_BYTES)
+
+    ass = clip.to_ass(1080, 1920, size_rate=0.5)
+    events = [line for line in ass.splitlines() if line.startswith("Dialogue:")]
+
+    assert "PlayResX: 1080" in ass and "PlayResY: 1920" in ass
+    assert len(events) == 2
+    assert events[0].startswith(
+        "Dialogue: 0,0:00:00.00,0:00:00.80,Caption,,0,0,0,,{\\pos("
+    )
+    assert events[0].endswith("\\fad(100,100)}HELLO")
+    assert events[1].endswith("}\\{WORLD\\}")
+    style = next(line for line in ass.splitlines() if line.startswith("Style:"))
+    assert ",&H00FFFFFF,&H00FFFFFF,&H00000000,&H00000000," in style
+    assert ",1,4,0,8,0,0,0,1" in style
+    assert style.startswith("Style: Caption,Bangers,87.85,")
+
+
+def test_ass_helpers():
+    assert ass_color("#102030") == "&H00302010"
+    assert ass_timestamp(3725.456) == "1:02:05.46"
+
+
+def test_ass_font_size_follows_win_metrics(tmp_path):
+    font_path = tmp_path / "font.ttf"
+    font_path.write_bytes(FONT_BYTES)
+
+    assert font_line_metrics(str(font_path)) == (1000, 1401, 356)
+    assert ass_font_size(str(font_path), 100) == 175.7
+
+
+def _caption_bbox(frame):
+    ys, xs = np.nonzero(frame.min(axis=2) > 128)
+    return xs.min(), ys.min(), xs.max(), ys.max()
+
+
+def _render_captions(tmp_path, render_mode, text):
+    config = CaptionsConfig(
+        font_size=100,
+        stroke_width=6,
+        marging=10,
+        upper_text=False,
+        render_mode=render_mode,
+    )
+    captions = CaptionsClip(
+        Captions(segments=[CaptionSegment(start=0.0, end=1.5, text=text)]),
+        config,
+        FONT_BYTES,
+    )
+
+    video = VideoClip()
+    video.clip = ColorClip((540, 960), color=(0, 0, 255), duration=1.5)
+    if captions.uses_ass:
+        video.burn_subtitles(captions.write_ass(540, 960), captions.fonts_dir)
+    else:
+        video.add_layers(captions.get_clips())
+    output = str(tmp_path / f"{render_mode}.mp4")
+    video.write_videofile(output, fps=10, logger=None)
+    return VideoFileClip(output).get_frame(0.4)
+
+
+def test_ass_captions_are_burned_in_like_word_clips(tmp_path):
+    for text in ("Hello", "jumpy"):
+        reference = _caption_bbox(_render_captions(tmp_path, "clips", text))
+        burned = _caption_bbox(_render_captions(tmp_path, "ass", text))
+
+        assert np.abs(np.subtract(burned, reference)).max() <= 4
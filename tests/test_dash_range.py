@@ -0,0 +1,140 @@
+import http.server
+import os
+import re
+import subprocess
+import threading
+from types import SimpleNamespace
+
+import pytest
+from moviepy.config import FFMPEG_BINARY
+from moviepy.video.io.ffmpeg_reader import ffmpeg_parse_infos
+
+from src.proxies.dash_range import (
+    download_time_range,
+    http_range_fetcher,
+    read_segment_index,
+)
+from src.proxies.pytube_proxy import PyTubeProxy
+
+
+def _encode(path, movflags):
+    subprocess.run(
+        [
+            FFMPEG_BINARY,
+            "-y",
+            "-loglevel",
+            "error",
+            "-f",
+            "lavfi",
+            "-i",
+            "testsrc=size=64x48:rate=10",
+            "-t",
+            "20",
+            "-c:v",
+            "libx264",
+            "-g",
+            "10",
+            "-sc_threshold",
+            "0",
+            "-movflags",
+            movflags,
+            "-f",
+            "mp4",
+            str(path),
+        ],
+        check=True,
+    )
+
+
+@pytest.fixture(scope="module")
+def media_dir(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("media")
+    # Same layout as YouTube adaptive streams: ftyp, moov, sidx, moof/mdat...
+    _encode(directory / "dash.mp4", "+dash+global_sidx")
+    _encode(directory / "progressive.mp4", "+faststart")
+    return directory
+
+
+class RangeRequestHandler(http.server.SimpleHTTPRequestHandler):
+    requested = []
+
+    def log_message(self, format, *args):
+        pass
+
+    def do_GET(self):
+        with open(self.translate_path(self.path), "rb") as f:
+            data = f.read()
+        match = re.fullmatch(r"bytes=(\d+)-(\d+)", self.headers.get("Range", ""))
+        if match is None:
+            self.send_response(200)
+            body = data
+        else:
+            first, last = int(match.group(1)), int(match.group(2))
+            body = data[first : last + 1]
+            self.requested.append((first, last))
+            self.send_response(206)
+            self.send_header(
+                "Content-Range", f"bytes {first}-{first + len(body) - 1}/{len(data)}"
+            )
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def range_server(media_dir):
+    handler = type(
+        "Handler",
+        (RangeRequestHandler,),
+        dict(requested=[]),
+    )
+
+    def factory(*args, **kwargs):
+        return handler(*args, directory=str(media_dir), **kwargs)
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), factory)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    try:
+        yield f"http://127.0.0.1:{server.server_address[1]}", handler.requested
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+def test_segment_index_is_read_from_the_stream_head(range_server):
+    base_url, _ = range_server
+
+    index = read_segment_index(http_range_fetcher(f"{base_url}/dash.mp4"))
+
+    assert len(index.references) == 20
+    assert index.duration == pytest.approx(20)
+    assert index.init[4:8] == b"ftyp"
+
+
+def test_time_window_fetches_only_covering_segments(range_server, media_dir, tmp_path):
+    base_url, requested = range_server
+    output = str(tmp_path / "window.mp4")
+
+    fetched = download_time_range(
+        http_range_fetcher(f"{base_url}/dash.mp4"), 5, 3.5, output
+    )
+
+    infos = ffmpeg_parse_infos(output, decode_file=True)
+    total = os.path.getsize(media_dir / "dash.mp4")
+    media_first, media_last = requested[-1]
+    assert fetched == pytest.approx(4)
+    assert infos["duration"] == pytest.approx(4, abs=0.3)
+    assert infos["video_n_frames"] == 40
+    assert media_last - media_first + 1 < total / 3
+
+
+def test_stream_without_segment_index_falls_back(range_server, tmp_path):
+    base_url, _ = range_server
+    stream = SimpleNamespace(url=f"{base_url}/progressive.mp4")
+
+    assert PyTubeProxy._download_time_range(stream, 0, 5) is None
+
+    stream = SimpleNamespace(url=f"{base_url}/dash.mp4")
+    data = PyTubeProxy._download_time_range(stream, 0, 5)
+    assert data[4:8] == b"ftyp"
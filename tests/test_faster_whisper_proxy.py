@@ -0,0 +1,76 @@
+import sys
+import types
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.entities.configs.proxies.transcription import (
+    FasterWhisperTranscriptionConfig,
+)
+from src.entities.language import Language
+
+
+class StubWhisperModel:
+    instances = []
+
+    def __init__(self, model, **kwargs):
+        self.model = model
+        self.kwargs = kwargs
+        self.calls = []
+        StubWhisperModel.instances.append(self)
+
+    def transcribe(self, audio, **kwargs):
+        self.calls.append(kwargs)
+        words = [
+            SimpleNamespace(word=" Oi,", start=0.0, end=0.4, probability=0.9),
+            SimpleNamespace(word=" gente", start=0.5, end=1.3, probability=0.8),
+        ]
+        segments = iter([SimpleNamespace(text=" Oi, gente", words=words)])
+        return segments, SimpleNamespace(language="pt")
+
+
+@pytest.fixture
+def proxy_module(monkeypatch):
+    stub = types.ModuleType("faster_whisper")
+    stub.WhisperModel = StubWhisperModel
+    monkeypatch.setitem(sys.modules, "faster_whisper", stub)
+    monkeypatch.delitem(sys.modules, "src.proxies.faster_whisper_proxy", raising=False)
+    import src.proxies.faster_whisper_proxy as module
+
+    yield module
+    sys.modules.pop("src.proxies.faster_whisper_proxy", None)
+
+
+def test_words_are_mapped_and_clamped_to_the_audio(proxy_module):
+    proxy = proxy_module.FasterWhisperProxy(
+        FasterWhisperTranscriptionConfig(workers=2, cpu_threads=3, beam_size=1)
+    )
+    one_second = np.zeros(16000, dtype=np.float32)
+
+    result = proxy._transcribe_samples(one_second, Language.PORTUGUESE)
+
+    model = StubWhisperModel.instances[-1]
+    assert model.kwargs["compute_type"] == "int8"
+    assert model.kwargs["cpu_threads"] == 3
+    assert model.kwargs["num_workers"] == 2
+    assert model.calls[0]["language"] == "pt"
+    assert model.calls[0]["word_timestamps"] is True
+    assert model.calls[0]["vad_parameters"] == {"min_silence_duration_ms": 500}
+    assert result.text == " Oi, gente"
+    assert result.language == "pt"
+    assert [w.word for w in result.words] == [" Oi,", " gente"]
+    assert [(w.start, w.end) for w in result.words] == [(0.0, 0.4), (0.5, 1.0)]
+    assert result.words[0].probability == 0.9
+
+
+def test_model_identity_reflects_the_decoding_settings(proxy_module):
+    proxy = proxy_module.FasterWhisperProxy(
+        FasterWhisperTranscriptionConfig(model="small", beam_size=1)
+    )
+    quiet = proxy_module.FasterWhisperProxy(
+        FasterWhisperTranscriptionConfig(model="small", vad_filter=False)
+    )
+
+    assert proxy.model_identity == "faster-whisper:small:int8:beam1:vad500"
+    assert quiet.model_identity == "faster-whisper:small:int8:beam5:novad"
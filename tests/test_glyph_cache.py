@@ -0,0 +1,67 @@
+from pathlib import Path
+
+import numpy as np
+from moviepy import TextClip
+from moviepy.video.fx import CrossFadeIn, CrossFadeOut
+
+from src.entities.captions import CaptionSegment, Captions
+from src.entities.configs.services.captions import CaptionsConfig
+from src.entities.editor.captions_clip import CaptionsClip
+from src.entities.editor.glyph_cache import GlyphCache, get_glyph_cache
+
+FONT_BYTES = (Path(__file__).parent.parent / "default_font.ttf").read_bytes()
+
+
+def _captions(*words):
+    return Captions(
+        segments=[
+            CaptionSegment(start=i * 0.5, end=(i + 1) * 0.5, text=word)
+            for i, word in enumerate(words)
+        ]
+    )
+
+
+def test_repeated_words_are_rasterized_once_across_clips():
+    cache = get_glyph_cache()
+    cache.clear()
+    config = CaptionsConfig(font_size=20, stroke_width=2, marging=4)
+
+    CaptionsClip(_captions("the", "cat", "the"), config, FONT_BYTES).get_clips()
+    CaptionsClip(_captions("the", "end"), config, FONT_BYTES).get_clips(1.0)
+
+    assert cache.misses == 3
+    assert cache.hits == 2
+
+
+def test_lru_evicts_least_recently_used():
+    cache = GlyphCache(max_entries=2)
+    for key in ("a", "b", "a", "c"):
+        cache.get(key, lambda: key)
+
+    assert len(cache) == 2
+    assert cache.get("a", lambda: "miss") == "a"
+    assert cache.get("b", lambda: "miss") == "miss"
+
+
+def test_cached_word_matches_text_clip_with_fades():
+    config = CaptionsConfig(font_size=20, stroke_width=2, marging=4, fade_duration=0.2)
+    clip = CaptionsClip(_captions("Hello"), config, FONT_BYTES).get_clips()[0]
+
+    reference = TextClip(
+        text="Hello",
+        font=CaptionsClip(_captions(), config, FONT_BYTES).font_path,
+        font_size=20,
+        color=config.color,
+        stroke_color=config.stroke_color,
+        stroke_width=2,
+        text_align="center",
+        margin=(4, 4),
+    ).with_duration(0.5)
+    reference = CrossFadeIn(duration=0.2).apply(reference)
+    reference = CrossFadeOut(duration=0.2).apply(reference)
+
+    for t in (0.05, 0.25, 0.45):
+        np.testing.assert_array_equal(clip.get_frame(t), reference.get_frame(t))
+        np.testing.assert_allclose(
+            clip.mask.get_frame(t), reference.mask.get_frame(t), atol=1e-6
+        )
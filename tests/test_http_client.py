@@ -0,0 +1,102 @@
+import asyncio
+
+import aiohttp
+import pytest
+from aiohttp import web
+
+from src.entities.configs.proxies.http import HTTPClientConfig
+from src.proxies.http_client import AsyncHTTPClient
+
+
+@pytest.fixture
+async def server():
+    state = {"calls": 0, "peers": set(), "forms": []}
+
+    async def flaky(request):
+        state["calls"] += 1
+        state["peers"].add(request.transport.get_extra_info("peername"))
+        if state["calls"] < 3:
+            return web.Response(status=503, headers={"Retry-After": "0"})
+        return web.json_response({"calls": state["calls"]})
+
+    async def upload(request):
+        state["calls"] += 1
+        form = await request.post()
+        state["forms"].append(form["file"].file.read())
+        if state["calls"] < 2:
+            return web.Response(status=500)
+        return web.Response(text="ok")
+
+    async def missing(request):
+        state["calls"] += 1
+        return web.Response(status=404, text="nope")
+
+    app = web.Application()
+    app.router.add_get("/flaky", flaky)
+    app.router.add_post("/upload", upload)
+    app.router.add_get("/missing", missing)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", state
+    await runner.cleanup()
+
+
+def _client():
+    return AsyncHTTPClient(HTTPClientConfig(backoff_seconds=0.01, max_retries=3))
+
+
+@pytest.mark.asyncio
+async def test_transient_statuses_are_retried_on_one_pooled_connection(server):
+    url, state = server
+    client = _client()
+
+    response = await client.get(f"{url}/flaky")
+    await client.close()
+
+    assert response.ok
+    assert response.json() == {"calls": 3}
+    assert len(state["peers"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_form_bodies_are_rebuilt_for_each_attempt(server):
+    url, state = server
+    client = _client()
+
+    def form():
+        data = aiohttp.FormData()
+        data.add_field("file", b"audio", filename="audio.mp3")
+        return data
+
+    response = await client.post(f"{url}/upload", data=form)
+    await client.close()
+
+    assert response.text == "ok"
+    assert state["forms"] == [b"audio", b"audio"]
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_returned_without_retrying(server):
+    url, state = server
+    client = _client()
+
+    response = await client.get(f"{url}/missing")
+    await client.close()
+
+    assert response.status == 404
+    assert response.text == "nope"
+    assert state["calls"] == 1
+
+
+def test_session_from_a_finished_loop_is_closed_when_replaced():
+    client = AsyncHTTPClient()
+    first = asyncio.run(client._get_session())
+
+    second = asyncio.run(client._get_session())
+
+    assert first.closed
+    assert second is not first
+    asyncio.run(client.close())
@@ -0,0 +1,48 @@
+import numpy as np
+from moviepy import ColorClip, CompositeVideoClip
+
+from src.entities.editor.layer_compositor import LayerCompositeVideoClip
+from src.entities.editor.video_clip import VideoClip
+
+
+def _background():
+    return ColorClip((20, 30), color=(10, 20, 30), duration=10)
+
+
+def _words(count=200, duration=0.25):
+    return [
+        ColorClip((4, 4), color=(200, i % 255, 0))
+        .with_start(i * duration)
+        .with_duration(duration)
+        .with_position((8, 12))
+        for i in range(count)
+    ]
+
+
+def test_only_overlapping_layers_are_visited():
+    composite = LayerCompositeVideoClip([_background(), *_words()], use_bgclip=True)
+
+    visited = composite._index.candidates(3.1)
+    playing = composite.playing_clips(3.1)
+
+    assert len(visited) <= 5
+    assert len(playing) == 1
+    assert playing[0].start == 3.0
+
+
+def test_frames_match_nested_composite():
+    words = _words(40)
+    flat = VideoClip()
+    flat.clip = _background()
+    flat.add_layers(words[:20])
+    flat.add_layers(words[20:])
+
+    nested = _background()
+    nested = CompositeVideoClip([nested, *words[:20]])
+    nested = CompositeVideoClip([nested, *words[20:]])
+
+    assert isinstance(flat.clip, LayerCompositeVideoClip)
+    assert len(flat.clip.clips) == 40
+    assert flat.clip.duration == nested.duration == 10
+    for t in (0.1, 2.6, 7.3, 9.9):
+        np.testing.assert_array_equal(flat.clip.get_frame(t), nested.get_frame(t))
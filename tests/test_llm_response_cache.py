@@ -0,0 +1,125 @@
+from types import SimpleNamespace
+
+import pytest
+
+from src.entities.configs.proxies.llm import (
+    LLMCacheConfig,
+    LLMProviderConfig,
+    PromptLLMConfig,
+)
+from src.entities.language import Language
+from src.proxies import llm_prompt_proxy
+from src.proxies.llm_prompt_proxy import PromptLLMProxy
+
+EVALUATION = (
+    '{"resumo": "ok", "notas": {"retencao": {"nota": 80}, "qualidade": {"nota": 80},'
+    ' "viralizacao": {"nota": 80}, "adequacao_tiktok": {"nota": 80},'
+    ' "gancho": {"nota": 80}}}'
+)
+
+
+@pytest.fixture
+def llm_calls(monkeypatch):
+    calls = []
+    replies = []
+
+    async def acompletion(**kwargs):
+        calls.append(kwargs)
+        message = SimpleNamespace(content=replies.pop(0))
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=message, finish_reason="stop")]
+        )
+
+    monkeypatch.setattr(llm_prompt_proxy.litellm, "acompletion", acompletion)
+    return calls, replies
+
+
+def _proxy(tmp_path, temperature=0.7, **cache):
+    return PromptLLMProxy(
+        PromptLLMConfig(
+            provider_config=LLMProviderConfig(
+                provider="openai", model="gpt-4o-mini", temperature=temperature
+            ),
+            cache=LLMCacheConfig(path=str(tmp_path), **cache),
+        )
+    )
+
+
+async def _evaluate(proxy, title="Title"):
+    return await proxy.evaluate_story(
+        title=title, content="Content", target_language=Language.PORTUGUESE
+    )
+
+
+@pytest.mark.asyncio
+async def test_identical_requests_reuse_the_parsed_response(tmp_path, llm_calls):
+    calls, replies = llm_calls
+    replies.extend([EVALUATION, EVALUATION])
+
+    first = await _evaluate(_proxy(tmp_path))
+    again = await _evaluate(_proxy(tmp_path))
+    other_post = await _evaluate(_proxy(tmp_path), title="Other")
+
+    assert first == again == other_post
+    assert first["nota_geral"] == 80
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_temperature_is_part_of_the_fingerprint(tmp_path, llm_calls):
+    calls, replies = llm_calls
+    replies.extend([EVALUATION, EVALUATION])
+
+    await _evaluate(_proxy(tmp_path, temperature=0.7))
+    await _evaluate(_proxy(tmp_path, temperature=0.2))
+
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_unparseable_responses_are_not_cached(tmp_path, llm_calls):
+    calls, replies = llm_calls
+    replies.extend(["not json at all", EVALUATION])
+    proxy = _proxy(tmp_path)
+
+    with pytest.raises(RuntimeError):
+        await _evaluate(proxy)
+    result = await _evaluate(proxy)
+
+    assert result["nota_geral"] == 80
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_bypass_and_expired_ttl_call_the_llm(tmp_path, llm_calls):
+    calls, replies = llm_calls
+    replies.extend([EVALUATION, EVALUATION, EVALUATION])
+
+    await _evaluate(_proxy(tmp_path))
+    await _evaluate(_proxy(tmp_path, bypass=True))
+    await _evaluate(_proxy(tmp_path, ttl_hours={"evaluate_story": 0}))
+
+    assert len(calls) == 3
+
+
+@pytest.mark.asyncio
+async def test_regenerating_a_story_reaches_the_llm(tmp_path, llm_calls):
+    calls, replies = llm_calls
+    replies.extend(
+        [
+            '{"title": "A", "part1": "um", "part2": "dois"}',
+            '{"title": "B", "part1": "tres", "part2": "quatro"}',
+        ]
+    )
+    proxy = _proxy(tmp_path)
+
+    async def generate():
+        return await proxy.generate_two_part_story(
+            title="Title", content="Content", target_language=Language.PORTUGUESE
+        )
+
+    first = await generate()
+    regenerated = await generate()
+
+    assert (first["title"], regenerated["title"]) == ("A", "B")
+    assert len(calls) == 2
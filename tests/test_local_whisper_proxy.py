@@ -0,0 +1,99 @@
+import sys
+import types
+
+import numpy as np
+import pytest
+
+from src.entities.configs.proxies.transcription import LocalTranscriptionConfig
+from src.entities.language import Language
+
+
+class StubModel:
+    def __init__(self, name):
+        self.name = name
+        self.calls = []
+
+    def transcribe(self, audio, **kwargs):
+        self.calls.append(kwargs)
+        return {
+            "text": " Oi, gente",
+            "language": "pt",
+            "segments": [
+                {
+                    "words": [
+                        {"word": " Oi,", "start": 0.0, "end": 0.4, "probability": 0.9},
+                        {"word": " gente", "start": 0.5, "end": 1.3},
+                    ]
+                }
+            ],
+        }
+
+
+@pytest.fixture
+def proxy_module(monkeypatch):
+    stub = types.ModuleType("whisper")
+    stub.loaded = []
+
+    def load_model(name):
+        stub.loaded.append(name)
+        return StubModel(name)
+
+    stub.load_model = load_model
+    monkeypatch.setitem(sys.modules, "whisper", stub)
+    monkeypatch.delitem(sys.modules, "src.proxies.local_whisper_proxy", raising=False)
+    import src.proxies.local_whisper_proxy as module
+
+    registered = []
+    monkeypatch.setattr(module.atexit, "register", registered.append)
+    module.registered = registered
+    yield module
+    sys.modules.pop("src.proxies.local_whisper_proxy", None)
+
+
+def test_pool_starts_no_workers_until_used_and_closes_at_exit(proxy_module):
+    proxy = proxy_module.LocalWhisperProxy(LocalTranscriptionConfig(workers=2))
+
+    assert sys.modules["whisper"].loaded == []
+    assert proxy.pool._max_workers == 2
+    assert not proxy.pool._processes
+    assert proxy_module.registered == [proxy.close]
+
+    pool = proxy.pool
+    proxy.close()
+    assert proxy.pool is None
+    assert pool._shutdown_thread
+
+
+def test_preload_submits_one_warm_up_job_per_worker(proxy_module, monkeypatch):
+    submitted = []
+    monkeypatch.setattr(
+        proxy_module.ProcessPoolExecutor,
+        "submit",
+        lambda self, fn, *args: submitted.append(fn),
+    )
+
+    proxy = proxy_module.LocalWhisperProxy(
+        LocalTranscriptionConfig(workers=3, preload=True)
+    )
+
+    assert submitted == [proxy_module._worker_ready] * 3
+    proxy.close()
+
+
+def test_in_process_model_maps_and_clamps_words(proxy_module):
+    proxy = proxy_module.LocalWhisperProxy(LocalTranscriptionConfig(workers=0))
+    one_second = np.zeros(16000, dtype=np.float32)
+
+    result = proxy_module._transcribe_with_model(
+        proxy.model, one_second, Language.PORTUGUESE
+    )
+
+    assert proxy.pool is None
+    assert sys.modules["whisper"].loaded == ["base"]
+    assert proxy.model.calls == [{"word_timestamps": True, "language": "pt"}]
+    assert [(w.word, w.start, w.end) for w in result.words] == [
+        (" Oi,", 0.0, 0.4),
+        (" gente", 0.5, 1.0),
+    ]
+    assert result.words[1].probability is None
+    assert result.language == "pt"
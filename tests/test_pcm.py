@@ -0,0 +1,69 @@
+import subprocess
+
+import numpy as np
+import pytest
+from moviepy.config import FFMPEG_BINARY
+
+from src.entities.editor.audio_clip import AudioClip
+from src.entities.editor.pcm import SAMPLE_RATE, decode_pcm, pcm_duration
+
+
+@pytest.fixture(scope="module")
+def tone_audio():
+    return subprocess.run(
+        [
+            FFMPEG_BINARY,
+            "-loglevel",
+            "error",
+            "-f",
+            "lavfi",
+            "-i",
+            "sine=frequency=440:sample_rate=44100:duration=1.5",
+            "-ac",
+            "2",
+            "-c:a",
+            "pcm_s16le",
+            "-f",
+            "wav",
+            "pipe:1",
+        ],
+        check=True,
+        capture_output=True,
+    ).stdout
+
+
+def test_decodes_to_16khz_mono_float32(tone_audio):
+    samples = decode_pcm(tone_audio)
+
+    assert samples.dtype == np.float32
+    assert samples.ndim == 1
+    assert pcm_duration(samples) == pytest.approx(1.5, abs=1 / SAMPLE_RATE)
+    assert 0.05 < np.abs(samples).max() <= 1.0
+
+
+def test_same_bytes_are_decoded_once_into_a_read_only_buffer(tone_audio):
+    first = decode_pcm(tone_audio)
+
+    assert decode_pcm(tone_audio) is first
+    assert not first.flags.writeable
+    with pytest.raises(ValueError):
+        first[0] = 1.0
+
+
+def test_stereo_decode_has_one_column_per_channel(tone_audio):
+    samples = decode_pcm(tone_audio, 44100, channels=2, cache=False)
+
+    assert samples.shape == (int(1.5 * 44100), 2)
+    assert decode_pcm(tone_audio, 44100, channels=2, cache=False) is not samples
+
+
+def test_audio_clip_takes_duration_and_silence_from_the_decoded_buffer(tone_audio):
+    clip = AudioClip(bytes=tone_audio)
+
+    assert clip.clip.duration == pytest.approx(1.5, abs=1e-3)
+    clip.add_end_silence(1)
+
+    assert clip.samples.shape == (int(2.5 * 44100), 2)
+    assert clip.clip.duration == pytest.approx(2.5, abs=1e-3)
+    assert np.abs(clip.clip.get_frame(np.linspace(1.9, 2.4, 50))).max() == 0
+    assert np.abs(clip.clip.get_frame(np.linspace(0.9, 1.1, 50))).max() > 0.05
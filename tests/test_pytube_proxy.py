@@ -1,3 +1,5 @@
+import json
+
 from src.entities.configs.proxies.youtube import PyTubeYouTubeConfig
 from src.proxies import pytube_proxy
 from src.proxies.pytube_proxy import PyTubeProxy
@@ -51,3 +53,167 @@ def test_channel_extraction_can_list_shorts_only(monkeypatch):
         "short123abc",
         "short456def",
     ]
+
+
+def test_channel_listing_records_video_lengths(monkeypatch):
+    monkeypatch.setattr(pytube_proxy, "Channel", FakeChannel)
+    proxy = PyTubeProxy(PyTubeYouTubeConfig())
+    data = {
+        "contents": [
+            {
+                "videoRenderer": {
+                    "videoId": "abc123def45",
+                    "lengthText": {"simpleText": "1:02:03"},
+                }
+            },
+            {
+                "videoRenderer": {
+                    "videoId": "xyz987uvw65",
+                    "lengthText": {"runs": [{"text": "4:05"}]},
+                }
+            },
+        ]
+    }
+    monkeypatch.setattr(FakeChannel, "initial_data", data)
+
+    proxy._extract_video_ids("https://www.youtube.com/@FoodieBoyKR")
+
+    assert proxy._listing_durations == {"abc123def45": 3723.0, "xyz987uvw65": 245.0}
+
+
+def test_newest_only_reads_the_first_page_of_the_tab(monkeypatch):
+    class FirstPageChannel(FakeChannel):
+        @property
+        def video_urls(self):
+            raise AssertionError("full listing should not be scraped")
+
+    monkeypatch.setattr(pytube_proxy, "Channel", FirstPageChannel)
+    proxy = PyTubeProxy(PyTubeYouTubeConfig())
+
+    assert proxy._extract_video_ids(
+        "https://www.youtube.com/@FoodieBoyKR", newest_only=True
+    ) == ["abc123def45", "xyz987uvw65"]
+
+
+def test_videos_listing_records_lengths_of_every_page(monkeypatch):
+    pages = [
+        {"videoRenderer": {"videoId": "abc123def45", "lengthText": "12:00"}},
+        {"videoRenderer": {"videoId": "xyz987uvw65", "lengthText": "0:45"}},
+    ]
+
+    class PagedChannel(FakeChannel):
+        def _extract_videos(self, raw_json, context=None):
+            return [], None
+
+        @property
+        def video_urls(self):
+            urls = []
+            for page in pages:
+                self._extract_videos(json.dumps(page))
+                urls.append(f"/watch?v={page['videoRenderer']['videoId']}")
+            return urls
+
+    monkeypatch.setattr(pytube_proxy, "Channel", PagedChannel)
+    proxy = PyTubeProxy(PyTubeYouTubeConfig())
+
+    assert proxy._extract_video_ids("https://www.youtube.com/@FoodieBoyKR") == [
+        "abc123def45",
+        "xyz987uvw65",
+    ]
+    assert proxy._listing_durations == {"abc123def45": 720.0, "xyz987uvw65": 45.0}
+
+
+def _rich_video(video_id, length):
+    return {
+        "richItemRenderer": {
+            "content": {
+                "videoRenderer": {
+                    "videoId": video_id,
+                    "lengthText": {"simpleText": length},
+                }
+            }
+        }
+    }
+
+
+def test_real_channel_listing_records_lengths_of_continuation_pages(monkeypatch):
+    from pytubefix import request
+    from pytubefix.contrib import playlist
+
+    first_page = {
+        "contents": {
+            "twoColumnBrowseResultsRenderer": {
+                "tabs": [
+                    {
+                        "tabRenderer": {
+                            "endpoint": {
+                                "commandMetadata": {
+                                    "webCommandMetadata": {"url": "/@FoodieBoyKR/videos"}
+                                }
+                            },
+                            "content": {
+                                "richGridRenderer": {
+                                    "contents": [
+                                        _rich_video("abc123def45", "12:00"),
+                                        {
+                                            "continuationItemRenderer": {
+                                                "continuationEndpoint": {
+                                                    "continuationCommand": {
+                                                        "token": "next-page"
+                                                    }
+                                                }
+                                            }
+                                        },
+                                    ]
+                                }
+                            },
+                        }
+                    }
+                ]
+            }
+        },
+        "responseContext": {
+            "webResponseContextExtensionData": {"ytConfigData": {"visitorData": "v"}}
+        },
+    }
+    continuation_page = {
+        "onResponseReceivedActions": [
+            {
+                "appendContinuationItemsAction": {
+                    "continuationItems": [_rich_video("xyz987uvw65", "0:45")]
+                }
+            }
+        ]
+    }
+    browsed = []
+
+    class FakeInnerTube:
+        def __init__(self, client):
+            pass
+
+        def browse(self, continuation, visitor_data=None):
+            browsed.append(continuation)
+            return continuation_page
+
+    html = f"<script>var ytInitialData = {json.dumps(first_page)};</script>"
+    monkeypatch.setattr(request, "get", lambda url, *args, **kwargs: html)
+    monkeypatch.setattr(playlist, "InnerTube", FakeInnerTube)
+    proxy = PyTubeProxy(PyTubeYouTubeConfig())
+
+    assert proxy._extract_video_ids("https://www.youtube.com/@FoodieBoyKR") == [
+        "abc123def45",
+        "xyz987uvw65",
+    ]
+    assert browsed == ["next-page"]
+    assert proxy._listing_durations == {"abc123def45": 720.0, "xyz987uvw65": 45.0}
+
+
+def test_listing_without_page_hook_logs_and_keeps_listing(monkeypatch, caplog):
+    monkeypatch.setattr(pytube_proxy, "Channel", FakeChannel)
+    proxy = PyTubeProxy(PyTubeYouTubeConfig())
+
+    with caplog.at_level("WARNING", logger=pytube_proxy.__name__):
+        video_ids = proxy._extract_video_ids("https://www.youtube.com/@FoodieBoyKR")
+
+    assert video_ids == ["abc123def45", "xyz987uvw65"]
+    assert "_extract_videos changed" in caplog.text
@@ -0,0 +1,40 @@
+import asyncio
+import time
+
+import pytest
+
+from src.core.rate_limiter import AsyncRateLimiter, shared_rate_limiter
+
+
+@pytest.mark.asyncio
+async def test_concurrent_acquires_are_spaced_by_the_interval():
+    limiter = AsyncRateLimiter(per_minute=60 / 0.05)
+    times = []
+
+    async def call():
+        await limiter.acquire()
+        times.append(time.monotonic())
+
+    await asyncio.gather(*(call() for _ in range(4)))
+
+    gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+    assert all(gap >= 0.04 for gap in gaps)
+    assert times[-1] - times[0] < 0.5
+
+
+def test_limiters_are_shared_per_name():
+    assert shared_rate_limiter("llm:openai", 30) is shared_rate_limiter(
+        "llm:openai", 30
+    )
+    assert shared_rate_limiter("llm:openai", 30) is not shared_rate_limiter(
+        "llm:google", 30
+    )
+
+
+def test_clients_with_different_rates_share_the_strictest_limiter():
+    relaxed = shared_rate_limiter("llm:strictest-test", 60)
+    strict = shared_rate_limiter("llm:strictest-test", 20)
+
+    assert relaxed is strict
+    assert strict.interval == pytest.approx(3.0)
+    assert shared_rate_limiter("llm:strictest-test", 120).interval == pytest.approx(3.0)
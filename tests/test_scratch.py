@@ -0,0 +1,99 @@
+import os
+import tempfile
+
+import pytest
+
+from src.entities.configs.services.video import ScratchConfig
+from src.entities.editor.image_clip import ImageClip
+from src.entities.editor.scratch import (
+    ScratchQuotaExceeded,
+    ScratchSpace,
+    current_scratch,
+)
+
+
+def test_identical_inputs_are_stored_once(tmp_path):
+    with ScratchSpace(root=str(tmp_path)) as scratch:
+        first = scratch.write_bytes(b"font", name="caption_font.ttf")
+        second = scratch.write_bytes(b"font", name="caption_font.ttf")
+        other = scratch.write_bytes(b"cover", ".png")
+
+        assert first == second
+        assert os.path.basename(first) == "caption_font.ttf"
+        assert other.endswith(".png")
+        assert scratch.deduplicated == 1
+        assert scratch.used_bytes == len(b"font") + len(b"cover")
+
+
+def test_write_past_quota_is_refused(tmp_path):
+    with ScratchSpace(root=str(tmp_path), quota_bytes=8) as scratch:
+        scratch.write_bytes(b"12345")
+        scratch.write_bytes(b"12345")  # deduplicated, costs nothing
+
+        with pytest.raises(ScratchQuotaExceeded):
+            scratch.write_bytes(b"67890")
+
+
+def test_space_without_quota_stays_off_tmpfs(tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+    scratch = ScratchSpace()
+
+    assert os.path.dirname(scratch.path) == str(tmp_path)
+    scratch.cleanup()
+
+
+def test_clips_write_into_the_active_job_and_are_removed_with_it(tmp_path):
+    cover = os.path.join(os.path.dirname(__file__), "..", "assets", "call_to_action.png")
+    with open(cover, "rb") as f:
+        data = f.read()
+
+    with ScratchSpace(root=str(tmp_path)) as scratch:
+        assert current_scratch() is scratch
+        first = ImageClip(bytes=data)
+        second = ImageClip(bytes=data)
+        assert first.file_path == second.file_path
+        assert os.path.dirname(first.file_path) == scratch.path
+
+    assert current_scratch() is not scratch
+    assert not os.path.exists(scratch.path)
+
+
+def test_activate_keeps_files_until_cleanup(tmp_path):
+    scratch = ScratchSpace(root=str(tmp_path))
+
+    with scratch.activate():
+        path = current_scratch().write_bytes(b"narration", ".mp3")
+    assert os.path.exists(path)
+
+    scratch.cleanup()
+    assert not os.path.exists(path)
+
+
+
+def test_released_files_are_removed_once_no_writer_uses_them(tmp_path):
+    with ScratchSpace(root=str(tmp_path)) as scratch:
+        path = scratch.write_bytes(b"background", ".mp4")
+        assert scratch.write_bytes(b"background", ".mp4") == path
+
+        scratch.release(path)
+        assert os.path.exists(path)
+
+        scratch.release(path)
+        assert not os.path.exists(path)
+        assert scratch.used_bytes == 0
+        assert scratch.write_bytes(b"background", ".mp4") == path
+
+
+def test_scratch_space_from_config_uses_root_and_quota(tmp_path):
+    config = ScratchConfig(root=str(tmp_path / "jobs"), quota_mb=1)
+
+    with ScratchSpace.from_config(config) as scratch:
+        assert os.path.dirname(scratch.path) == str(tmp_path / "jobs")
+        assert scratch.quota_bytes == 1024 * 1024
+        with pytest.raises(ScratchQuotaExceeded):
+            scratch.write_bytes(b"x" * (1024 * 1024 + 1))
+
+    unlimited = ScratchSpace.from_config(ScratchConfig(root=str(tmp_path), quota_mb=0))
+    assert unlimited.quota_bytes is None
+    unlimited.cleanup()